@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Rheo Generator Benchmark
+Template metodlarının, vektörel çekirdeği olan template'lerin generate_batch()
+yolunun, generator'ların generate() çağrısının ve serileştirme yollarının
+(to_dict, save_to_json, write_ndjson, write_columnar, write_shards) hızını ve
+bellek maliyetini ölçer. batch suite'i NumPy kurulu değilse atlanır.
+
+Kullanım:
+    python benchmark.py                                   # 1k, 100k, 1M
+    python benchmark.py --scales 1k,100k --suite generate,serialize
+    python benchmark.py --filter loops --scales 10k
+    python benchmark.py --baseline output/benchmarks/0796c58.json
+    python benchmark.py --compare output/benchmarks/0796c58.json output/benchmarks/d295646.json
+
+Her ölçüm ayrı bir alt süreçte çalışır; böylece tepe RSS (ru_maxrss) yalnızca
+o ölçüme aittir ve önceki ölçümlerin bıraktığı heap sonucu etkilemez.
+- seconds / per_sec: tracemalloc kapalıyken ölçülen süre ve soru/sn
+- peak_rss_mb / rss_delta_mb: sürecin tepe RSS'i ve ölçüm öncesine göre artışı
+  (serileştirmede girdi bankası ölçüm öncesinde üretilir, artışa dahil değildir)
+- alloc_*: ayrı bir geçişte, en fazla --alloc-sample öğe üzerinde tracemalloc
+  ile ölçülür (tracemalloc süreyi birkaç kat yavaşlatır). peak = Python
+  heap'inin tepe büyüklüğü, blocks = ölçüm sonunda hâlâ yaşayan blok sayısı.
+
+Sonuçlar output/benchmarks/<commit>.json dosyasına yazılır. --baseline veya
+--compare, eşleşen ölçümleri karşılaştırır ve soru/sn --threshold'dan fazla
+düşmüşse 1 ile çıkar.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, List, NamedTuple, Optional, Tuple
+
+from generator import QuestionIdFactory, generator_names, load_generator
+from profiling import current_rss_mb, peak_rss_mb
+
+RESULTS_VERSION = 1
+SUITES = ('templates', 'batch', 'generate', 'serialize')
+SERIALIZERS = ('to_dict', 'save_to_json', 'write_ndjson', 'write_columnar', 'write_shards')
+DEFAULT_SCALES = '1k,100k,1M'
+DEFAULT_ALLOC_SAMPLE = 10_000
+DEFAULT_THRESHOLD = 0.10
+
+_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def log(*args) -> None:
+    """İlerleme ve tablolar stderr'e yazılır."""
+    print(*args, file=sys.stderr)
+
+
+class Case(NamedTuple):
+    suite: str      # templates | batch | generate | serialize
+    name: str       # "<görev>.<template>", "<görev>.generate" veya serileştirici adı
+    scale: int
+
+
+def parse_scale(text: str) -> int:
+    """'1k' -> 1000, '1M' -> 1000000, '2500' -> 2500."""
+    text = text.strip().lower().replace('_', '')
+    factor = _SUFFIXES.get(text[-1:], 1)
+    digits = text[:-1] if factor > 1 else text
+    try:
+        value = int(float(digits) * factor)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz ölçek: {text!r}")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"Ölçek pozitif olmalı: {text!r}")
+    return value
+
+
+def format_scale(value: int) -> str:
+    for suffix, factor in (('M', 1_000_000), ('k', 1_000)):
+        if value >= factor and value % factor == 0:
+            return f"{value // factor}{suffix}"
+    return str(value)
+
+
+def plan_cases(suites: List[str], scales: List[int], name_filter: Optional[str] = None) -> List[Case]:
+    """Seçilen suite'lerin ölçümleri: ölçek dışta, böylece küçük ölçekler önce biter."""
+    from generator.batch import batch_kernels, numpy_module
+    from generator.templates import template_methods
+
+    names: List[Tuple[str, str]] = []
+    if 'templates' in suites:
+        for _, task in generator_names():
+            names += [('templates', f"{task}.{method}")
+                      for method, _ in template_methods(load_generator(task))]
+    if 'batch' in suites and numpy_module() is not None:
+        for _, task in generator_names():
+            names += [('batch', f"{task}.{method}") for method in batch_kernels(load_generator(task))]
+    if 'generate' in suites:
+        names += [('generate', f"{task}.generate") for _, task in generator_names()]
+    if 'serialize' in suites:
+        names += [('serialize', name) for name in SERIALIZERS]
+
+    return [
+        Case(suite, name, scale)
+        for scale in scales
+        for suite, name in names
+        if name_filter is None or name_filter in name
+    ]
+
+
+def make_generator(task: str, seed: int):
+    rng = random.Random(f"bench:{seed}:{task}")
+    return load_generator(task)(rng=rng, ids=QuestionIdFactory(f"bench{seed}"))
+
+
+def sample_bank(count: int, seed: int) -> list:
+    """Serileştirme girdisi: tüm generator'lardan eşit paylı, karışık sorular."""
+    tasks = [task for _, task in generator_names()]
+    share, extra = divmod(count, len(tasks))
+    questions = []
+    for i, task in enumerate(tasks):
+        n = share + (1 if i < extra else 0)
+        questions += make_generator(task, seed).generate(n, include_hard=True)
+    return questions
+
+
+def _serializer(name: str, work: Path) -> Callable[[list], object]:
+    """Soru listesini (to_dict için Question, diğerleri için dict) işleyen çağrı."""
+    if name == 'to_dict':
+        return lambda questions: [q.to_dict() for q in questions]
+    if name == 'save_to_json':
+        from main import save_to_json
+        return lambda questions: save_to_json(questions, work / 'bank.json')
+    if name == 'write_ndjson':
+        from main import write_ndjson
+
+        def run(questions):
+            with open(work / 'bank.ndjson', 'w', encoding='utf-8') as f:
+                return write_ndjson(questions, f)
+        return run
+    if name == 'write_columnar':
+        from columnar import write_columnar
+
+        def run(questions):
+            with open(work / 'bank.rqb', 'wb') as f:
+                return write_columnar(questions, f)
+        return run
+    if name == 'write_shards':
+        from shards import write_shards
+        return lambda questions: write_shards(questions, work / 'shards', 'json')
+    raise KeyError(f"Bilinmeyen serileştirici: {name}")
+
+
+def _workload(case: Case, seed: int, work: Path) -> Callable[[int], Callable[[], object]]:
+    """
+    Ölçek -> ölçülecek çağrı. Girdi hazırlığı (generator kurulumu, serileştirme
+    için banka üretimi) dönen çağrının dışında, ölçüm öncesinde yapılır.
+    """
+    if case.suite == 'templates':
+        task, method = case.name.split('.', 1)
+
+        def prepare(n):
+            func = getattr(make_generator(task, seed), method)
+            return lambda: [func() for _ in range(n)]
+        return prepare
+
+    if case.suite == 'batch':
+        task, method = case.name.split('.', 1)
+
+        def prepare(n):
+            gen = make_generator(task, seed)
+            return lambda: gen.generate_batch(method, n)
+        return prepare
+
+    if case.suite == 'generate':
+        task = case.name.rsplit('.', 1)[0]
+
+        def prepare(n):
+            gen = make_generator(task, seed)
+            return lambda: gen.generate(n, include_hard=True)
+        return prepare
+
+    serialize = _serializer(case.name, work)
+
+    def prepare(n):
+        questions = sample_bank(n, seed)
+        if case.name != 'to_dict':
+            questions = [q.to_dict() for q in questions]
+        return lambda: serialize(questions)
+    return prepare
+
+
+def run_case(case: Case, seed: int, alloc_sample: int) -> dict:
+    """Tek ölçüm; taze bir alt süreçte çalışır."""
+    import tracemalloc
+
+    with tempfile.TemporaryDirectory(prefix='rheo_bench_') as tmp:
+        prepare = _workload(case, seed, Path(tmp))
+
+        call = prepare(case.scale)
+        rss_before = current_rss_mb()
+        started = time.perf_counter()
+        call()
+        seconds = time.perf_counter() - started
+        peak = peak_rss_mb()
+        del call
+
+        # Bellek ayırma geçişi: tracemalloc süreyi bozduğu için ayrı ve örneklemli
+        sample = min(case.scale, alloc_sample)
+        call = prepare(sample)
+        tracemalloc.start()
+        blocks_before = sys.getallocatedblocks()
+        result = call()
+        blocks = sys.getallocatedblocks() - blocks_before
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result, call
+
+    return {
+        'suite': case.suite,
+        'name': case.name,
+        'scale': case.scale,
+        'seconds': round(seconds, 6),
+        'per_sec': round(case.scale / seconds, 1) if seconds else None,
+        'peak_rss_mb': round(peak, 1) if peak is not None else None,
+        'rss_delta_mb': round(peak - rss_before, 1) if peak is not None and rss_before is not None else None,
+        'alloc_sample': sample,
+        'alloc_peak_bytes': traced_peak,
+        'alloc_bytes_per_item': round(traced_peak / sample, 1),
+        'alloc_blocks_per_item': round(blocks / sample, 2),
+    }
+
+
+def iter_results(cases: List[Case], seed: int, alloc_sample: int) -> Iterator[dict]:
+    """Her ölçüm için yeni bir süreç (maxtasksperchild=1)."""
+    method = 'fork' if 'fork' in multiprocessing.get_all_start_methods() else 'spawn'
+    context = multiprocessing.get_context(method)
+    for case in cases:
+        with context.Pool(processes=1, maxtasksperchild=1) as pool:
+            yield pool.apply(run_case, (case, seed, alloc_sample))
+
+
+def git_commit() -> Optional[str]:
+    try:
+        proc = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return proc.stdout.strip() or None
+
+
+def run_metadata(seed: int, scales: List[int], alloc_sample: int) -> dict:
+    from main import generator_version
+    return {
+        'version': RESULTS_VERSION,
+        'commit': git_commit(),
+        'generator_version': generator_version(),
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'scales': scales,
+        'alloc_sample': alloc_sample,
+    }
+
+
+def print_row(result: dict) -> None:
+    rss = f"{result['peak_rss_mb']:8.1f}" if result['peak_rss_mb'] is not None else '       -'
+    log(f"   {result['suite']:<9} {result['name']:<40} {format_scale(result['scale']):>5} "
+        f"{result['seconds']:9.3f} sn {result['per_sec']:>12,.0f} /sn {rss} MB "
+        f"{result['alloc_bytes_per_item']:>9,.0f} B/öğe")
+
+
+def _key(result: dict) -> Tuple[str, str, int]:
+    return (result['suite'], result['name'], result['scale'])
+
+
+def compare_results(base: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> int:
+    """Eşleşen ölçümleri karşılaştırır; gerileme sayısını döner."""
+    previous = {_key(r): r for r in base['results']}
+    log(f"\n📈 Karşılaştırma: {base.get('commit') or '?'} -> {current.get('commit') or '?'} "
+        f"(eşik %{threshold * 100:.0f})")
+    regressions = 0
+    matched = 0
+    for result in current['results']:
+        old = previous.get(_key(result))
+        if old is None or not old.get('per_sec') or not result.get('per_sec'):
+            continue
+        matched += 1
+        ratio = result['per_sec'] / old['per_sec']
+        mark = '  '
+        if ratio < 1 - threshold:
+            mark = '❌'
+            regressions += 1
+        elif ratio > 1 + threshold:
+            mark = '✅'
+        rss = ''
+        if old.get('peak_rss_mb') and result.get('peak_rss_mb'):
+            rss = f", RSS {old['peak_rss_mb']:.0f} -> {result['peak_rss_mb']:.0f} MB"
+        log(f"{mark} {result['suite']:<9} {result['name']:<40} {format_scale(result['scale']):>5} "
+            f"x{ratio:5.2f} ({old['per_sec']:,.0f} -> {result['per_sec']:,.0f} /sn{rss})")
+    log(f"   {matched} ölçüm eşleşti, {regressions} gerileme")
+    return regressions
+
+
+def load_results(path: Path) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Rheo generator ve serileştirme benchmark\'ı')
+    parser.add_argument(
+        '--scales',
+        type=lambda text: [parse_scale(s) for s in text.split(',') if s.strip()],
+        default=DEFAULT_SCALES,
+        help=f'Ölçekler, virgülle (default: {DEFAULT_SCALES})'
+    )
+    parser.add_argument(
+        '--suite',
+        type=str,
+        default=','.join(SUITES),
+        help=f"Çalıştırılacak suite'ler (default: {','.join(SUITES)})"
+    )
+    parser.add_argument(
+        '--filter',
+        type=str,
+        default=None,
+        help='Yalnızca adı bu metni içeren ölçümler (ör. loops, java.generate, save_to_json)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Generator RNG seed\'i (default: 0)'
+    )
+    parser.add_argument(
+        '--alloc-sample',
+        type=parse_scale,
+        default=DEFAULT_ALLOC_SAMPLE,
+        help=f'tracemalloc geçişinin en fazla öğe sayısı (default: {format_scale(DEFAULT_ALLOC_SAMPLE)})'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=None,
+        help='Sonuç dosyası (default: output/benchmarks/<commit>.json)'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=Path,
+        default=None,
+        help='Çalıştırmadan sonra bu sonuç dosyasıyla karşılaştır'
+    )
+    parser.add_argument(
+        '--compare',
+        type=Path,
+        nargs=2,
+        metavar=('OLD', 'NEW'),
+        default=None,
+        help='Ölçüm yapmadan iki sonuç dosyasını karşılaştır'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Gerileme sayılan soru/sn düşüşü, oran (default: 0.10)'
+    )
+    args = parser.parse_args()
+
+    if args.compare is not None:
+        old, new = (load_results(path) for path in args.compare)
+        sys.exit(1 if compare_results(old, new, args.threshold) else 0)
+
+    suites = [s for s in args.suite.split(',') if s]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"Bilinmeyen suite: {', '.join(sorted(unknown))} (seçenekler: {', '.join(SUITES)})")
+
+    cases = plan_cases(suites, args.scales, args.filter)
+    if not cases:
+        parser.error('Seçilen suite/filtre ile eşleşen ölçüm yok')
+
+    run = run_metadata(args.seed, args.scales, args.alloc_sample)
+    output_path = args.output or (Path(__file__).parent / 'output' / 'benchmarks'
+                                  / f"{run['commit'] or run['generator_version']}.json")
+    log(f"⏱️  {len(cases)} ölçüm, ölçekler: {', '.join(map(format_scale, args.scales))}")
+
+    results = []
+    started = time.perf_counter()
+    for result in iter_results(cases, args.seed, args.alloc_sample):
+        print_row(result)
+        results.append(result)
+    run['results'] = results
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(run, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    log(f"\n✅ {len(results)} ölçüm {time.perf_counter() - started:.1f} sn'de tamamlandı: {output_path}")
+
+    if args.baseline is not None:
+        sys.exit(1 if compare_results(load_results(args.baseline), run, args.threshold) else 0)
+
+
+if __name__ == '__main__':
+    main()
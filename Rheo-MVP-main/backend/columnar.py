@@ -0,0 +1,284 @@
+"""
+Rheo Columnar Question Bank (RQB1)
+
+İstemcilerin (Flutter / web) tüm bankayı parse etmeden yalnızca ihtiyaç
+duydukları (dil, topic, zorluk) dilimini okuyabilmesi için kompakt format.
+
+Dosya düzeni:
+    magic            4 byte   b"RQB1"
+    header_length    4 byte   uint32, little-endian
+    header           UTF-8 JSON
+    body             dilimler art arda
+
+Header:
+    {
+      "version": 2,
+      "count": <toplam soru>,
+      "fields": [{"name": "id", "type": "str"}, ...],   # type: str | int | bool | float | list | json
+      "strings": ["Bu kodun çıktısı nedir?", ...],      # tekrar eden değerler
+      "slices": [
+        {"language": "python", "topic": "loops", "difficulty": 1,
+         "count": 120, "offset": 0, "length": 5312,
+         "columns": [0, 380, ...]}                       # dilim içi kolon başlangıçları
+      ]
+    }
+
+Dilimler (language, topic, difficulty) sırasıyla dizilir; offset/length
+body başına göredir. Dilim içinde veri kolon kolon yazılır: önce tüm
+id'ler, sonra tüm type'lar, ... Her değer:
+    int   1 byte (0 = null, 1 = değer var) + değer varsa varint
+    bool  varint: 0 = null, 1 = false, 2 = true
+    float 1 byte (0 = null, 1 = değer var) + değer varsa 8 byte little-endian double
+    str   varint tag: 0 = null, tek = strings[tag >> 1],
+          çift = satır içi UTF-8, byte uzunluğu (tag >> 1) - 1
+    list  varint eleman sayısı + her eleman için str kodlaması
+          (yalnızca elemanlarının hepsi string olan listeler)
+    json  değerin JSON metni, str kodlamasıyla (string tablosuna girer);
+          dict'ler, string dışı elemanlı listeler ve tipi satırdan satıra
+          değişen alanlar (ör. elle yazılmış bankalarda dict correct_answer)
+"""
+
+import json
+import struct
+from collections import Counter
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"RQB1"
+VERSION = 2  # 2: int kolonlarında varlık byte'ı (1'de null int 0 okunuyordu)
+SLICE_KEYS = ('language', 'topic', 'difficulty')
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(buf: bytes, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _value_kind(name: str, value) -> str:
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int' if value >= 0 else 'json'  # varint yalnızca negatif olmayan sayılar için
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, str):
+        return 'str'
+    if isinstance(value, list) and all(isinstance(item, str) for item in value):
+        return 'list'
+    if isinstance(value, (list, dict)):
+        return 'json'
+    raise ValueError(f"'{name}' alanı RQB1'de saklanamaz: {type(value).__name__}")
+
+
+def _to_json(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _field_types(questions: List[dict]) -> List[Dict[str, str]]:
+    """
+    Alanları ilk görülme sırasıyla toplar ve tiplerini belirler. Satırdan
+    satıra tipi değişen alanlar json olarak saklanır (tipler korunur).
+    """
+    names: Dict[str, str] = {}
+    for q in questions:
+        for name, value in q.items():
+            if value is None:
+                names.setdefault(name, None)
+                continue
+            kind = _value_kind(name, value)
+            if names.get(name) not in (None, kind):
+                kind = 'json'
+            names[name] = kind
+    return [{'name': name, 'type': kind or 'str'} for name, kind in names.items()]
+
+
+def _string_table(questions: List[dict], fields: List[Dict[str, str]]) -> List[str]:
+    """Birden fazla kez geçen string değerleri, sıklığa göre (küçük varint için)."""
+    counts = Counter()
+    for q in questions:
+        for field in fields:
+            value = q.get(field['name'])
+            if value is None:
+                continue
+            if field['type'] == 'str':
+                counts[value] += 1
+            elif field['type'] == 'json':
+                counts[_to_json(value)] += 1
+            elif field['type'] == 'list':
+                counts.update(str(item) for item in value)
+    return [value for value, n in counts.most_common() if n > 1]
+
+
+def _slice_key(q: dict) -> tuple:
+    return (q.get('language', 'python'), q.get('topic', ''), q.get('difficulty', 0))
+
+
+def write_columnar(questions: Iterable[dict], output: BinaryIO) -> int:
+    """Soruları RQB1 formatında yazar. Yazılan soru sayısını döner."""
+    questions = list(questions)
+    fields = _field_types(questions)
+    strings = _string_table(questions, fields)
+    string_ids = {value: i for i, value in enumerate(strings)}
+
+    def put_str(out: bytearray, value: Optional[str]) -> None:
+        if value is None:
+            out.append(0)
+        elif value in string_ids:
+            _write_varint(out, (string_ids[value] << 1) | 1)
+        else:
+            data = value.encode('utf-8')
+            _write_varint(out, (len(data) + 1) << 1)
+            out += data
+
+    groups: Dict[tuple, List[dict]] = {}
+    for q in questions:
+        groups.setdefault(_slice_key(q), []).append(q)
+
+    body = bytearray()
+    slices = []
+    for key in sorted(groups):
+        rows = groups[key]
+        start = len(body)
+        columns = []
+        for field in fields:
+            columns.append(len(body) - start)
+            name, kind = field['name'], field['type']
+            for q in rows:
+                value = q.get(name)
+                if kind == 'int':
+                    if value is None:
+                        body.append(0)
+                    else:
+                        body.append(1)
+                        _write_varint(body, value)
+                elif kind == 'bool':
+                    body.append(0 if value is None else 1 + bool(value))
+                elif kind == 'float':
+                    if value is None:
+                        body.append(0)
+                    else:
+                        body.append(1)
+                        body += struct.pack('<d', value)
+                elif kind == 'json':
+                    put_str(body, None if value is None else _to_json(value))
+                elif kind == 'list':
+                    items = value or []
+                    _write_varint(body, len(items))
+                    for item in items:
+                        put_str(body, str(item))
+                else:
+                    put_str(body, value)
+        slices.append({
+            **dict(zip(SLICE_KEYS, key)),
+            'count': len(rows),
+            'offset': start,
+            'length': len(body) - start,
+            'columns': columns,
+        })
+
+    header = json.dumps({
+        'version': VERSION,
+        'count': len(questions),
+        'fields': fields,
+        'strings': strings,
+        'slices': slices,
+    }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    output.write(MAGIC)
+    output.write(struct.pack('<I', len(header)))
+    output.write(header)
+    output.write(body)
+    return len(questions)
+
+
+def read_header(source: BinaryIO) -> Tuple[dict, int]:
+    """Header'ı okur; (header, body başlangıç offset'i) döner."""
+    if source.read(4) != MAGIC:
+        raise ValueError("RQB1 dosyası değil")
+    (length,) = struct.unpack('<I', source.read(4))
+    header = json.loads(source.read(length).decode('utf-8'))
+    if header.get('version') != VERSION:
+        raise ValueError(f"Desteklenmeyen RQB sürümü: {header.get('version')}")
+    return header, 8 + length
+
+
+def _decode_slice(data: bytes, count: int, fields: List[Dict[str, str]], strings: List[str]) -> List[dict]:
+    rows = [{} for _ in range(count)]
+    pos = 0
+
+    def get_str(pos: int) -> Tuple[Optional[str], int]:
+        tag, pos = _read_varint(data, pos)
+        if tag == 0:
+            return None, pos
+        if tag & 1:
+            return strings[tag >> 1], pos
+        end = pos + (tag >> 1) - 1
+        return data[pos:end].decode('utf-8'), end
+
+    for field in fields:
+        name, kind = field['name'], field['type']
+        for row in rows:
+            if kind == 'int':
+                present = data[pos]
+                pos += 1
+                value = None
+                if present:
+                    value, pos = _read_varint(data, pos)
+            elif kind == 'bool':
+                tag = data[pos]
+                pos += 1
+                value = None if tag == 0 else tag == 2
+            elif kind == 'float':
+                present = data[pos]
+                pos += 1
+                value = None
+                if present:
+                    (value,) = struct.unpack_from('<d', data, pos)
+                    pos += 8
+            elif kind == 'json':
+                text, pos = get_str(pos)
+                value = None if text is None else json.loads(text)
+            elif kind == 'list':
+                n, pos = _read_varint(data, pos)
+                value = []
+                for _ in range(n):
+                    item, pos = get_str(pos)
+                    value.append(item)
+            else:
+                value, pos = get_str(pos)
+            if value is not None:
+                row[name] = value
+    return rows
+
+
+def read_columnar(path: Path, language: Optional[str] = None, topic: Optional[str] = None,
+                  difficulty: Optional[int] = None) -> List[dict]:
+    """
+    Filtreye uyan dilimleri okur. Yalnızca eşleşen dilimlerin byte'ları
+    diskten okunur; bankanın geri kalanı parse edilmez.
+    """
+    wanted = {'language': language, 'topic': topic, 'difficulty': difficulty}
+    questions = []
+    with open(path, 'rb') as f:
+        header, body_start = read_header(f)
+        for entry in header['slices']:
+            if any(value is not None and entry[key] != value for key, value in wanted.items()):
+                continue
+            f.seek(body_start + entry['offset'])
+            data = f.read(entry['length'])
+            questions.extend(_decode_slice(data, entry['count'], header['fields'], header['strings']))
+    return questions
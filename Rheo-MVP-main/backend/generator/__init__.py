@@ -1,14 +1,85 @@
 # Rheo Question Generators
-from .variable_gen import VariableGenerator
-from .if_else_gen import IfElseGenerator
-from .loop_gen import LoopGenerator
-from .java_gen import JavaGenerator
-from .javascript_gen import JavaScriptGenerator
+# Alt modüller ilk erişimde yüklenir (PEP 562); `from generator import JavaGenerator`
+# yalnızca java_gen'i import eder.
+import importlib
+
+_EXPORTS = {
+    'Question': '.question',
+    'PREDICTION_TEXT': '.question',
+    'VariableGenerator': '.variable_gen',
+    'IfElseGenerator': '.if_else_gen',
+    'LoopGenerator': '.loop_gen',
+    'JavaGenerator': '.java_gen',
+    'JavaScriptGenerator': '.javascript_gen',
+    'QuestionIdFactory': '.ids',
+    'make_namespace': '.ids',
+    'FingerprintIndex': '.dedupe',
+    'TemplateSpaceExhausted': '.dedupe',
+    'filter_unique': '.dedupe',
+    'fingerprint': '.dedupe',
+    'take_unique': '.dedupe',
+    'ProductSpace': '.space',
+    'TemplateSpace': '.space',
+    'params': '.space',
+    'AliasTable': '.templates',
+    'TemplateGenerator': '.templates',
+    'TemplateMeta': '.templates',
+    'TemplateQuery': '.templates',
+    'catalog': '.templates',
+    'template': '.templates',
+    'generate_batch': '.batch',
+    'vectorized': '.batch',
+    'Snippet': '.snippets',
+    'SnippetShape': '.snippets',
+    'discover_plugins': '.registry',
+    'generator_names': '.registry',
+    'load_generator': '.registry',
+    'plugin_names': '.registry',
+}
 
 __all__ = [
-    'VariableGenerator', 
-    'IfElseGenerator', 
+    'Question',
+    'PREDICTION_TEXT',
+    'VariableGenerator',
+    'IfElseGenerator',
     'LoopGenerator',
     'JavaGenerator',
-    'JavaScriptGenerator'
+    'JavaScriptGenerator',
+    'QuestionIdFactory',
+    'make_namespace',
+    'FingerprintIndex',
+    'TemplateSpaceExhausted',
+    'filter_unique',
+    'fingerprint',
+    'take_unique',
+    'ProductSpace',
+    'TemplateSpace',
+    'params',
+    'AliasTable',
+    'TemplateGenerator',
+    'TemplateMeta',
+    'TemplateQuery',
+    'catalog',
+    'template',
+    'generate_batch',
+    'vectorized',
+    'Snippet',
+    'SnippetShape',
+    'discover_plugins',
+    'generator_names',
+    'load_generator',
+    'plugin_names'
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,164 @@
+"""
+Batch Generation
+generate_batch(gen, template, n): aynı template'ten n soru üretir.
+
+NumPy kuruluysa ve template için @vectorized çekirdek kayıtlıysa:
+- tüm parametreler @params domain'lerinden tek seferde dizi olarak çekilir
+- cevaplar ve yanlış şıklar vektör işlemleriyle hesaplanır
+- metinler (kod, şıklar, açıklama) yalnızca en sonda biçimlenir
+Aksi halde template n kez çağrılır. Çekirdekler skaler template ile aynı
+kuralları uygular; yalnızca rastgele akış farklıdır (NumPy Generator'ı,
+generator'ın RNG'sinden seed alır, yani seed'li üretim yine tekrarlanabilir).
+
+    @vectorized('generate_sum_loop')
+    def _sum_loop_batch(self, batch: Batch) -> List[Question]: ...
+
+NumPy ilk kullanımda import edilir; kurulu değilse generator'lar aynen çalışır.
+"""
+
+import gc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from .distractors import WRONG_COUNT, neighbours
+from .question import Question
+
+_numpy = None
+
+
+def numpy_module():
+    """NumPy modülü; kurulu değilse None (sonuç önbelleğe alınır)."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+class Batch(NamedTuple):
+    """
+    Çekirdeğe verilen çekiliş. params: range domain'leri için değer dizisi,
+    diğer domain'ler (isimler, operatör tuple'ları) için indeks dizisi.
+    """
+    np: Any
+    rng: Any                       # numpy.random.Generator
+    n: int
+    params: Dict[str, Any]
+    domain: Dict[str, Sequence]
+
+    def take(self, name: str) -> list:
+        """İndeks dizisiyle çekilmiş parametrenin domain değerleri (Python listesi)."""
+        values = self.domain[name]
+        return [values[i] for i in self.params[name].tolist()]
+
+
+def vectorized(template_name: str) -> Callable:
+    """Metodu, aynı sınıftaki `template_name` template'inin batch çekirdeği olarak işaretler."""
+    def decorate(func: Callable) -> Callable:
+        func.vectorizes = template_name
+        return func
+    return decorate
+
+
+def batch_kernels(cls: type) -> Dict[str, str]:
+    """template adı -> çekirdek metod adı (sınıf başına önbelleğe alınır)."""
+    cached = cls.__dict__.get('_batch_kernels')
+    if cached is None:
+        cached = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                target = getattr(value, 'vectorizes', None)
+                if target is not None:
+                    cached[target] = name
+        cls._batch_kernels = cached
+    return cached
+
+
+def draw_params(np, rng, domain: Dict[str, Sequence], n: int) -> Dict[str, Any]:
+    """Her parametre için domain'den n tekdüze çekiliş."""
+    drawn = {}
+    for name, values in domain.items():
+        if isinstance(values, range):
+            drawn[name] = np.arange(values.start, values.stop, values.step)[rng.integers(0, len(values), n)]
+        else:
+            drawn[name] = rng.integers(0, len(values), n)
+    return drawn
+
+
+def generate_batch(gen, template: Union[str, Callable[..., Question]], n: int,
+                   vectorize: Optional[bool] = None) -> List[Question]:
+    """
+    `template` (ad veya gen'e bağlı metod) ile n soru üretir. vectorize=None
+    çekirdek ve NumPy varsa vektörel yolu seçer; False her zaman skaler yolu.
+    """
+    name = template if isinstance(template, str) else template.__name__
+    func = getattr(gen, name)
+    if n <= 0:
+        return []
+
+    np = numpy_module() if vectorize is not False else None
+    kernel = batch_kernels(type(gen)).get(name)
+    if np is None or kernel is None:
+        if vectorize:
+            reason = 'NumPy kurulu değil' if np is None else f'{name} için vektörel çekirdek yok'
+            raise RuntimeError(f"Vektörel batch üretilemiyor: {reason}")
+        return [func() for _ in range(n)]
+
+    rng = np.random.default_rng(gen.rng.getrandbits(128))
+    domain = getattr(func, 'domain', {})
+    batch = Batch(np, rng, n, draw_params(np, rng, domain, n), domain)
+    # Çekirdekler döngüsüz nesneler üretir; milyonlarca nesnede çöp toplayıcının
+    # tekrar tekrar tüm heap'i taraması süreyi ~1.5 kat uzatır
+    paused = gc.isenabled()
+    gc.disable()
+    try:
+        return getattr(gen, kernel)(batch)
+    finally:
+        if paused:
+            gc.enable()
+
+
+def pick_distinct(np, candidates, valid, k: int = WRONG_COUNT, rng=None, shuffled: int = 0) -> List[List[str]]:
+    """
+    Her satırdan geçerli ve birbirinden farklı adaylardan en fazla k tane
+    seçip metne çevirir (skaler yoldaki distractors() kuralları).
+    candidates: (n, m) tam sayı, valid: (n, m) bool. İlk `shuffled` sütun
+    rastgele sırada (distractors(rng=...)), kalanlar verilen sırada seçilir.
+    """
+    valid = valid.copy()
+    for j in range(1, candidates.shape[1]):
+        repeated = (candidates[:, :j] == candidates[:, j:j + 1]) & valid[:, :j]
+        valid[:, j] &= ~repeated.any(axis=1)
+
+    keys = np.broadcast_to(np.arange(1.0, candidates.shape[1] + 1), candidates.shape).copy()
+    if shuffled:
+        keys[:, :shuffled] = rng.random((candidates.shape[0], shuffled))
+    keys[~valid] = np.inf
+    order = np.argsort(keys, axis=1)[:, :k]
+    chosen = np.take_along_axis(candidates, order, axis=1)
+    usable = np.take_along_axis(valid, order, axis=1)
+
+    # Metne çevirme tek map ile; k'dan az geçerli adayı olan satırlar sonradan kısaltılır
+    flat = list(map(str, chosen.ravel().tolist()))
+    rows = [flat[i:i + k] for i in range(0, len(flat), k)]
+    for i in np.flatnonzero(~usable.all(axis=1)).tolist():
+        rows[i] = [value for value, ok in zip(rows[i], usable[i].tolist()) if ok]
+    return rows
+
+
+def neighbour_columns(np, correct) -> list:
+    """distractors()'ın tam sayı cevaplar için doldurma sütunları (correct+1, correct-1, ...)."""
+    return [correct + offset for offset in neighbours(0)]
+
+
+def as_text(array) -> List[str]:
+    """Tam sayı dizisini str listesine çevirir."""
+    return list(map(str, array.tolist()))
+
+
+def concat_digits(np, left, right):
+    """str(a) + str(b)'nin sayı değeri (pozitif tam sayılar için)."""
+    width = np.floor(np.log10(right)).astype(np.int64) + 1
+    return left * 10 ** width + right
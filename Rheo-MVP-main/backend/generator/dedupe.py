@@ -0,0 +1,110 @@
+"""
+Content Deduplication
+Soruların içerik parmak izi ve kalıcı (disk üzerinde) tekrar indeksi.
+
+Parmak izi (language, code_snippet, correct_answer) üçlüsünden hesaplanır;
+ID, açıklama ve yanlış şıklar dahil değildir. Böylece aynı soru farklı
+ID'lerle tekrar üretildiğinde yakalanır.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Set
+
+
+class TemplateSpaceExhausted(RuntimeError):
+    """Template'in üretebileceği farklı soru sayısı istenenden az."""
+
+
+def normalize_code(code: str) -> str:
+    """Satır sonlarını birleştirir, satır sonu boşluklarını ve baş/son boş satırları atar."""
+    lines = code.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(line.rstrip() for line in lines).strip('\n')
+
+
+def fingerprint(question: dict) -> str:
+    """Sorunun normalize edilmiş içeriğinden 32 haneli hex parmak izi üretir."""
+    answer = question.get('correct_answer', '')
+    if not isinstance(answer, str):
+        # Elle yazılmış bazı sorularda cevap yapılandırılmış (buggy_line/corrected_line)
+        answer = json.dumps(answer, ensure_ascii=False, sort_keys=True)
+    parts = (
+        question.get('language', 'python').strip().lower(),
+        normalize_code(question.get('code_snippet', '')),
+        answer.strip(),
+    )
+    return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class FingerprintIndex:
+    """
+    Görülen parmak izlerinin kümesi. path verilirse dosyadan yüklenir ve
+    save() ile yalnızca yeni eklenenler dosyanın sonuna yazılır (satır başına bir hash).
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._seen: Set[str] = set()
+        self._pending = []
+        if path is not None and path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                self._seen.update(line.strip() for line in f if line.strip())
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def __contains__(self, fp: str) -> bool:
+        return fp in self._seen
+
+    def add(self, fp: str) -> bool:
+        """Yeni ise ekler ve True döner; daha önce görüldüyse False."""
+        if fp in self._seen:
+            return False
+        self._seen.add(fp)
+        self._pending.append(fp)
+        return True
+
+    def save(self) -> None:
+        """Bekleyen parmak izlerini indeks dosyasına ekler."""
+        if self.path is None or not self._pending:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(self._pending))
+            f.write('\n')
+        self._pending = []
+
+
+def take_unique(questions: Iterable[dict], count: int, index: FingerprintIndex,
+                max_misses: int = 10000, label: str = 'generator') -> Iterator[dict]:
+    """
+    Akıştan indekste olmayan ilk `count` soruyu verir. Art arda `max_misses`
+    tekrar gelirse template uzayı tükenmiş sayılır ve TemplateSpaceExhausted fırlatılır.
+    """
+    if count <= 0:
+        return
+    produced = 0
+    misses = 0
+    for q in questions:
+        if index.add(fingerprint(q)):
+            yield q
+            produced += 1
+            misses = 0
+            if produced >= count:
+                return
+        else:
+            misses += 1
+            if misses >= max_misses:
+                break
+    raise TemplateSpaceExhausted(
+        f"{label}: {count} farklı soru istendi, {produced} üretilebildi "
+        f"(art arda {misses} tekrar). Template uzayı tükendi."
+    )
+
+
+def filter_unique(questions: Iterable[dict], index: FingerprintIndex) -> Iterator[dict]:
+    """Kota olmadan, yalnızca indekste olmayan soruları geçirir."""
+    for q in questions:
+        if index.add(fingerprint(q)):
+            yield q
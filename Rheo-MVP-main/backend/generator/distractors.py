@@ -0,0 +1,75 @@
+"""
+Distractor Engine
+Yanlış şıkların tek kaynağı. Her template olası öğrenci hatalarını (aday
+modeli) öncelik sırasıyla verir; distractors():
+- adayları metne çevirir, doğru cevapla ve birbiriyle çakışanları set ile eler
+- rng verilirse adaylar arasından rastgele seçer (aynı sorunun farklı türevleri)
+- eksik kalırsa doldurur: tam sayı cevaplarda komşu değerler (±1, ±2),
+  ardından dilin genel şıkları (Error, None, undefined ...)
+- her zaman tam olarak WRONG_COUNT farklı yanlış şık döner
+
+Her aday bir kez incelenir, tekrar deneme döngüsü yoktur. Genel şıklar
+en az WRONG_COUNT + 1 farklı değer içerir: doğru cevap bunlardan en fazla
+birine eşit olabileceğinden, doldurma sonunda liste her zaman tamamlanır.
+"""
+
+import random
+import re
+from itertools import chain
+from typing import Iterable, List, Optional
+
+from .question import NO_OUTPUT
+
+WRONG_COUNT = 3
+
+# Dil -> aday modeli yetmediğinde kullanılan genel şıklar (öncelik sırasıyla)
+FALLBACKS = {
+    'python': ("Error", "None", NO_OUTPUT, "0"),
+    'java': ("Error", "null", NO_OUTPUT, "0"),
+    'javascript': ("undefined", "Error", "null", "NaN"),
+}
+
+
+def neighbours(correct: int, count: int = WRONG_COUNT + 1) -> List[int]:
+    """correct+1, correct-1, correct+2, correct-2, ... (count tane, hepsi farklı)."""
+    return [correct + (i // 2 + 1) * (1 if i % 2 == 0 else -1) for i in range(count)]
+
+
+_OFFSETS = neighbours(0)
+
+
+def _is_int(text: str) -> bool:
+    return re.fullmatch(r'-?[0-9]+', text) is not None
+
+
+def distractors(correct, mistakes: Iterable, language: str = 'python',
+                rng: Optional[random.Random] = None) -> List[str]:
+    """
+    correct için WRONG_COUNT farklı yanlış şık. mistakes öncelik sırasıyla
+    aday hatalar; rng verilirse geçerli adaylar karıştırılıp aralarından seçilir.
+    """
+    correct = str(correct)
+    seen = {correct}
+    wrong = []
+    for mistake in mistakes:
+        text = str(mistake)
+        if text not in seen:
+            seen.add(text)
+            wrong.append(text)
+
+    if rng is not None and len(wrong) > 1:
+        rng.shuffle(wrong)
+    if len(wrong) >= WRONG_COUNT:
+        return wrong[:WRONG_COUNT]
+
+    backfill = FALLBACKS[language]
+    if _is_int(correct):
+        value = int(correct)
+        backfill = chain([str(value + offset) for offset in _OFFSETS], backfill)
+    for text in backfill:
+        if text not in seen:
+            seen.add(text)
+            wrong.append(text)
+            if len(wrong) == WRONG_COUNT:
+                break
+    return wrong
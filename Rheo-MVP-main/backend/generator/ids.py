@@ -0,0 +1,39 @@
+"""
+Question ID Service
+Tüm generator'ların paylaştığı ID üreteci.
+
+ID formatı: {prefix}_{difficulty}_{namespace}_{sıra}
+- namespace: çalıştırma başına bir kez belirlenir (seed verilirse seed'den
+  türetilir, yoksa rastgele). Soru başına time.time() çağrısı yapılmaz.
+- sıra: namespace içinde artan sayaç. Paralel worker'lar farklı
+  başlangıç değerleriyle (start) aynı namespace'i paylaşabilir.
+"""
+
+import hashlib
+import itertools
+from typing import List, Optional
+
+
+def make_namespace(seed: Optional[object] = None) -> str:
+    """8 haneli hex namespace. seed verilirse deterministik, yoksa rastgele."""
+    if seed is None:
+        import secrets  # yalnızca seed'siz çalıştırmada gerekir
+        return secrets.token_hex(4)
+    return hashlib.sha256(str(seed).encode('utf-8')).hexdigest()[:8]
+
+
+class QuestionIdFactory:
+    """Namespace + sayaç tabanlı, çakışmasız soru ID üreteci."""
+
+    def __init__(self, namespace: Optional[str] = None, start: int = 0):
+        self.namespace = namespace or make_namespace()
+        self._counter = itertools.count(start + 1)
+
+    def next_id(self, prefix: str, difficulty: int) -> str:
+        """Örnek: loops_2_3fa9c2c4_17"""
+        return f"{prefix}_{difficulty}_{self.namespace}_{next(self._counter)}"
+
+    def next_ids(self, prefix: str, difficulty: int, count: int) -> List[str]:
+        """next_id'nin toplu hali; batch üretimde aynı sayaç sırasını kullanır."""
+        head = f"{prefix}_{difficulty}_{self.namespace}_"
+        return [head + str(i) for i in itertools.islice(self._counter, count)]
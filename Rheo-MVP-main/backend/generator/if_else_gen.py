@@ -6,41 +6,20 @@ If/Else Logic Question Generator
 - If-elif-else zincirleri
 """
 
-import random
-import time
-from dataclasses import dataclass
-from typing import List, Tuple
-
-
-@dataclass
-class Question:
-    id: str
-    type: str
-    difficulty: int
-    topic: str
-    code_snippet: str
-    question_text: str
-    correct_answer: str
-    wrong_options: List[str]
-    explanation: str
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "type": self.type,
-            "difficulty": self.difficulty,
-            "topic": self.topic,
-            "code_snippet": self.code_snippet,
-            "question_text": self.question_text,
-            "correct_answer": self.correct_answer,
-            "wrong_options": self.wrong_options,
-            "explanation": self.explanation
-        }
-
-
-class IfElseGenerator:
+from typing import Tuple
+
+from .distractors import distractors
+from .question import NO_OUTPUT, PREDICTION_TEXT, Question
+from .snippets import IF_ELSE_PRINT, Snippet
+from .space import params
+from .templates import TemplateGenerator, template
+
+
+class IfElseGenerator(TemplateGenerator):
     """If/Else mantık soruları üretir."""
 
+    ID_PREFIX = "if_else"
+
     COMPARISONS = [
         ('>', 'büyüktür', lambda a, b: a > b),
         ('<', 'küçüktür', lambda a, b: a < b),
@@ -53,49 +32,62 @@ class IfElseGenerator:
     OUTPUTS_TR = ['Evet', 'Hayır', 'Doğru', 'Yanlış', 'Büyük', 'Küçük', 'Eşit']
     OUTPUTS_EN = ['Yes', 'No', 'True', 'False', 'Big', 'Small', 'Equal']
 
-    def __init__(self):
-        self.question_count = 0
-
-    def _generate_id(self, difficulty: int) -> str:
-        self.question_count += 1
-        timestamp = int(time.time() * 1000) % 100000
-        return f"if_else_{difficulty}_{timestamp}_{self.question_count}"
-
-    def _get_output_pair(self) -> Tuple[str, str]:
-        """Birbirine zıt iki çıktı döner."""
-        pairs = [
-            ('Evet', 'Hayır'),
-            ('Doğru', 'Yanlış'),
-            ('Büyük', 'Küçük'),
-            ('Pozitif', 'Negatif'),
-        ]
-        return random.choice(pairs)
-
-    def generate_simple_if(self) -> Question:
-        """Basit if kontrolü: if x > 5: print('Büyük')"""
-        var = random.choice(['x', 'n', 'num'])
-        value = random.randint(1, 15)
-        threshold = random.randint(5, 10)
+    # Birbirine zıt çıktı çiftleri
+    OUTPUT_PAIRS = [
+        ('Evet', 'Hayır'),
+        ('Doğru', 'Yanlış'),
+        ('Büyük', 'Küçük'),
+        ('Pozitif', 'Negatif'),
+    ]
 
-        comp_symbol, comp_name, comp_func = random.choice(self.COMPARISONS[:4])
-        condition_true = comp_func(value, threshold)
+    # Kod ve açıklama şekilleri (bkz. snippets.py)
+    SIMPLE_IF_CODE = Snippet("{var} = {value}\nif {var} {op} {threshold}:\n    print('{output}')")
+    SIMPLE_IF_TRUE = Snippet("{value} {op_name} {threshold} olduğu için koşul doğru, '{output}' yazdırılır.")
+    SIMPLE_IF_FALSE = Snippet("{value} {op_name} {threshold} olmadığı için koşul yanlış, hiçbir şey yazdırılmaz.")
+    IF_ELSE_CODE = IF_ELSE_PRINT['python']
+    IF_ELSE_TRUE = Snippet("{value} {op_name} {threshold} olduğu için if bloğu çalışır.")
+    IF_ELSE_FALSE = Snippet("{value} {op_name} {threshold} olmadığı için else bloğu çalışır.")
+    GRADE_CODE = Snippet(
+        "{var} = {value}\nif {var} >= 90:\n    print('A')\nelif {var} >= 70:\n    print('B')\n"
+        "elif {var} >= 50:\n    print('C')\nelse:\n    print('F')"
+    )
+    # (alt sınır, not, açıklama); ilk sağlanan sınır geçerlidir
+    GRADES = [
+        (90, 'A', Snippet("{value} >= 90 olduğu için 'A' yazdırılır.")),
+        (70, 'B', Snippet("{value} >= 70 ve < 90 olduğu için 'B' yazdırılır.")),
+        (50, 'C', Snippet("{value} >= 50 ve < 70 olduğu için 'C' yazdırılır.")),
+        (0, 'F', Snippet("{value} < 50 olduğu için 'F' yazdırılır.")),
+    ]
 
-        output_if = random.choice(self.OUTPUTS_TR)
+    @template(topic="if_else", difficulty=1)
+    @params(
+        var=['x', 'n', 'num'],
+        value=range(1, 16),
+        threshold=range(5, 11),
+        comparison=COMPARISONS[:4],
+        output_if=OUTPUTS_TR,
+    )
+    def generate_simple_if(self, var: str, value: int, threshold: int,
+                           comparison: tuple, output_if: str) -> Question:
+        """Basit if kontrolü: if x > 5: print('Büyük')"""
+        comp_symbol, comp_name, comp_func = comparison
+        condition_true = comp_func(value, threshold)
 
-        code = f"{var} = {value}\nif {var} {comp_symbol} {threshold}:\n    print('{output_if}')"
+        code = self.SIMPLE_IF_CODE.render(var=var, value=value, op=comp_symbol, threshold=threshold, output=output_if)
 
         if condition_true:
             correct = output_if
-            explanation = f"{value} {comp_name} {threshold} olduğu için koşul doğru, '{output_if}' yazdırılır."
+            explanation = self.SIMPLE_IF_TRUE.render(value=value, op_name=comp_name, threshold=threshold,
+                                                     output=output_if)
         else:
-            correct = "(Çıktı yok)"
-            explanation = f"{value} {comp_name} {threshold} olmadığı için koşul yanlış, hiçbir şey yazdırılmaz."
+            correct = NO_OUTPUT
+            explanation = self.SIMPLE_IF_FALSE.render(value=value, op_name=comp_name, threshold=threshold)
 
-        wrong = [
-            output_if if correct == "(Çıktı yok)" else "(Çıktı yok)",
+        wrong = distractors(correct, [
+            output_if if correct == NO_OUTPUT else NO_OUTPUT,
             "Error",
-            str(value)
-        ]
+            value,
+        ])
 
         return Question(
             id=self._generate_id(1),
@@ -103,43 +95,45 @@ class IfElseGenerator:
             difficulty=1,
             topic="if_else",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
             explanation=explanation
         )
 
-    def generate_if_else(self) -> Question:
+    @template(topic="if_else", difficulty=2)
+    @params(
+        var=['x', 'y', 'val'],
+        value=range(1, 16),
+        threshold=range(5, 11),
+        comparison=COMPARISONS[:2],
+        outputs=OUTPUT_PAIRS,
+    )
+    def generate_if_else(self, var: str, value: int, threshold: int,
+                         comparison: tuple, outputs: Tuple[str, str]) -> Question:
         """If-else bloğu: if x > 5: print('A') else: print('B')"""
-        var = random.choice(['x', 'y', 'val'])
-        value = random.randint(1, 15)
-        threshold = random.randint(5, 10)
-
-        comp_symbol, comp_name, comp_func = random.choice(self.COMPARISONS[:2])
+        comp_symbol, comp_name, comp_func = comparison
         condition_true = comp_func(value, threshold)
 
-        output_if, output_else = self._get_output_pair()
+        output_if, output_else = outputs
 
-        code = f"""{var} = {value}
-if {var} {comp_symbol} {threshold}:
-    print('{output_if}')
-else:
-    print('{output_else}')"""
+        code = self.IF_ELSE_CODE.render(var=var, value=value, op=comp_symbol, threshold=threshold,
+                                        then=output_if, otherwise=output_else)
 
         if condition_true:
             correct = output_if
             wrong_first = output_else
-            explanation = f"{value} {comp_name} {threshold} olduğu için if bloğu çalışır."
+            explanation = self.IF_ELSE_TRUE.render(value=value, op_name=comp_name, threshold=threshold)
         else:
             correct = output_else
             wrong_first = output_if
-            explanation = f"{value} {comp_name} {threshold} olmadığı için else bloğu çalışır."
+            explanation = self.IF_ELSE_FALSE.render(value=value, op_name=comp_name, threshold=threshold)
 
-        wrong = [
+        wrong = distractors(correct, [
             wrong_first,
             f"{output_if}\n{output_else}",  # İkisi de yazdırılır hatası
-            "Error"
-        ]
+            "Error",
+        ])
 
         return Question(
             id=self._generate_id(2),
@@ -147,43 +141,26 @@ else:
             difficulty=2,
             topic="if_else",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
             explanation=explanation
         )
 
-    def generate_if_elif_else(self) -> Question:
+    @template(topic="if_else", difficulty=2)
+    @params(var=['score', 'puan', 'x'], value=range(0, 101))
+    def generate_if_elif_else(self, var: str, value: int) -> Question:
         """If-elif-else zinciri"""
-        var = random.choice(['score', 'puan', 'x'])
-        value = random.randint(0, 100)
 
         # Notlandırma sistemi
-        if value >= 90:
-            correct = "A"
-            explanation = f"{value} >= 90 olduğu için 'A' yazdırılır."
-        elif value >= 70:
-            correct = "B"
-            explanation = f"{value} >= 70 ve < 90 olduğu için 'B' yazdırılır."
-        elif value >= 50:
-            correct = "C"
-            explanation = f"{value} >= 50 ve < 70 olduğu için 'C' yazdırılır."
-        else:
-            correct = "F"
-            explanation = f"{value} < 50 olduğu için 'F' yazdırılır."
-
-        code = f"""{var} = {value}
-if {var} >= 90:
-    print('A')
-elif {var} >= 70:
-    print('B')
-elif {var} >= 50:
-    print('C')
-else:
-    print('F')"""
-
-        all_options = ['A', 'B', 'C', 'F']
-        wrong = [opt for opt in all_options if opt != correct][:3]
+        for lower, grade, message in self.GRADES:
+            if value >= lower:
+                correct, explanation = grade, message.render(value=value)
+                break
+
+        code = self.GRADE_CODE.render(var=var, value=value)
+
+        wrong = distractors(correct, [grade for _, grade, _ in self.GRADES])
 
         return Question(
             id=self._generate_id(2),
@@ -191,23 +168,8 @@ else:
             difficulty=2,
             topic="if_else",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
             explanation=explanation
         )
-
-    def generate(self, count: int = 10) -> List[Question]:
-        """Belirtilen sayıda karışık soru üretir."""
-        generators = [
-            self.generate_simple_if,
-            self.generate_if_else,
-            self.generate_if_elif_else,
-        ]
-
-        questions = []
-        for _ in range(count):
-            gen_func = random.choice(generators)
-            questions.append(gen_func())
-
-        return questions
@@ -8,198 +8,216 @@ Java Question Generator
 - Advanced: Inheritance, Polymorphism
 """
 
-import random
-import time
-from dataclasses import dataclass
-from typing import List
-
-
-@dataclass
-class Question:
-    id: str
-    type: str
-    difficulty: int
-    topic: str
-    code_snippet: str
-    question_text: str
-    correct_answer: str
-    wrong_options: List[str]
-    explanation: str
-    language: str = "java"
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "type": self.type,
-            "difficulty": self.difficulty,
-            "topic": self.topic,
-            "code_snippet": self.code_snippet,
-            "question_text": self.question_text,
-            "correct_answer": self.correct_answer,
-            "wrong_options": self.wrong_options,
-            "explanation": self.explanation,
-            "language": self.language
-        }
-
-
-class JavaGenerator:
-    """Java soru üreteci."""
+import itertools
+from typing import List, Tuple
+
+from .batch import Batch, concat_digits, neighbour_columns, pick_distinct, vectorized
+from .distractors import distractors
+from .question import PREDICTION_TEXT, Question
+from .snippets import ASSIGN_PRINT, BINARY_PRINT, IF_ELSE_PRINT, SUM_LOOP, Snippet
+from .space import params
+from .templates import TemplateGenerator, template
 
-    VARIABLE_NAMES = ['x', 'y', 'a', 'b', 'num', 'val', 'count', 'result']
 
-    def __init__(self):
-        self.question_count = 0
+class JavaGenerator(TemplateGenerator):
+    """Java soru üreteci."""
+
+    ID_PREFIX = "java"
 
-    def _generate_id(self, difficulty: int) -> str:
-        self.question_count += 1
-        timestamp = int(time.time() * 1000) % 100000
-        return f"java_{difficulty}_{timestamp}_{self.question_count}"
+    VARIABLE_NAMES = ['x', 'y', 'a', 'b', 'num', 'val', 'count', 'result']
+    STRING_WORDS = ["Hello", "World", "Java", "Code"]
+
+    # Kod ve açıklama şekilleri (bkz. snippets.py)
+    VARIABLE_CODE = ASSIGN_PRINT['java']
+    VARIABLE_EXPLANATION = Snippet("Java'da int bir tam sayı tipidir ve {var} değişkenine {value} atanmıştır.")
+    ARITHMETIC_CODE = BINARY_PRINT['java']
+    ARITHMETIC_EXPLANATION = Snippet("Java'da {op} operatörü matematiksel işlem yapar.")
+    IF_ELSE_CODE = IF_ELSE_PRINT['java']
+    IF_ELSE_EXPLANATION = Snippet("{value} > {threshold} koşulu {verdict} olduğu için '{correct}' basılır.")
+    FOR_LOOP_CODE = SUM_LOOP['java']
+    FOR_LOOP_EXPLANATION = Snippet("Döngü 0'dan {last}'e kadar gider. 0+1+...+{last} = {total}")
+    INHERITANCE_CODE = Snippet(
+        "class Parent {{\n    int x = {parent_val};\n}}\n"
+        "class Child extends Parent {{\n    int y = {child_val};\n    void print() {{\n"
+        "        System.out.println(x + y);\n    }}\n}}\nnew Child().print();"
+    )
+    INHERITANCE_EXPLANATION = Snippet("Child, Parent'tan x={parent_val} değerini miras alır. x + y = {total}")
+    # metod -> (kod, cevap, açıklama)
+    STRING_METHODS = {
+        'length': (Snippet('System.out.println("{word}".length());'), lambda word: str(len(word)),
+                   "length() String uzunluğunu verir"),
+        'toUpperCase': (Snippet('System.out.println("{word}".toUpperCase());'), str.upper,
+                        "toUpperCase() büyük harfe çevirir"),
+        'charAt': (Snippet('System.out.println("{word}".charAt(0));'), lambda word: word[0],
+                   "charAt(0) ilk karakteri verir"),
+    }
 
     # ===== Basic Questions =====
 
-    def generate_variable(self) -> Question:
+    @template(topic="variables", difficulty=1)
+    @params(var=VARIABLE_NAMES, value=range(1, 21))
+    def generate_variable(self, var: str, value: int) -> Question:
         """int x = 5; System.out.println(x);"""
-        var = random.choice(self.VARIABLE_NAMES)
-        value = random.randint(1, 20)
 
-        code = f"""int {var} = {value};
-System.out.println({var});"""
+        code = self.VARIABLE_CODE.render(var=var, value=value)
 
         return Question(
             id=self._generate_id(1),
             type="prediction",
+            language="java",
             difficulty=1,
             topic="variables",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(value),
-            wrong_options=[str(value + 1), str(value - 1), "Error"],
-            explanation=f"Java'da int bir tam sayı tipidir ve {var} değişkenine {value} atanmıştır."
+            wrong_options=distractors(value, [value + 1, value - 1, var], language="java"),
+            explanation=self.VARIABLE_EXPLANATION.render(var=var, value=value)
         )
 
-    def generate_arithmetic(self) -> Question:
+    @template(topic="variables", difficulty=1)
+    @params(
+        names=list(itertools.permutations(VARIABLE_NAMES[:4], 2)),
+        val1=range(2, 16),
+        val2=range(2, 11),
+        op=['+', '-', '*'],
+    )
+    def generate_arithmetic(self, names: Tuple[str, str], val1: int, val2: int, op: str) -> Question:
         """int x = 5; int y = 3; System.out.println(x + y);"""
-        var1, var2 = random.sample(self.VARIABLE_NAMES[:4], 2)
-        val1 = random.randint(2, 15)
-        val2 = random.randint(2, 10)
-        
-        ops = [('+', val1 + val2), ('-', val1 - val2), ('*', val1 * val2)]
-        op, result = random.choice(ops)
+        var1, var2 = names
+        result = {'+': val1 + val2, '-': val1 - val2, '*': val1 * val2}[op]
 
-        code = f"""int {var1} = {val1};
-int {var2} = {val2};
-System.out.println({var1} {op} {var2});"""
+        code = self.ARITHMETIC_CODE.render(var1=var1, val1=val1, var2=var2, val2=val2, op=op)
 
-        wrong = [str(result + 1), str(result - 1)]
+        mistakes = [result + 1, result - 1]
         if op == '+':
-            wrong.append(f"{val1}{val2}")  # String concat yanılgısı
+            mistakes.append(f"{val1}{val2}")  # String concat yanılgısı
         else:
-            wrong.append(str(val1 + val2))
+            mistakes.append(val1 + val2)
 
         return Question(
             id=self._generate_id(1),
             type="prediction",
+            language="java",
             difficulty=1,
             topic="variables",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(result),
-            wrong_options=wrong[:3],
-            explanation=f"Java'da {op} operatörü matematiksel işlem yapar."
+            wrong_options=distractors(result, mistakes, language="java"),
+            explanation=self.ARITHMETIC_EXPLANATION.render(op=op)
         )
 
-    def generate_if_else(self) -> Question:
+    @vectorized('generate_arithmetic')
+    def _arithmetic_batch(self, batch: Batch) -> List[Question]:
+        """generate_arithmetic'in vektörel hali."""
+        np = batch.np
+        val1, val2, op = batch.params['val1'], batch.params['val2'], batch.params['op']
+        result = np.choose(op, [val1 + val2, val1 - val2, val1 * val2])
+        # + için String concat yanılgısı, diğerlerinde toplam
+        third = np.where(op == 0, concat_digits(np, val1, val2), val1 + val2)
+        candidates = np.stack([result + 1, result - 1, third] + neighbour_columns(np, result), axis=1)
+        wrong = pick_distinct(np, candidates, candidates != result[:, None])
+        code, explanation = self.ARITHMETIC_CODE.render, self.ARITHMETIC_EXPLANATION.render
+        return [
+            Question(
+                id=qid,
+                type="prediction",
+                language="java",
+                difficulty=1,
+                topic="variables",
+                code_snippet=code(var1=var1, val1=v1, var2=var2, val2=v2, op=symbol),
+                question_text=PREDICTION_TEXT,
+                correct_answer=str(answer),
+                wrong_options=options,
+                explanation=explanation(op=symbol)
+            )
+            for qid, (var1, var2), v1, v2, symbol, answer, options in zip(
+                self.ids.next_ids(self.ID_PREFIX, 1, batch.n), batch.take('names'), val1.tolist(), val2.tolist(),
+                batch.take('op'), result.tolist(), wrong
+            )
+        ]
+
+    @template(topic="if_else", difficulty=1)
+    @params(var=VARIABLE_NAMES[:4], value=range(1, 11))
+    def generate_if_else(self, var: str, value: int) -> Question:
         """if (x > 5) ... else ..."""
-        var = random.choice(self.VARIABLE_NAMES[:4])
-        value = random.randint(1, 10)
         threshold = 5
         
         if value > threshold:
-            correct = "Greater"
-            wrong = ["Less", "Equal", "Error"]
+            correct, other = "Greater", "Less"
         else:
-            correct = "Less"
-            wrong = ["Greater", "Equal", "Error"]
+            correct, other = "Less", "Greater"
+        wrong = distractors(correct, [other, "Equal", "Error"], language="java")
 
-        code = f"""int {var} = {value};
-if ({var} > {threshold}) {{
-    System.out.println("Greater");
-}} else {{
-    System.out.println("Less");
-}}"""
+        code = self.IF_ELSE_CODE.render(var=var, value=value, op='>', threshold=threshold,
+                                        then="Greater", otherwise="Less")
 
         return Question(
             id=self._generate_id(1),
             type="prediction",
+            language="java",
             difficulty=1,
             topic="if_else",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
-            explanation=f"{value} > {threshold} koşulu {'doğru' if value > threshold else 'yanlış'} olduğu için '{correct}' basılır."
+            explanation=self.IF_ELSE_EXPLANATION.render(value=value, threshold=threshold, correct=correct,
+                                                        verdict='doğru' if value > threshold else 'yanlış')
         )
 
-    def generate_for_loop(self) -> Question:
+    @template(topic="loops", difficulty=2)
+    @params(limit=range(3, 7))
+    def generate_for_loop(self, limit: int) -> Question:
         """for (int i = 0; i < n; i++) { sum += i; }"""
-        limit = random.randint(3, 6)
         result = sum(range(limit))
 
-        code = f"""int sum = 0;
-for (int i = 0; i < {limit}; i++) {{
-    sum += i;
-}}
-System.out.println(sum);"""
+        code = self.FOR_LOOP_CODE.render(n=limit)
 
-        wrong = [
-            str(sum(range(limit + 1))),  # i <= limit
-            str(sum(range(1, limit + 1))),  # 1'den başla
-            str(limit)  # Sadece limit
-        ]
+        wrong = distractors(result, [
+            result + limit,  # i <= limit
+            limit - 1,  # Son i değeri
+            limit,  # Tur sayısı
+        ], language="java")
 
         return Question(
             id=self._generate_id(2),
             type="prediction",
+            language="java",
             difficulty=2,
             topic="loops",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(result),
             wrong_options=wrong,
-            explanation=f"Döngü 0'dan {limit-1}'e kadar gider. 0+1+...+{limit-1} = {result}"
+            explanation=self.FOR_LOOP_EXPLANATION.render(last=limit - 1, total=result)
         )
 
     # ===== Hard Questions (ELO >= 1200) =====
 
-    def generate_inheritance(self) -> Question:
+    @template(topic="inheritance", difficulty=3, advanced=True)
+    @params(parent_val=range(10, 21), child_val=range(1, 10))
+    def generate_inheritance(self, parent_val: int, child_val: int) -> Question:
         """class Child extends Parent { ... }"""
-        parent_val = random.randint(10, 20)
-        child_val = random.randint(1, 9)
         result = parent_val + child_val
 
-        code = f"""class Parent {{
-    int x = {parent_val};
-}}
-class Child extends Parent {{
-    int y = {child_val};
-    void print() {{
-        System.out.println(x + y);
-    }}
-}}
-new Child().print();"""
+        code = self.INHERITANCE_CODE.render(parent_val=parent_val, child_val=child_val)
 
         return Question(
             id=self._generate_id(3),
             type="prediction",
+            language="java",
             difficulty=3,
             topic="inheritance",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(result),
-            wrong_options=[str(parent_val), str(child_val), "Error"],
-            explanation=f"Child, Parent'tan x={parent_val} değerini miras alır. x + y = {result}"
+            wrong_options=distractors(result, [parent_val, child_val, "Error"], language="java"),
+            explanation=self.INHERITANCE_EXPLANATION.render(parent_val=parent_val, total=result)
         )
 
+    @template(topic="polymorphism", difficulty=3, advanced=True)
+    @params()
     def generate_polymorphism(self) -> Question:
         """Method overriding"""
         code = """class Animal {
@@ -218,66 +236,37 @@ a.speak();"""
         return Question(
             id=self._generate_id(3),
             type="prediction",
+            language="java",
             difficulty=3,
             topic="polymorphism",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer="Woof",
-            wrong_options=["...", "Error", "Animal"],
+            # Üst sınıfın metodu, derleme hatası yanılgısı, tip adı
+            wrong_options=distractors("Woof", ["...", "Error", "Animal"], language="java"),
             explanation="Polimorfizm: Değişken tipi Animal olsa da, nesne Dog olduğu için Dog.speak() çalışır."
         )
 
-    def generate_string_methods(self) -> Question:
+    @template(topic="strings", difficulty=2)
+    @params(word=STRING_WORDS, method=['length', 'toUpperCase', 'charAt'])
+    def generate_string_methods(self, word: str, method: str) -> Question:
         """String manipulation"""
-        words = ["Hello", "World", "Java", "Code"]
-        word = random.choice(words)
-        
-        methods = [
-            (f'"{word}".length()', str(len(word)), "length() String uzunluğunu verir"),
-            (f'"{word}".toUpperCase()', word.upper(), "toUpperCase() büyük harfe çevirir"),
-            (f'"{word}".charAt(0)', word[0], "charAt(0) ilk karakteri verir"),
-        ]
-        
-        method_code, correct, expl = random.choice(methods)
-        
-        code = f"System.out.println({method_code});"
+        method_code, answer, expl = self.STRING_METHODS[method]
+        code = method_code.render(word=word)
+        correct = answer(word)
 
-        wrong = [word.lower(), str(len(word) + 1), word[1] if len(word) > 1 else "a"]
+        wrong = distractors(correct, [word.lower(), len(word) + 1, word[1] if len(word) > 1 else "a"],
+                            language="java")
 
         return Question(
             id=self._generate_id(2),
             type="prediction",
+            language="java",
             difficulty=2,
             topic="strings",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
-            wrong_options=wrong[:3],
+            wrong_options=wrong,
             explanation=expl
         )
-
-    def generate(self, count: int = 10, include_hard: bool = False) -> List[Question]:
-        """Belirtilen sayıda soru üretir."""
-        basic_generators = [
-            self.generate_variable,
-            self.generate_arithmetic,
-            self.generate_if_else,
-            self.generate_for_loop,
-            self.generate_string_methods,
-        ]
-        
-        hard_generators = [
-            self.generate_inheritance,
-            self.generate_polymorphism,
-        ]
-
-        generators = basic_generators[:]
-        if include_hard:
-            generators.extend(hard_generators)
-
-        questions = []
-        for _ in range(count):
-            gen_func = random.choice(generators)
-            questions.append(gen_func())
-
-        return questions
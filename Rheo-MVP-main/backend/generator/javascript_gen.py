@@ -8,289 +8,259 @@ JavaScript Question Generator
 - Template literals
 """
 
-import random
-import time
-from dataclasses import dataclass
-from typing import List
-
-
-@dataclass
-class Question:
-    id: str
-    type: str
-    difficulty: int
-    topic: str
-    code_snippet: str
-    question_text: str
-    correct_answer: str
-    wrong_options: List[str]
-    explanation: str
-    language: str = "javascript"
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "type": self.type,
-            "difficulty": self.difficulty,
-            "topic": self.topic,
-            "code_snippet": self.code_snippet,
-            "question_text": self.question_text,
-            "correct_answer": self.correct_answer,
-            "wrong_options": self.wrong_options,
-            "explanation": self.explanation,
-            "language": self.language
-        }
-
-
-class JavaScriptGenerator:
-    """JavaScript soru üreteci."""
+from typing import Tuple
+
+from .distractors import distractors
+from .question import PREDICTION_TEXT, Question
+from .snippets import ASSIGN_PRINT, SUM_LOOP, Snippet
+from .space import ProductSpace, params
+from .templates import TemplateGenerator, template
 
-    VARIABLE_NAMES = ['x', 'y', 'a', 'b', 'num', 'val', 'count', 'result']
 
-    def __init__(self):
-        self.question_count = 0
+def _js_array(values) -> str:
+    """Dizi cevaplarının ortak yazımı: [1,2,3]. Şıkların hepsi aynı biçimde olmalı."""
+    return f"[{','.join(map(str, values))}]"
 
-    def _generate_id(self, difficulty: int) -> str:
-        self.question_count += 1
-        timestamp = int(time.time() * 1000) % 100000
-        return f"js_{difficulty}_{timestamp}_{self.question_count}"
+
+class JavaScriptGenerator(TemplateGenerator):
+    """JavaScript soru üreteci."""
+
+    ID_PREFIX = "js"
+
+    VARIABLE_NAMES = ['x', 'y', 'a', 'b', 'num', 'val', 'count', 'result']
+    PERSON_NAMES = ["Ali", "Ayşe", "Mehmet", "Zeynep"]
+
+    # Kod ve açıklama şekilleri (bkz. snippets.py); diziler str(liste) olarak verilir
+    LET_CODE = ASSIGN_PRINT['javascript']
+    LET_EXPLANATION = Snippet("let ile tanımlanan {var} değişkeni {value} değerini tutar.")
+    CONST_CODE = Snippet("const {var} = {value};\nconsole.log({var});")
+    CONST_EXPLANATION = Snippet("const sabit değişken tanımlar. {var} = {value}")
+    TEMPLATE_LITERAL_CODE = Snippet(
+        'const name = "{name}";\nconst age = {age};\nconsole.log(`${{name}} is ${{age}}`);'
+    )
+    FUNCTION_CODE = Snippet("function add(a, b) {{\n    return a + b;\n}}\nconsole.log(add({val1}, {val2}));")
+    FUNCTION_EXPLANATION = Snippet("add fonksiyonu {val1} + {val2} = {total} döndürür.")
+    FOR_LOOP_CODE = SUM_LOOP['javascript']
+    FOR_LOOP_EXPLANATION = Snippet("Döngü 0'dan {last}'e kadar gider. Toplam = {total}")
+    ARROW_CODE = Snippet("const add = (a, b) => a + b;\nconsole.log(add({val1}, {val2}));")
+    MAP_CODE = Snippet("const arr = {arr};\nconst doubled = arr.map(x => x * {multiplier});\nconsole.log(doubled);")
+    MAP_EXPLANATION = Snippet("map() her elemanı {multiplier} ile çarpar: {result}")
+    FILTER_CODE = Snippet("const arr = {arr};\nconst filtered = arr.filter(x => x > {threshold});\nconsole.log(filtered);")
+    FILTER_EXPLANATION = Snippet("filter() sadece {threshold}'ten büyük elemanları döndürür: {result}")
+    SPREAD_CODE = Snippet("const arr1 = {arr};\nconst arr2 = [...arr1, {new_val}];\nconsole.log(arr2);")
 
     # ===== Basic Questions =====
 
-    def generate_let_variable(self) -> Question:
+    @template(topic="variables", difficulty=1)
+    @params(var=VARIABLE_NAMES, value=range(1, 21))
+    def generate_let_variable(self, var: str, value: int) -> Question:
         """let x = 5; console.log(x);"""
-        var = random.choice(self.VARIABLE_NAMES)
-        value = random.randint(1, 20)
 
-        code = f"""let {var} = {value};
-console.log({var});"""
+        code = self.LET_CODE.render(var=var, value=value)
 
         return Question(
             id=self._generate_id(1),
             type="prediction",
+            language="javascript",
             difficulty=1,
             topic="variables",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(value),
-            wrong_options=[str(value + 1), str(value - 1), "undefined"],
-            explanation=f"let ile tanımlanan {var} değişkeni {value} değerini tutar."
+            wrong_options=distractors(value, [value + 1, value - 1, "undefined"], language="javascript"),
+            explanation=self.LET_EXPLANATION.render(var=var, value=value)
         )
 
-    def generate_const_variable(self) -> Question:
+    @template(topic="variables", difficulty=1)
+    @params(var=VARIABLE_NAMES, value=range(1, 21))
+    def generate_const_variable(self, var: str, value: int) -> Question:
         """const x = 5;"""
-        var = random.choice(self.VARIABLE_NAMES)
-        value = random.randint(1, 20)
 
-        code = f"""const {var} = {value};
-console.log({var});"""
+        code = self.CONST_CODE.render(var=var, value=value)
 
         return Question(
             id=self._generate_id(1),
             type="prediction",
+            language="javascript",
             difficulty=1,
             topic="variables",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(value),
-            wrong_options=[str(value + 1), "undefined", "Error"],
-            explanation=f"const sabit değişken tanımlar. {var} = {value}"
+            wrong_options=distractors(value, [value + 1, "undefined", "Error"], language="javascript"),
+            explanation=self.CONST_EXPLANATION.render(var=var, value=value)
         )
 
-    def generate_template_literal(self) -> Question:
+    @template(topic="strings", difficulty=1)
+    @params(name=PERSON_NAMES, age=range(18, 31))
+    def generate_template_literal(self, name: str, age: int) -> Question:
         """Template string"""
-        name = random.choice(["Ali", "Ayşe", "Mehmet", "Zeynep"])
-        age = random.randint(18, 30)
 
-        code = f"""const name = "{name}";
-const age = {age};
-console.log(`${{name}} is ${{age}}`);"""
+        code = self.TEMPLATE_LITERAL_CODE.render(name=name, age=age)
 
         correct = f"{name} is {age}"
 
         return Question(
             id=self._generate_id(1),
             type="prediction",
+            language="javascript",
             difficulty=1,
             topic="strings",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
-            wrong_options=[f"${{{name}}} is ${{{age}}}", f"{name}{age}", "undefined"],
+            wrong_options=distractors(correct, [f"${{{name}}} is ${{{age}}}", f"{name}{age}", "undefined"],
+                                      language="javascript"),
             explanation="Template literals (``) içinde ${} ile değişkenler yazılır."
         )
 
-    def generate_function(self) -> Question:
+    @template(topic="functions", difficulty=1)
+    @params(val1=range(2, 11), val2=range(2, 11))
+    def generate_function(self, val1: int, val2: int) -> Question:
         """function add(a, b) { return a + b; }"""
-        val1 = random.randint(2, 10)
-        val2 = random.randint(2, 10)
         result = val1 + val2
 
-        code = f"""function add(a, b) {{
-    return a + b;
-}}
-console.log(add({val1}, {val2}));"""
+        code = self.FUNCTION_CODE.render(val1=val1, val2=val2)
 
         return Question(
             id=self._generate_id(1),
             type="prediction",
+            language="javascript",
             difficulty=1,
             topic="functions",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(result),
-            wrong_options=[str(result + 1), f"{val1}{val2}", "undefined"],
-            explanation=f"add fonksiyonu {val1} + {val2} = {result} döndürür."
+            wrong_options=distractors(result, [result + 1, f"{val1}{val2}", "undefined"], language="javascript"),
+            explanation=self.FUNCTION_EXPLANATION.render(val1=val1, val2=val2, total=result)
         )
 
-    def generate_for_loop(self) -> Question:
+    @template(topic="loops", difficulty=2)
+    @params(limit=range(3, 7))
+    def generate_for_loop(self, limit: int) -> Question:
         """for (let i = 0; i < n; i++)"""
-        limit = random.randint(3, 6)
         result = sum(range(limit))
 
-        code = f"""let sum = 0;
-for (let i = 0; i < {limit}; i++) {{
-    sum += i;
-}}
-console.log(sum);"""
+        code = self.FOR_LOOP_CODE.render(n=limit)
 
-        wrong = [
-            str(sum(range(limit + 1))),
-            str(sum(range(1, limit + 1))),
-            str(limit)
-        ]
+        wrong = distractors(result, [
+            result + limit,  # i <= limit
+            limit - 1,  # Son i değeri
+            limit,  # Tur sayısı
+        ], language="javascript")
 
         return Question(
             id=self._generate_id(2),
             type="prediction",
+            language="javascript",
             difficulty=2,
             topic="loops",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(result),
             wrong_options=wrong,
-            explanation=f"Döngü 0'dan {limit-1}'e kadar gider. Toplam = {result}"
+            explanation=self.FOR_LOOP_EXPLANATION.render(last=limit - 1, total=result)
         )
 
     # ===== Hard Questions (ELO >= 1200) =====
 
-    def generate_arrow_function(self) -> Question:
+    @template(topic="arrow_functions", difficulty=2, advanced=True)
+    @params(val1=range(2, 11), val2=range(2, 11))
+    def generate_arrow_function(self, val1: int, val2: int) -> Question:
         """const add = (a, b) => a + b;"""
-        val1 = random.randint(2, 10)
-        val2 = random.randint(2, 10)
         result = val1 + val2
 
-        code = f"""const add = (a, b) => a + b;
-console.log(add({val1}, {val2}));"""
+        code = self.ARROW_CODE.render(val1=val1, val2=val2)
 
         return Question(
             id=self._generate_id(2),
             type="prediction",
+            language="javascript",
             difficulty=2,
             topic="arrow_functions",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(result),
-            wrong_options=[str(result - 1), f"{val1}{val2}", "undefined"],
+            wrong_options=distractors(result, [result - 1, f"{val1}{val2}", "undefined"], language="javascript"),
             explanation=f"Arrow function: (a, b) => a + b kısaltılmış function sözdizimi."
         )
 
-    def generate_map(self) -> Question:
+    @template(topic="array_methods", difficulty=3, advanced=True)
+    @params(arr=ProductSpace.repeat(range(1, 6), 3), multiplier=[2, 3])
+    def generate_map(self, arr: Tuple[int, ...], multiplier: int) -> Question:
         """arr.map(x => x * 2)"""
-        arr = [random.randint(1, 5) for _ in range(3)]
-        multiplier = random.choice([2, 3])
+        arr = list(arr)
         result = [x * multiplier for x in arr]
 
-        code = f"""const arr = {arr};
-const doubled = arr.map(x => x * {multiplier});
-console.log(doubled);"""
+        code = self.MAP_CODE.render(arr=str(arr), multiplier=multiplier)
 
-        result_str = str(result).replace(" ", "")
+        result_str = _js_array(result)
 
         return Question(
             id=self._generate_id(3),
             type="prediction",
+            language="javascript",
             difficulty=3,
             topic="array_methods",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=result_str,
-            wrong_options=[str(arr), str(sum(result)), "[undefined]"],
-            explanation=f"map() her elemanı {multiplier} ile çarpar: {result}"
+            wrong_options=distractors(result_str, [_js_array(arr), sum(result), "[undefined]"],
+                                      language="javascript"),
+            explanation=self.MAP_EXPLANATION.render(multiplier=multiplier, result=str(result))
         )
 
-    def generate_filter(self) -> Question:
+    @template(topic="array_methods", difficulty=3, advanced=True)
+    @params(arr=ProductSpace.repeat(range(1, 11), 5))
+    def generate_filter(self, arr: Tuple[int, ...]) -> Question:
         """arr.filter(x => x > 5)"""
-        arr = [random.randint(1, 10) for _ in range(5)]
+        arr = list(arr)
         threshold = 5
         result = [x for x in arr if x > threshold]
 
-        code = f"""const arr = {arr};
-const filtered = arr.filter(x => x > {threshold});
-console.log(filtered);"""
+        code = self.FILTER_CODE.render(arr=str(arr), threshold=threshold)
 
-        result_str = str(result).replace(" ", "")
+        result_str = _js_array(result)
 
         return Question(
             id=self._generate_id(3),
             type="prediction",
+            language="javascript",
             difficulty=3,
             topic="array_methods",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=result_str,
-            wrong_options=[str(arr), "[]", str([x for x in arr if x <= threshold])],
-            explanation=f"filter() sadece {threshold}'ten büyük elemanları döndürür: {result}"
+            wrong_options=distractors(result_str, [
+                _js_array(arr),  # Filtre uygulanmamış
+                "[]",
+                _js_array(x for x in arr if x <= threshold),  # Koşul ters
+                _js_array(x for x in arr if x >= threshold),  # > yerine >=
+            ], language="javascript"),
+            explanation=self.FILTER_EXPLANATION.render(threshold=threshold, result=str(result))
         )
 
-    def generate_spread_operator(self) -> Question:
+    @template(topic="spread", difficulty=2, advanced=True)
+    @params(arr1=ProductSpace.repeat(range(1, 4), 3), new_val=range(4, 7))
+    def generate_spread_operator(self, arr1: Tuple[int, ...], new_val: int) -> Question:
         """const arr2 = [...arr1, 4];"""
-        arr1 = [random.randint(1, 3) for _ in range(3)]
-        new_val = random.randint(4, 6)
+        arr1 = list(arr1)
         result = arr1 + [new_val]
 
-        code = f"""const arr1 = {arr1};
-const arr2 = [...arr1, {new_val}];
-console.log(arr2);"""
+        code = self.SPREAD_CODE.render(arr=str(arr1), new_val=new_val)
 
-        result_str = str(result).replace(" ", "")
+        result_str = _js_array(result)
 
         return Question(
             id=self._generate_id(2),
             type="prediction",
+            language="javascript",
             difficulty=2,
             topic="spread",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=result_str,
-            wrong_options=[str(arr1), str([new_val] + arr1), "Error"],
+            wrong_options=distractors(result_str, [_js_array(arr1), _js_array([new_val] + arr1), "Error"],
+                                      language="javascript"),
             explanation=f"Spread operator (...) diziyi açar ve yeni eleman ekler."
         )
-
-    def generate(self, count: int = 10, include_hard: bool = False) -> List[Question]:
-        """Belirtilen sayıda soru üretir."""
-        basic_generators = [
-            self.generate_let_variable,
-            self.generate_const_variable,
-            self.generate_template_literal,
-            self.generate_function,
-            self.generate_for_loop,
-        ]
-        
-        hard_generators = [
-            self.generate_arrow_function,
-            self.generate_map,
-            self.generate_filter,
-            self.generate_spread_operator,
-        ]
-
-        generators = basic_generators[:]
-        if include_hard:
-            generators.extend(hard_generators)
-
-        questions = []
-        for _ in range(count):
-            gen_func = random.choice(generators)
-            questions.append(gen_func())
-
-        return questions
@@ -7,64 +7,51 @@ Loop Question Generator
 - While döngüsü
 """
 
-import random
-import time
-from dataclasses import dataclass
 from typing import List
 
+from .batch import Batch, neighbour_columns, pick_distinct, vectorized
+from .distractors import distractors
+from .question import PREDICTION_TEXT, Question
+from .snippets import COUNTER_LOOP, SUM_LOOP, Snippet
+from .space import params
+from .templates import TemplateGenerator, template
 
-@dataclass
-class Question:
-    id: str
-    type: str
-    difficulty: int
-    topic: str
-    code_snippet: str
-    question_text: str
-    correct_answer: str
-    wrong_options: List[str]
-    explanation: str
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "type": self.type,
-            "difficulty": self.difficulty,
-            "topic": self.topic,
-            "code_snippet": self.code_snippet,
-            "question_text": self.question_text,
-            "correct_answer": self.correct_answer,
-            "wrong_options": self.wrong_options,
-            "explanation": self.explanation
-        }
-
-
-class LoopGenerator:
-    """Döngü soruları üretir."""
-
-    def __init__(self):
-        self.question_count = 0
 
-    def _generate_id(self, difficulty: int) -> str:
-        self.question_count += 1
-        timestamp = int(time.time() * 1000) % 100000
-        return f"loops_{difficulty}_{timestamp}_{self.question_count}"
+class LoopGenerator(TemplateGenerator):
+    """Döngü soruları üretir."""
 
-    def generate_simple_range(self) -> Question:
+    ID_PREFIX = "loops"
+
+    # Kod ve açıklama şekilleri (bkz. snippets.py)
+    RANGE_CODE = Snippet("for i in range({n}):\n    print(i)")
+    RANGE_EXPLANATION = Snippet("range({n}) 0'dan {last}'e kadar sayılar üretir ({n} dahil değil).")
+    RANGE_START_CODE = Snippet("for i in range({start}, {end}):\n    print(i)")
+    RANGE_START_EXPLANATION = Snippet("range({start}, {end}) {start}'den başlar, {end}'e kadar gider ({end} dahil değil).")
+    SUM_CODE = SUM_LOOP['python']
+    SUM_EXPLANATION = Snippet("0+1+2+...+{last} = {total}. range({n}) 0'dan {last}'e kadar toplar.")
+    COUNTER_CODE = COUNTER_LOOP['python']
+    COUNTER_EXPLANATION = Snippet("Döngü {n} kez çalışır (i: 0, 1, 2, ..., {last}).")
+    WHILE_CODE = Snippet("x = {start}\nwhile x < {limit}:\n    x += 1\nprint(x)")
+    WHILE_EXPLANATION = Snippet(
+        "x {start}'dan başlar, her adımda 1 artar. x={limit} olunca koşul sağlanmaz ve döngü biter."
+    )
+
+    @template(topic="loops", difficulty=1)
+    @params(n=range(3, 7))
+    def generate_simple_range(self, n: int) -> Question:
         """Basit for range: for i in range(5): print(i)"""
-        n = random.randint(3, 6)
 
-        code = f"for i in range({n}):\n    print(i)"
+        code = self.RANGE_CODE.render(n=n)
 
         # Çıktı: 0, 1, 2, ... n-1
         correct = "\n".join(str(i) for i in range(n))
 
         # Yanlış şıklar
-        wrong = [
+        wrong = distractors(correct, [
             "\n".join(str(i) for i in range(1, n + 1)),  # 1'den başlama hatası
             "\n".join(str(i) for i in range(n + 1)),     # n dahil hatası
-            str(n),  # Sadece son değer
-        ]
+            n,  # Sadece son değer
+        ])
 
         return Question(
             id=self._generate_id(1),
@@ -72,26 +59,28 @@ class LoopGenerator:
             difficulty=1,
             topic="loops",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
-            explanation=f"range({n}) 0'dan {n-1}'e kadar sayılar üretir ({n} dahil değil)."
+            explanation=self.RANGE_EXPLANATION.render(n=n, last=n - 1)
         )
 
-    def generate_range_with_start(self) -> Question:
+    @template(topic="loops", difficulty=2)
+    @params(start=range(1, 4), span=range(3, 6))
+    def generate_range_with_start(self, start: int, span: int) -> Question:
         """range(start, end): for i in range(2, 6): print(i)"""
-        start = random.randint(1, 3)
-        end = start + random.randint(3, 5)
+        end = start + span
 
-        code = f"for i in range({start}, {end}):\n    print(i)"
+        code = self.RANGE_START_CODE.render(start=start, end=end)
 
         correct = "\n".join(str(i) for i in range(start, end))
 
-        wrong = [
-            "\n".join(str(i) for i in range(start, end + 1)),  # end dahil
-            "\n".join(str(i) for i in range(end)),              # start yok
-            "\n".join(str(i) for i in range(start - 1, end)),   # start-1'den başla
-        ]
+        wrong = distractors(correct, [
+            "\n".join(str(i) for i in range(start, end + 1)),      # end dahil
+            "\n".join(str(i) for i in range(end)),                  # start yok
+            "\n".join(str(i) for i in range(start - 1, end)),       # start-1'den başla
+            "\n".join(str(i) for i in range(start + 1, end + 1)),   # ikisi de bir kaymış
+        ])
 
         return Question(
             id=self._generate_id(2),
@@ -99,27 +88,25 @@ class LoopGenerator:
             difficulty=2,
             topic="loops",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
-            explanation=f"range({start}, {end}) {start}'den başlar, {end}'e kadar gider ({end} dahil değil)."
+            explanation=self.RANGE_START_EXPLANATION.render(start=start, end=end)
         )
 
-    def generate_sum_loop(self) -> Question:
+    @template(topic="loops", difficulty=2)
+    @params(n=range(4, 8))
+    def generate_sum_loop(self, n: int) -> Question:
         """Toplam hesaplama: toplam = 0; for i in range(4): toplam += i"""
-        n = random.randint(4, 7)
         correct_sum = sum(range(n))
 
-        code = f"""toplam = 0
-for i in range({n}):
-    toplam += i
-print(toplam)"""
+        code = self.SUM_CODE.render(n=n)
 
-        wrong = [
-            str(correct_sum + n),  # n de dahil edilmiş
-            str(n - 1),            # Son değer sanılmış
-            str(n * (n - 1)),      # Çarpım hatası
-        ]
+        wrong = distractors(correct_sum, [
+            correct_sum + n,  # n de dahil edilmiş
+            n - 1,            # Son değer sanılmış
+            n * (n - 1),      # Çarpım hatası
+        ])
 
         return Question(
             id=self._generate_id(2),
@@ -127,26 +114,49 @@ print(toplam)"""
             difficulty=2,
             topic="loops",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(correct_sum),
             wrong_options=wrong,
-            explanation=f"0+1+2+...+{n-1} = {correct_sum}. range({n}) 0'dan {n-1}'e kadar toplar."
+            explanation=self.SUM_EXPLANATION.render(n=n, last=n - 1, total=correct_sum)
         )
 
-    def generate_counter_loop(self) -> Question:
+    @vectorized('generate_sum_loop')
+    def _sum_loop_batch(self, batch: Batch) -> List[Question]:
+        """generate_sum_loop'un vektörel hali."""
+        np, n = batch.np, batch.params['n']
+        correct_sum = n * (n - 1) // 2
+        candidates = np.stack([correct_sum + n, n - 1, n * (n - 1)] + neighbour_columns(np, correct_sum), axis=1)
+        wrong = pick_distinct(np, candidates, candidates != correct_sum[:, None])
+        code, explanation = self.SUM_CODE.render, self.SUM_EXPLANATION.render
+        return [
+            Question(
+                id=qid,
+                type="prediction",
+                difficulty=2,
+                topic="loops",
+                code_snippet=code(n=k),
+                question_text=PREDICTION_TEXT,
+                correct_answer=str(total),
+                wrong_options=options,
+                explanation=explanation(n=k, last=k - 1, total=total)
+            )
+            for qid, k, total, options in zip(
+                self.ids.next_ids(self.ID_PREFIX, 2, batch.n), n.tolist(), correct_sum.tolist(), wrong
+            )
+        ]
+
+    @template(topic="loops", difficulty=1)
+    @params(n=range(3, 9))
+    def generate_counter_loop(self, n: int) -> Question:
         """Sayaç döngüsü: Kaç kez çalışır?"""
-        n = random.randint(3, 8)
 
-        code = f"""sayac = 0
-for i in range({n}):
-    sayac += 1
-print(sayac)"""
+        code = self.COUNTER_CODE.render(n=n)
 
-        wrong = [
-            str(n - 1),  # Off-by-one
-            str(n + 1),  # Off-by-one (diğer yön)
-            "0",         # Hiç artmamış
-        ]
+        wrong = distractors(n, [
+            n - 1,  # Off-by-one
+            n + 1,  # Off-by-one (diğer yön)
+            0,      # Hiç artmamış
+        ])
 
         return Question(
             id=self._generate_id(1),
@@ -154,30 +164,28 @@ print(sayac)"""
             difficulty=1,
             topic="loops",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(n),
             wrong_options=wrong,
-            explanation=f"Döngü {n} kez çalışır (i: 0, 1, 2, ..., {n-1})."
+            explanation=self.COUNTER_EXPLANATION.render(n=n, last=n - 1)
         )
 
-    def generate_while_loop(self) -> Question:
+    @template(topic="loops", difficulty=2)
+    @params(start=range(0, 3), span=range(3, 6))
+    def generate_while_loop(self, start: int, span: int) -> Question:
         """While döngüsü: while x < 5: x += 1"""
-        start = random.randint(0, 2)
-        limit = start + random.randint(3, 5)
+        limit = start + span
 
-        code = f"""x = {start}
-while x < {limit}:
-    x += 1
-print(x)"""
+        code = self.WHILE_CODE.render(start=start, limit=limit)
 
         # x artarak limit'e ulaşır
         correct = str(limit)
 
-        wrong = [
-            str(limit - 1),  # Son artış unutulmuş
-            str(limit + 1),  # Bir fazla artmış
-            str(start),      # Hiç değişmemiş
-        ]
+        wrong = distractors(correct, [
+            limit - 1,  # Son artış unutulmuş
+            limit + 1,  # Bir fazla artmış
+            start,      # Hiç değişmemiş
+        ])
 
         return Question(
             id=self._generate_id(2),
@@ -185,25 +193,8 @@ print(x)"""
             difficulty=2,
             topic="loops",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
-            explanation=f"x {start}'dan başlar, her adımda 1 artar. x={limit} olunca koşul sağlanmaz ve döngü biter."
+            explanation=self.WHILE_EXPLANATION.render(start=start, limit=limit)
         )
-
-    def generate(self, count: int = 10) -> List[Question]:
-        """Belirtilen sayıda karışık soru üretir."""
-        generators = [
-            self.generate_simple_range,
-            self.generate_range_with_start,
-            self.generate_sum_loop,
-            self.generate_counter_loop,
-            self.generate_while_loop,
-        ]
-
-        questions = []
-        for _ in range(count):
-            gen_func = random.choice(generators)
-            questions.append(gen_func())
-
-        return questions
@@ -0,0 +1,52 @@
+"""
+Question Model
+Tüm generator'ların paylaştığı soru tipi.
+
+- slots=True: soru başına __dict__ yok, milyonlarca soruluk bankada RAM kazancı
+- type/topic/language/question_text her kayıtta tekrar eder; sys.intern ile
+  bellekte tek kopya tutulur
+- PREDICTION_TEXT: tüm tahmin sorularının ortak metni (generator'lar bunu kullanır)
+- NO_OUTPUT: hiçbir şey yazdırmayan kodun cevabı
+"""
+
+import sys
+from dataclasses import dataclass
+from typing import List
+
+PREDICTION_TEXT = sys.intern("Bu kodun çıktısı nedir?")
+NO_OUTPUT = "(Çıktı yok)"
+
+
+@dataclass(slots=True)
+class Question:
+    id: str
+    type: str
+    difficulty: int
+    topic: str
+    code_snippet: str
+    question_text: str
+    correct_answer: str
+    wrong_options: List[str]
+    explanation: str
+    language: str = "python"
+
+    def __post_init__(self):
+        self.type = sys.intern(self.type)
+        self.topic = sys.intern(self.topic)
+        self.language = sys.intern(self.language)
+        self.question_text = sys.intern(self.question_text)
+
+    def to_dict(self) -> dict:
+        """Tek serileştirici: tüm diller aynı alan sırasıyla yazılır."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "difficulty": self.difficulty,
+            "topic": self.topic,
+            "code_snippet": self.code_snippet,
+            "question_text": self.question_text,
+            "correct_answer": self.correct_answer,
+            "wrong_options": self.wrong_options,
+            "explanation": self.explanation,
+            "language": self.language
+        }
@@ -0,0 +1,84 @@
+"""
+Generator Registry
+Görev adı -> generator sınıfı. Modüller ilk kullanımda import edilir; böylece
+--language python yalnızca Python generator'larını, --help hiçbirini yüklemez.
+
+Dış paketler 'rheo.generators' entry point grubuyla generator ekleyebilir:
+
+    [project.entry-points."rheo.generators"]
+    "python.strings" = "rheo_strings:StringGenerator"
+
+Entry point adı "<dil>.<görev>" biçimindedir; sınıfın templates.TemplateGenerator'dan
+türeyip ID_PREFIX ve @template metodlarını tanımlaması yeterlidir. Keşif
+isteğe bağlıdır (discover_plugins(), main.py'de --plugins): importlib.metadata
+taraması tek başına onlarca ms sürer. Sınıf yine yalnızca o görev
+çalıştırıldığında yüklenir; bilinmeyen bir görev adı (ör. worker sürecinde)
+entry point'lerde aranır.
+"""
+
+import importlib
+from typing import Dict, List, Tuple
+
+ENTRY_POINT_GROUP = 'rheo.generators'
+
+# Görev -> (dil, modül, sınıf). Üretim planı bu sırayı izler.
+BUILTIN_GENERATORS = {
+    'variables': ('python', '.variable_gen', 'VariableGenerator'),
+    'if_else': ('python', '.if_else_gen', 'IfElseGenerator'),
+    'loops': ('python', '.loop_gen', 'LoopGenerator'),
+    'java': ('java', '.java_gen', 'JavaGenerator'),
+    'javascript': ('javascript', '.javascript_gen', 'JavaScriptGenerator'),
+}
+
+_classes: Dict[str, type] = {}
+_plugins = None
+_plugins_enabled = False
+
+
+def discover_plugins() -> List[str]:
+    """Entry point eklentilerini plana dahil eder; bulunan görev adlarını döner."""
+    global _plugins_enabled
+    _plugins_enabled = True
+    return sorted(_plugin_entry_points())
+
+
+def _plugin_entry_points() -> Dict[str, tuple]:
+    """Kurulu paketlerin entry point'leri (yalnızca metadata okunur, import edilmez)."""
+    global _plugins
+    if _plugins is None:
+        from importlib.metadata import entry_points
+
+        _plugins = {}
+        for ep in entry_points(group=ENTRY_POINT_GROUP):
+            language, _, name = ep.name.partition('.')
+            if name and name not in BUILTIN_GENERATORS:
+                _plugins[name] = (language, ep)
+    return _plugins
+
+
+def generator_names(language: str = 'all') -> List[Tuple[str, str]]:
+    """Dile ait (dil, görev) çiftleri: önce yerleşik generator'lar, sonra eklentiler."""
+    names = [(lang, name) for name, (lang, _, _) in BUILTIN_GENERATORS.items()]
+    if _plugins_enabled:
+        names += sorted((lang, name) for name, (lang, _) in _plugin_entry_points().items())
+    return [(lang, name) for lang, name in names if language in ('all', lang)]
+
+
+def plugin_names(language: str = 'all') -> List[str]:
+    """Plana dahil edilmiş (discover_plugins sonrası) eklenti görevleri."""
+    return [name for lang, name in generator_names(language) if name not in BUILTIN_GENERATORS]
+
+
+def load_generator(name: str) -> type:
+    """Görevin generator sınıfını (gerekirse import ederek) döner."""
+    cls = _classes.get(name)
+    if cls is None:
+        if name in BUILTIN_GENERATORS:
+            _, module, attr = BUILTIN_GENERATORS[name]
+            cls = getattr(importlib.import_module(module, __package__), attr)
+        elif name in _plugin_entry_points():
+            cls = _plugin_entry_points()[name][1].load()
+        else:
+            raise KeyError(f"Bilinmeyen generator: {name}")
+        _classes[name] = cls
+    return cls
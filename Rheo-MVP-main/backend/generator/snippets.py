@@ -0,0 +1,174 @@
+"""
+Snippet Templates
+Kod ve açıklama metinlerinin şekilleri bir kez tanımlanır, her soruda
+yalnızca slot'lar doldurulur:
+
+    SUM_LOOP = SnippetShape(
+        python="toplam = 0\\nfor i in range({n}):\\n    toplam += i\\nprint(toplam)",
+        java="int sum = 0;\\nfor (int i = 0; i < {n}; i++) {{\\n    sum += i;\\n}}\\nSystem.out.println(sum);",
+    )
+    SUM_LOOP['java'].render(n=4)
+
+Metin str.format sözdizimiyle yazılır ({{ }} düz süslü parantez). Tanımda
+string.Formatter ile sabit parçalar ve slot'lar ayrılır; parçalar, slot'ları
+keyword argüman alan tek bir f-string fonksiyonuna derlenir (CPython'da
+f-string, parçaları ''.join ile birleştirmekten ve str.format'tan hızlıdır).
+
+@params domain'leri sonlu olduğundan aynı slot değerleri sık tekrar eder;
+render sonuçları snippet başına önbelleğe alınır (CACHE_LIMIT kayda kadar)
+ve önbellek araması derlenen fonksiyonun içindedir. Anahtar slot
+değerlerini tipleriyle birlikte tutar (1, True ve 1.0 ayrı kayıtlardır). Önbellekten dönen metin
+aynı str nesnesidir: bankadaki aynı kodlu sorular tek kopyayı paylaşır.
+Slot değerleri bu yüzden hash'lenebilir olmalıdır (liste yerine str(liste)).
+"""
+
+import keyword
+from string import Formatter
+from typing import Callable, Dict, List, Tuple
+
+CACHE_LIMIT = 1 << 14  # snippet başına önbellekteki en fazla metin
+
+
+def parse(text: str) -> Tuple[List[str], List[Tuple[str, str, str]]]:
+    """
+    Metni sabit parçalara ve (ad, dönüşüm, biçim) slot'larına ayırır:
+    fragments[0] fields[0] fragments[1] ... fields[-1] fragments[-1].
+    """
+    fragments: List[str] = []
+    fields: List[Tuple[str, str, str]] = []
+    literal = ''
+    for text_part, name, spec, conversion in Formatter().parse(text):
+        literal += text_part
+        if name is None:
+            continue
+        if not name.isidentifier() or keyword.iskeyword(name) or name.startswith('_'):
+            raise ValueError(f"Snippet slot'u düz bir isim olmalı: {{{name}}}")
+        if '{' in spec:
+            raise ValueError(f"Snippet slot'unda iç içe biçim desteklenmez: {{{name}:{spec}}}")
+        fragments.append(literal)
+        fields.append((name, conversion or '', spec))
+        literal = ''
+    fragments.append(literal)
+    return fragments, fields
+
+
+def _escape(literal: str) -> str:
+    return literal.replace('{', '{{').replace('}', '}}')
+
+
+def compile_snippet(fragments: List[str], fields: List[Tuple[str, str, str]],
+                    slots: Tuple[str, ...], cache: Dict[tuple, str]) -> Callable[..., str]:
+    """
+    Parçalardan, slot'ları keyword argüman alan ve sonucu `cache`'te tutan
+    render fonksiyonu üretir.
+    """
+    body = _escape(fragments[0])
+    for (name, conversion, spec), literal in zip(fields, fragments[1:]):
+        body += '{' + name + ('!' + conversion if conversion else '') + (':' + spec if spec else '') + '}'
+        body += _escape(literal)
+    if not slots:
+        text = ''.join(fragments)
+        return lambda: text
+
+    # Anahtarda değerin tipi de var: 1, True ve 1.0 eşit ve aynı hash'e sahip ama farklı yazılır
+    key = ', '.join(f"{name}, type({name})" for name in slots)
+    source = (
+        f"def render(*, {', '.join(slots)}):\n"
+        f"    key = {key}\n"
+        f"    text = _get(key)\n"
+        f"    if text is None:\n"
+        f"        text = f{body!r}\n"
+        f"        if len(_cache) < {CACHE_LIMIT}:\n"
+        f"            _cache[key] = text\n"
+        f"    return text\n"
+    )
+    namespace = {'_cache': cache, '_get': cache.get}
+    exec(compile(source, '<snippet>', 'exec'), namespace)
+    return namespace['render']
+
+
+class Snippet:
+    """
+    Tek dilde bir metin şekli. render(**slots) tanımdaki slot'ların tamamını
+    keyword argüman olarak ister; eksik veya fazla slot TypeError verir.
+    """
+
+    __slots__ = ('text', 'slots', 'render', '_cache')
+
+    def __init__(self, text: str):
+        fragments, fields = parse(text)
+        self.text = text
+        self.slots: Tuple[str, ...] = tuple(dict.fromkeys(name for name, _, _ in fields))
+        self._cache: Dict[tuple, str] = {}
+        self.render: Callable[..., str] = compile_snippet(fragments, fields, self.slots, self._cache)
+
+    def __repr__(self) -> str:
+        return f"Snippet({self.text!r})"
+
+
+class SnippetShape:
+    """
+    Aynı şeklin dil varyantları: SnippetShape(python=..., java=..., javascript=...).
+    shape[language] o dilin Snippet'ı; varyantlar aynı slot'ları kullanır.
+    """
+
+    __slots__ = ('variants',)
+
+    def __init__(self, **variants: str):
+        self.variants: Dict[str, Snippet] = {language: Snippet(text) for language, text in variants.items()}
+        slots = {frozenset(snippet.slots) for snippet in self.variants.values()}
+        if len(slots) > 1:
+            raise ValueError(f"Varyantların slot'ları farklı: {sorted(map(sorted, slots))}")
+
+    def __getitem__(self, language: str) -> Snippet:
+        try:
+            return self.variants[language]
+        except KeyError:
+            raise KeyError(f"Şeklin {language} varyantı yok (var olanlar: {', '.join(self.variants)})") from None
+
+    @property
+    def languages(self) -> Tuple[str, ...]:
+        return tuple(self.variants)
+
+    def render(self, language: str, **values) -> str:
+        return self[language].render(**values)
+
+
+# ===== Diller arası ortak şekiller =====
+
+# x = 5; print(x)
+ASSIGN_PRINT = SnippetShape(
+    python="{var} = {value}\nprint({var})",
+    java="int {var} = {value};\nSystem.out.println({var});",
+    javascript="let {var} = {value};\nconsole.log({var});",
+)
+
+# a = 5; b = 3; print(a + b)
+BINARY_PRINT = SnippetShape(
+    python="{var1} = {val1}\n{var2} = {val2}\nprint({var1} {op} {var2})",
+    java="int {var1} = {val1};\nint {var2} = {val2};\nSystem.out.println({var1} {op} {var2});",
+    javascript="let {var1} = {val1};\nlet {var2} = {val2};\nconsole.log({var1} {op} {var2});",
+)
+
+# x = 7; if x > 5: print('A') else: print('B')
+IF_ELSE_PRINT = SnippetShape(
+    python="{var} = {value}\nif {var} {op} {threshold}:\n    print('{then}')\nelse:\n    print('{otherwise}')",
+    java=("int {var} = {value};\nif ({var} {op} {threshold}) {{\n    System.out.println(\"{then}\");\n"
+          "}} else {{\n    System.out.println(\"{otherwise}\");\n}}"),
+    javascript=("let {var} = {value};\nif ({var} {op} {threshold}) {{\n    console.log(\"{then}\");\n"
+                "}} else {{\n    console.log(\"{otherwise}\");\n}}"),
+)
+
+# 0'dan n-1'e kadar toplam
+SUM_LOOP = SnippetShape(
+    python="toplam = 0\nfor i in range({n}):\n    toplam += i\nprint(toplam)",
+    java="int sum = 0;\nfor (int i = 0; i < {n}; i++) {{\n    sum += i;\n}}\nSystem.out.println(sum);",
+    javascript="let sum = 0;\nfor (let i = 0; i < {n}; i++) {{\n    sum += i;\n}}\nconsole.log(sum);",
+)
+
+# n kez artan sayaç
+COUNTER_LOOP = SnippetShape(
+    python="sayac = 0\nfor i in range({n}):\n    sayac += 1\nprint(sayac)",
+    java="int count = 0;\nfor (int i = 0; i < {n}; i++) {{\n    count++;\n}}\nSystem.out.println(count);",
+    javascript="let count = 0;\nfor (let i = 0; i < {n}; i++) {{\n    count++;\n}}\nconsole.log(count);",
+)
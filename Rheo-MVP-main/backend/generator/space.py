@@ -0,0 +1,144 @@
+"""
+Template Parameter Space
+Her template metodu @params ile parametre uzayını (domain) tanımlar.
+
+- Normal üretimde eksik parametreler generator'ın RNG'si ile seçilir.
+- TemplateSpace bir generator'ın tüm template'lerini tek bir indekslenebilir
+  uzay olarak görür: tam (exhaustive) tarama ve tekrarsız tabakalı
+  (stratified) örnekleme indeks üzerinden yapılır, uzay belleğe açılmaz.
+"""
+
+import functools
+import itertools
+import math
+import random
+from collections.abc import Sequence
+from typing import Callable, Dict, Iterator, List, Tuple
+
+
+class ProductSpace(Sequence):
+    """Kartezyen çarpımın tembel (lazy) hali: product(range(1, 11), repeat=5) belleğe açılmaz."""
+
+    def __init__(self, *axes: Sequence):
+        self.axes = [axis if isinstance(axis, Sequence) else tuple(axis) for axis in axes]
+        self._len = math.prod(len(axis) for axis in self.axes)
+
+    @classmethod
+    def repeat(cls, axis: Sequence, times: int) -> 'ProductSpace':
+        return cls(*([axis] * times))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> tuple:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(index)
+        return tuple(_decode(index, self.axes))
+
+    def __iter__(self) -> Iterator[tuple]:
+        return itertools.product(*self.axes)
+
+
+def _decode(index: int, axes: List[Sequence]) -> List:
+    """Karışık tabanlı (mixed radix) indeks çözümü; son eksen en hızlı değişir."""
+    values = []
+    for axis in reversed(axes):
+        index, pos = divmod(index, len(axis))
+        values.append(axis[pos])
+    values.reverse()
+    return values
+
+
+def params(**domains) -> Callable:
+    """
+    Template'in parametre uzayını tanımlar:
+
+        @params(n=range(3, 7))
+        def generate_simple_range(self, n): ...
+
+    Çağrıda verilmeyen parametreler self.rng.choice ile domain'den seçilir.
+    """
+    domain = {
+        name: values if isinstance(values, Sequence) else tuple(values)
+        for name, values in domains.items()
+    }
+
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, **chosen):
+            for name, values in domain.items():
+                if name not in chosen:
+                    chosen[name] = self.rng.choice(values)
+            return func(self, **chosen)
+
+        wrapper.domain = domain
+        return wrapper
+
+    return decorate
+
+
+def space_size(template: Callable) -> int:
+    """Template'in farklı parametre kombinasyonu sayısı."""
+    return math.prod(len(values) for values in template.domain.values())
+
+
+class TemplateSpace:
+    """Bir generator'ın template listesinin birleşik, indekslenebilir parametre uzayı."""
+
+    def __init__(self, templates: List[Callable]):
+        self.templates = list(templates)
+        self.sizes = [space_size(t) for t in self.templates]
+        self.offsets = list(itertools.accumulate(self.sizes, initial=0))
+
+    def __len__(self) -> int:
+        return self.offsets[-1]
+
+    def params_at(self, index: int) -> Tuple[Callable, Dict]:
+        """Global indeksi (template, parametreler) çiftine çevirir."""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        # Template sayısı küçük; doğrusal arama yeterli
+        for template, offset, size in zip(self.templates, self.offsets, self.sizes):
+            if index < offset + size:
+                names = list(template.domain)
+                values = _decode(index - offset, list(template.domain.values()))
+                return template, dict(zip(names, values))
+        raise IndexError(index)
+
+    def render(self, index: int):
+        template, chosen = self.params_at(index)
+        return template(**chosen)
+
+    def stratified_indices(self, count: int, rng: random.Random) -> List[int]:
+        """
+        Her template bir tabaka (stratum) sayılır. count, tabakalara eşit
+        paylaştırılır; küçük tabakaların artan kotası diğerlerine aktarılır.
+        Her tabakadan tekrarsız örnekleme yapılır (rng.sample, uzayı açmaz).
+        """
+        quotas = _allocate(count, self.sizes)
+        indices = []
+        for offset, size, quota in zip(self.offsets, self.sizes, quotas):
+            picked = rng.sample(range(size), quota)
+            indices.extend(offset + i for i in sorted(picked))
+        return indices
+
+
+def _allocate(count: int, sizes: List[int]) -> List[int]:
+    """count'u kapasiteleri `sizes` olan tabakalara olabildiğince eşit böler."""
+    quotas = [0] * len(sizes)
+    remaining = min(count, sum(sizes))
+    open_strata = [i for i, size in enumerate(sizes) if size > 0]
+    while remaining > 0 and open_strata:
+        share, extra = divmod(remaining, len(open_strata))
+        still_open = []
+        for rank, i in enumerate(open_strata):
+            want = share + (1 if rank < extra else 0)
+            take = min(want, sizes[i] - quotas[i])
+            quotas[i] += take
+            remaining -= take
+            if quotas[i] < sizes[i]:
+                still_open.append(i)
+        open_strata = still_open
+    return quotas
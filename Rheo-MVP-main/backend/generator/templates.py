@@ -0,0 +1,198 @@
+"""
+Template Catalog
+Template metodları @template ile metadata taşır (topic, zorluk, ağırlık,
+dil, tahmini maliyet); generator'ların templates() listesi bu kayıtlardan
+türetilir, yeni bir template eklemek için listeyi düzenlemek gerekmez.
+
+    @template(topic="loops", difficulty=1, weight=2.0)
+    @params(n=range(3, 7))
+    def generate_simple_range(self, n): ...
+
+Ağırlıklı seçim Vose alias tablosuyla yapılır: tablo bir kez O(n) kurulur,
+her örnek O(1) (bir randrange + bir random).
+
+TemplateGenerator generator sınıflarının ortak temelidir: alt sınıf
+ID_PREFIX'i ve template metodlarını tanımlar, karışık / toplu üretim buradan
+gelir.
+
+TemplateQuery tüm generator'lar üzerinde "topic=loops, difficulty=2" gibi
+bir sorgunun template'lerini tek bir generator gibi sunar.
+"""
+
+import random
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .batch import generate_batch
+from .ids import QuestionIdFactory
+from .question import Question
+from .registry import generator_names, load_generator
+
+
+class TemplateMeta(NamedTuple):
+    topic: str
+    difficulty: int
+    weight: float = 1.0
+    language: Optional[str] = None   # None: generator'ın dili
+    cost: float = 1.0                # göreli üretim maliyeti (planlama / raporlama için)
+    advanced: bool = False           # yalnızca include_hard ile seçilir
+
+
+def template(topic: str, difficulty: int, weight: float = 1.0, language: Optional[str] = None,
+             cost: float = 1.0, advanced: bool = False) -> Callable:
+    """Template metodunu metadata ile işaretler (metod değişmeden döner)."""
+    if weight <= 0:
+        raise ValueError(f"weight pozitif olmalı: {weight}")
+    meta = TemplateMeta(topic, difficulty, weight, language, cost, advanced)
+
+    def decorate(func: Callable) -> Callable:
+        func.meta = meta
+        return func
+
+    return decorate
+
+
+def template_methods(cls: type) -> List[Tuple[str, TemplateMeta]]:
+    """Sınıfın @template metodları: önce temel, sonra ileri seviye; her grup tanım sırasıyla."""
+    cached = cls.__dict__.get('_template_methods')
+    if cached is None:
+        found = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if hasattr(value, 'meta') and isinstance(value.meta, TemplateMeta):
+                    found[name] = value.meta
+        ordered = sorted(found.items(), key=lambda item: item[1].advanced)
+        cls._template_methods = cached = ordered
+    return cached
+
+
+def bound_templates(gen, include_hard: bool = True) -> List[Callable[..., Question]]:
+    """Generator örneğinin template metodları (include_hard=False ileri seviyeleri atar)."""
+    return [
+        getattr(gen, name)
+        for name, meta in template_methods(type(gen))
+        if include_hard or not meta.advanced
+    ]
+
+
+class AliasTable:
+    """Vose alias yöntemi: ağırlıklı ayrık dağılımdan O(1) örnekleme."""
+
+    def __init__(self, weights: Sequence[float]):
+        n = len(weights)
+        total = float(sum(weights))
+        if n == 0 or total <= 0:
+            raise ValueError("En az bir pozitif ağırlık gerekli")
+        scaled = [w * n / total for w in weights]
+        # Eşit ağırlıklarda tek randrange yeter (rng.choice ile aynı akış)
+        self.uniform = len(set(weights)) == 1
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Kalanlar kayan nokta artığı; olasılıkları 1
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng: random.Random) -> int:
+        i = rng.randrange(len(self.prob))
+        if self.uniform:
+            return i
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+def sample_templates(templates: List[Callable[..., Question]], count: int,
+                     rng: random.Random) -> Iterator[Question]:
+    """Template'leri @template ağırlıklarına göre seçip `count` soru üretir."""
+    table = AliasTable([t.meta.weight for t in templates])
+    for _ in range(count):
+        yield templates[table.sample(rng)]()
+
+
+class TemplateGenerator:
+    """
+    Template tabanlı generator'ların ortak temeli. Alt sınıf ID_PREFIX'i
+    (soru ID'lerinin öneki) ve @template metodlarını tanımlar.
+    """
+
+    ID_PREFIX = ''
+
+    def __init__(self, rng: Optional[random.Random] = None, ids: Optional[QuestionIdFactory] = None):
+        # Her generator kendi RNG'sini kullanır; seed verilirse çıktı tekrarlanabilir
+        self.rng = rng or random.Random()
+        self.ids = ids or QuestionIdFactory()
+
+    def _generate_id(self, difficulty: int) -> str:
+        """Unique question ID üretir: variables_1_3fa9c2c4_17"""
+        return self.ids.next_id(self.ID_PREFIX, difficulty)
+
+    def templates(self, include_hard: bool = False) -> List[Callable[..., Question]]:
+        """@template ile işaretli metodlar; ileri seviyeler yalnızca include_hard ile."""
+        return bound_templates(self, include_hard)
+
+    def iter_generate(self, count: int = 10, include_hard: bool = False) -> Iterator[Question]:
+        """Belirtilen sayıda karışık soruyu template ağırlıklarına göre tek tek üretir (lazy)."""
+        return sample_templates(self.templates(include_hard), count, self.rng)
+
+    def generate(self, count: int = 10, include_hard: bool = False) -> List[Question]:
+        """Belirtilen sayıda karışık soru üretir."""
+        return list(self.iter_generate(count, include_hard))
+
+    def generate_batch(self, template: Union[str, Callable[..., Question]], count: int) -> List[Question]:
+        """Tek template'ten toplu üretim (NumPy ve çekirdek varsa vektörel)."""
+        return generate_batch(self, template, count)
+
+
+class TemplateQuery:
+    """
+    Tüm generator'ların template'lerinden topic / zorluk / dil filtresine
+    uyanları tek bir generator gibi sunar (templates, iter_generate, generate).
+    Generator örnekleri aynı RNG'yi ve ID üretecini paylaşır. `generator`
+    verilirse yalnızca o görevin template'leri (ör. zorluk kotası için) alınır.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None, ids: Optional[QuestionIdFactory] = None,
+                 language: str = 'all', topic: Optional[str] = None, difficulty: Optional[int] = None,
+                 generator: Optional[str] = None):
+        self.rng = rng or random.Random()
+        self.ids = ids or QuestionIdFactory()
+        self.entries: List[Tuple[str, Callable[..., Question], TemplateMeta]] = []
+        # Tek görevde generator_names'e bakılmaz: worker'da eklentiler keşfedilmemiş olabilir
+        names = [(language, generator)] if generator is not None else generator_names(language)
+        for lang, name in names:
+            gen = load_generator(name)(rng=self.rng, ids=self.ids)
+            for method, meta in template_methods(type(gen)):
+                if topic is not None and meta.topic != topic:
+                    continue
+                if difficulty is not None and meta.difficulty != difficulty:
+                    continue
+                self.entries.append((meta.language or lang, getattr(gen, method), meta))
+
+    def templates(self, include_hard: bool = False) -> List[Callable[..., Question]]:
+        return [func for _, func, meta in self.entries if include_hard or not meta.advanced]
+
+    def iter_generate(self, count: int = 10, include_hard: bool = False) -> Iterator[Question]:
+        templates = self.templates(include_hard)
+        if not templates:
+            raise ValueError("Sorguya uyan template yok")
+        return sample_templates(templates, count, self.rng)
+
+    def generate(self, count: int = 10, include_hard: bool = False) -> List[Question]:
+        return list(self.iter_generate(count, include_hard))
+
+
+def catalog(language: str = 'all') -> List[Dict]:
+    """Kayıtlı tüm template'lerin metadata tablosu (--list-templates)."""
+    rows = []
+    for lang, name in generator_names(language):
+        for method, meta in template_methods(load_generator(name)):
+            rows.append({'generator': name, 'template': method, **meta._asdict(),
+                         'language': meta.language or lang})
+    return rows
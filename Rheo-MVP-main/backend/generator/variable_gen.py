@@ -6,41 +6,21 @@ Variable Assignment Question Generator
 - Değişken yeniden atama
 """
 
-import random
-import time
-from dataclasses import dataclass
 from typing import List
 
+from .batch import Batch, as_text, concat_digits, neighbour_columns, pick_distinct, vectorized
+from .distractors import distractors
+from .question import PREDICTION_TEXT, Question
+from .snippets import ASSIGN_PRINT, BINARY_PRINT, Snippet
+from .space import params
+from .templates import TemplateGenerator, template
 
-@dataclass
-class Question:
-    id: str
-    type: str
-    difficulty: int
-    topic: str
-    code_snippet: str
-    question_text: str
-    correct_answer: str
-    wrong_options: List[str]
-    explanation: str
-
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "type": self.type,
-            "difficulty": self.difficulty,
-            "topic": self.topic,
-            "code_snippet": self.code_snippet,
-            "question_text": self.question_text,
-            "correct_answer": self.correct_answer,
-            "wrong_options": self.wrong_options,
-            "explanation": self.explanation
-        }
-
-
-class VariableGenerator:
+
+class VariableGenerator(TemplateGenerator):
     """Değişken atama ve aritmetik işlem soruları üretir."""
 
+    ID_PREFIX = "variables"
+
     VARIABLE_NAMES = ['a', 'b', 'x', 'y', 'n', 'm', 'num', 'val']
     OPERATIONS = [
         ('+', 'toplar', lambda a, b: a + b),
@@ -48,56 +28,49 @@ class VariableGenerator:
         ('*', 'çarpar', lambda a, b: a * b),
     ]
 
-    def __init__(self):
-        self.question_count = 0
-
-    def _generate_id(self, difficulty: int) -> str:
-        """Unique question ID üretir: variables_1_1707234567"""
-        self.question_count += 1
-        timestamp = int(time.time() * 1000) % 100000
-        return f"variables_{difficulty}_{timestamp}_{self.question_count}"
+    # Kod ve açıklama şekilleri (bkz. snippets.py)
+    ASSIGNMENT_CODE = ASSIGN_PRINT['python']
+    ASSIGNMENT_EXPLANATION = Snippet("print() fonksiyonu {var} değişkeninin değerini ekrana basar.")
+    ARITHMETIC_CODE = BINARY_PRINT['python']
+    ARITHMETIC_EXPLANATION = Snippet("Python'da {op} operatörü sayıları {op_name}.")
+    REASSIGNMENT_CODE = Snippet("{var} = {initial}\n{var} = {var} {op} {delta}\nprint({var})")
+    REASSIGNMENT_EXPLANATION = Snippet("{var} önce {initial} değerini alıyor, sonra {op} {delta} işlemiyle {final} oluyor.")
 
     def _generate_wrong_options(
         self, correct: int, var1_val: int, var2_val: int, operation: str
     ) -> List[str]:
-        """Akla yatkın yanlış şıklar üretir."""
-        wrong = set()
+        """Akla yatkın yanlış şıklar üretir; adaylar arasından rastgele 3 tanesi seçilir."""
+        mistakes = []
 
         # String concatenation hatası (çok yaygın yeni başlayan hatası)
         if operation == '+':
-            wrong.add(f"{var1_val}{var2_val}")
+            mistakes.append(f"{var1_val}{var2_val}")
 
         # Off-by-one hataları
-        wrong.add(str(correct + 1))
-        wrong.add(str(correct - 1))
+        mistakes += [correct + 1, correct - 1]
 
         # Operasyon karışıklığı
         if operation == '+':
-            wrong.add(str(var1_val * var2_val))
+            mistakes.append(var1_val * var2_val)
         elif operation == '*':
-            wrong.add(str(var1_val + var2_val))
+            mistakes.append(var1_val + var2_val)
         elif operation == '-':
-            wrong.add(str(var2_val - var1_val))  # Ters çıkarma
+            mistakes.append(var2_val - var1_val)  # Ters çıkarma
 
-        # correct değerini çıkar ve 3 tane seç
-        wrong.discard(str(correct))
-        wrong_list = list(wrong)
-        random.shuffle(wrong_list)
-        return wrong_list[:3]
+        return distractors(correct, mistakes, rng=self.rng)
 
-    def generate_simple_assignment(self) -> Question:
+    @template(topic="variables", difficulty=1)
+    @params(var_name=VARIABLE_NAMES, value=range(1, 21))
+    def generate_simple_assignment(self, var_name: str, value: int) -> Question:
         """Basit değişken atama sorusu: a = 5; print(a)"""
-        var_name = random.choice(self.VARIABLE_NAMES)
-        value = random.randint(1, 20)
-
-        code = f"{var_name} = {value}\nprint({var_name})"
+        code = self.ASSIGNMENT_CODE.render(var=var_name, value=value)
         correct = str(value)
 
-        wrong = [
-            str(value + 1),
-            str(value - 1),
-            "Error"
-        ]
+        wrong = distractors(correct, [
+            value + 1,
+            value - 1,
+            var_name,  # Değer yerine değişken adı
+        ])
 
         return Question(
             id=self._generate_id(1),
@@ -105,24 +78,26 @@ class VariableGenerator:
             difficulty=1,
             topic="variables",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=correct,
             wrong_options=wrong,
-            explanation=f"print() fonksiyonu {var_name} değişkeninin değerini ekrana basar."
+            explanation=self.ASSIGNMENT_EXPLANATION.render(var=var_name)
         )
 
-    def generate_arithmetic(self) -> Question:
+    @template(topic="variables", difficulty=1)
+    @params(
+        var1=VARIABLE_NAMES[:4],
+        var2=VARIABLE_NAMES[4:],  # İki liste ayrık, var1 ile çakışmaz
+        val1=range(2, 16),
+        val2=range(2, 11),
+        op=OPERATIONS,
+    )
+    def generate_arithmetic(self, var1: str, var2: str, val1: int, val2: int, op: tuple) -> Question:
         """Aritmetik işlem sorusu: a = 5; b = 3; print(a + b)"""
-        var1 = random.choice(self.VARIABLE_NAMES[:4])
-        var2 = random.choice([v for v in self.VARIABLE_NAMES[4:] if v != var1])
-        
-        val1 = random.randint(2, 15)
-        val2 = random.randint(2, 10)
-
-        op_symbol, op_name, op_func = random.choice(self.OPERATIONS)
+        op_symbol, op_name, op_func = op
         result = op_func(val1, val2)
 
-        code = f"{var1} = {val1}\n{var2} = {val2}\nprint({var1} {op_symbol} {var2})"
+        code = self.ARITHMETIC_CODE.render(var1=var1, val1=val1, var2=var2, val2=val2, op=op_symbol)
 
         wrong = self._generate_wrong_options(result, val1, val2, op_symbol)
 
@@ -132,28 +107,67 @@ class VariableGenerator:
             difficulty=1,
             topic="variables",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(result),
             wrong_options=wrong,
-            explanation=f"Python'da {op_symbol} operatörü sayıları {op_name}."
+            explanation=self.ARITHMETIC_EXPLANATION.render(op=op_symbol, op_name=op_name)
         )
 
-    def generate_reassignment(self) -> Question:
-        """Değişken yeniden atama: a = 5; a = a + 3; print(a)"""
-        var = random.choice(self.VARIABLE_NAMES[:4])
-        initial = random.randint(3, 10)
-        delta = random.randint(2, 5)
+    @vectorized('generate_arithmetic')
+    def _arithmetic_batch(self, batch: Batch) -> List[Question]:
+        """generate_arithmetic'in vektörel hali; şıklar _generate_wrong_options kurallarıyla."""
+        np = batch.np
+        val1, val2, op = batch.params['val1'], batch.params['val2'], batch.params['op']
+        result = np.choose(op, [val1 + val2, val1 - val2, val1 * val2])
+        # Operasyon karışıklığı: + -> *, - -> ters çıkarma, * -> +
+        swapped = np.choose(op, [val1 * val2, val2 - val1, val1 + val2])
+        mistakes = [concat_digits(np, val1, val2), result + 1, result - 1, swapped]
+        candidates = np.stack(mistakes + neighbour_columns(np, result), axis=1)
+        valid = candidates != result[:, None]
+        valid[:, 0] &= op == 0  # String birleştirme yanılgısı yalnızca + için
+        wrong = pick_distinct(np, candidates, valid, rng=batch.rng, shuffled=len(mistakes))
+
+        symbols = [self.OPERATIONS[i][0] for i in batch.params['op'].tolist()]
+        explanations = {s: self.ARITHMETIC_EXPLANATION.render(op=s, op_name=name) for s, name, _ in self.OPERATIONS}
+        code = self.ARITHMETIC_CODE.render
+        return [
+            Question(
+                id=qid,
+                type="prediction",
+                difficulty=1,
+                topic="variables",
+                code_snippet=code(var1=var1, val1=v1, var2=var2, val2=v2, op=symbol),
+                question_text=PREDICTION_TEXT,
+                correct_answer=answer,
+                wrong_options=options,
+                explanation=explanations[symbol]
+            )
+            for qid, var1, var2, v1, v2, symbol, answer, options in zip(
+                self.ids.next_ids(self.ID_PREFIX, 1, batch.n), batch.take('var1'), batch.take('var2'),
+                val1.tolist(), val2.tolist(), symbols, as_text(result), wrong
+            )
+        ]
 
-        op_symbol, _, op_func = random.choice(self.OPERATIONS[:2])  # Sadece + ve -
+    @template(topic="variables", difficulty=2)
+    @params(
+        var=VARIABLE_NAMES[:4],
+        initial=range(3, 11),
+        delta=range(2, 6),
+        op=OPERATIONS[:2],  # Sadece + ve -
+    )
+    def generate_reassignment(self, var: str, initial: int, delta: int, op: tuple) -> Question:
+        """Değişken yeniden atama: a = 5; a = a + 3; print(a)"""
+        op_symbol, _, op_func = op
         final = op_func(initial, delta)
 
-        code = f"{var} = {initial}\n{var} = {var} {op_symbol} {delta}\nprint({var})"
+        code = self.REASSIGNMENT_CODE.render(var=var, initial=initial, op=op_symbol, delta=delta)
 
-        wrong = [
-            str(initial),  # Güncelleme unutuldu
-            str(delta),    # İlk değer yerine delta
-            str(initial + delta + 1)  # Off-by-one
-        ]
+        wrong = distractors(final, [
+            initial,  # Güncelleme unutuldu
+            initial - delta if op_symbol == '+' else initial + delta,  # İşlem ters uygulandı
+            delta,  # İlk değer yerine delta
+            final + 1,  # Off-by-one
+        ])
 
         return Question(
             id=self._generate_id(2),
@@ -161,23 +175,9 @@ class VariableGenerator:
             difficulty=2,
             topic="variables",
             code_snippet=code,
-            question_text="Bu kodun çıktısı nedir?",
+            question_text=PREDICTION_TEXT,
             correct_answer=str(final),
             wrong_options=wrong,
-            explanation=f"{var} önce {initial} değerini alıyor, sonra {op_symbol} {delta} işlemiyle {final} oluyor."
+            explanation=self.REASSIGNMENT_EXPLANATION.render(var=var, initial=initial, op=op_symbol,
+                                                             delta=delta, final=final)
         )
-
-    def generate(self, count: int = 10) -> List[Question]:
-        """Belirtilen sayıda karışık soru üretir."""
-        generators = [
-            self.generate_simple_assignment,
-            self.generate_arithmetic,
-            self.generate_reassignment,
-        ]
-
-        questions = []
-        for _ in range(count):
-            gen_func = random.choice(generators)
-            questions.append(gen_func())
-
-        return questions
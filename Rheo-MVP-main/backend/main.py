@@ -4,101 +4,620 @@ Rheo Question Generator - Main Script
 Multi-language support: Python, Java, JavaScript
 
 Kullanım:
-    python main.py [--count N] [--language LANG]
+    python main.py [--count N] [--language LANG] [--format json|ndjson] [--stdout] [--sharded] [--workers N] [--seed S]
 
 Örnek:
     python main.py --count 50 --language python
     python main.py --count 30 --language java
     python main.py --count 30 --language javascript
     python main.py --count 20 --language all
+    python main.py --count 100000 --format ndjson --stdout | importer
+    python main.py --count 100000 --format ndjson --workers 8
+    python main.py --count 20 --language all --seed 42
+    python main.py --exhaustive --language python --format ndjson
+    python main.py --stratified --count 1000 --language javascript --hard
+    python main.py --input ../rheo_app/assets/questions.json --format columnar
+    python main.py --count 50 --language all --sharded --seed 42
+    python main.py --count 50 --language java --dry-run
+    python main.py --count 40 --topic loops --difficulty 2
+    python main.py --list-templates
+    python main.py --count 30 --language all --elo 1350
+    python main.py --count 40 --difficulty-mix 50,30,20
+    python main.py --count 1000 --language python --validate drop
+    python main.py --input ../rheo_app/assets/questions.json --format ndjson --stdout --validate --trust-input
+    python main.py --count 20000 --format ndjson --profile --profile-out output/profile.collapsed
 """
 
 import json
+import os
+import sys
 import argparse
+import itertools
 import random
+from collections import deque
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, IO, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from generator import (
-    VariableGenerator, 
-    IfElseGenerator, 
-    LoopGenerator,
-    JavaGenerator,
-    JavaScriptGenerator
+    discover_plugins,
+    generator_names,
+    load_generator,
+    plugin_names,
+    QuestionIdFactory,
+    make_namespace,
+    FingerprintIndex,
+    TemplateQuery,
+    TemplateSpace,
+    TemplateSpaceExhausted,
+    catalog,
+    filter_unique,
+    take_unique
 )
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
-def generate_python_questions(count_per_topic: int = 10, include_hard: bool = False) -> list:
-    """Python soruları üretir."""
-    generators = [
-        VariableGenerator(),
-        IfElseGenerator(),
-        LoopGenerator(),
+
+# Profil ve doğrulama modülleri yalnızca --profile / --validate ile yüklenir (açılış süresi)
+profiling = None
+
+
+def stage(name: str):
+    """--profile açıksa aşamayı ölçen, değilse boş bağlam yöneticisi."""
+    return profiling.stage(name) if profiling is not None else nullcontext()
+
+
+def log(*args) -> None:
+    """Durum mesajlarını stderr'e yazar (stdout soru akışına ayrılmıştır)."""
+    print(*args, file=sys.stderr)
+
+
+LANGUAGE_LABELS = {
+    'python': "🐍 Python",
+    'java': "☕ Java",
+    'javascript': "🟨 JavaScript",
+}
+
+# Java/JS generator'ları tek başına üç topic'i kapsar
+TOPICS_PER_GENERATOR = {'java': 3, 'javascript': 3}
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_MAX_MISSES = 10000
+
+
+GENERATION_MODES = ('random', 'exhaustive', 'stratified')
+
+# --topic / --difficulty: tüm dillerin uyan template'lerinden tek görev
+QUERY_TASK = 'query'
+
+DIFFICULTY_LEVELS = (1, 2, 3)
+
+# ELO -> (seviye 1, 2, 3) payları; aradaki değerler doğrusal ara değerlenir.
+# Seviye 3 (yalnızca ileri seviye template'ler) 1200 altında hiç seçilmez (--hard eşiği).
+ELO_MIX_POINTS = [
+    (800, (1.0, 0.0, 0.0)),
+    (1000, (0.7, 0.3, 0.0)),
+    (1200, (0.45, 0.55, 0.0)),
+    (1400, (0.25, 0.5, 0.25)),
+    (1600, (0.1, 0.45, 0.45)),
+    (1800, (0.05, 0.35, 0.6)),
+]
+HARD_ELO = 1200
+
+
+class ChunkJob(NamedTuple):
+    """
+    Bir worker'a gönderilen iş parçası: tek generator, ardışık soru aralığı.
+    exhaustive modda [start, start + count) template uzayındaki indekslerdir;
+    stratified modda seçilen indeksler `indices` ile taşınır.
+    """
+    language: str
+    generator: str
+    start: int
+    count: int
+    include_hard: bool
+    seed: str
+    id_namespace: str
+    mode: str = 'random'
+    indices: Tuple[int, ...] = ()
+    topic: Optional[str] = None
+    difficulty: Optional[int] = None
+
+
+def parse_difficulty_mix(text: str) -> Tuple[float, ...]:
+    """'50,30,20' veya '0.5,0.3,0.2' -> seviye 1-3 için normalize paylar."""
+    try:
+        parts = [float(p) for p in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"sayı listesi bekleniyor: {text!r}")
+    if len(parts) != len(DIFFICULTY_LEVELS) or any(p < 0 for p in parts) or sum(parts) <= 0:
+        raise argparse.ArgumentTypeError("üç negatif olmayan pay gerekli (seviye 1,2,3), ör. 50,30,20")
+    total = sum(parts)
+    return tuple(p / total for p in parts)
+
+
+def elo_mix(elo: float) -> Tuple[float, ...]:
+    """ELO_MIX_POINTS üzerinde doğrusal ara değerleme (uçlarda sabit)."""
+    if elo <= ELO_MIX_POINTS[0][0]:
+        return ELO_MIX_POINTS[0][1]
+    for (lo, lo_mix), (hi, hi_mix) in zip(ELO_MIX_POINTS, ELO_MIX_POINTS[1:]):
+        if elo <= hi:
+            t = (elo - lo) / (hi - lo)
+            return tuple(a + (b - a) * t for a, b in zip(lo_mix, hi_mix))
+    return ELO_MIX_POINTS[-1][1]
+
+
+def level_quotas(total: int, mix: Tuple[float, ...], available: Iterable[int]) -> Dict[int, int]:
+    """
+    total soruyu seviyelere en büyük kalan yöntemiyle tam sayı olarak böler.
+    Generator'da template'i olmayan seviyelerin payı diğerlerine orantılı dağıtılır.
+    """
+    shares = {level: mix[level - 1] for level in DIFFICULTY_LEVELS if level in set(available)}
+    weight = sum(shares.values())
+    if weight <= 0:
+        return {}
+    exact = {level: total * share / weight for level, share in shares.items()}
+    quotas = {level: int(value) for level, value in exact.items()}
+    # Kalan birimler en büyük kesirli kısma; eşitlikte düşük seviye önce
+    by_remainder = sorted(exact, key=lambda level: (-(exact[level] - quotas[level]), level))
+    for level in by_remainder[:total - sum(quotas.values())]:
+        quotas[level] += 1
+    return {level: n for level, n in quotas.items() if n > 0}
+
+
+def plan_tasks(language: str = 'all', count: int = 10, topic: Optional[str] = None,
+               difficulty: Optional[int] = None) -> List[Tuple[str, str, str, int]]:
+    """
+    (etiket, dil, generator, soru sayısı) listesini sabit sırada döner.
+    topic veya difficulty verilirse tek bir sorgu görevi döner; count
+    toplam soru sayısıdır ve template ağırlıklarına göre dağıtılır.
+    """
+    if topic is not None or difficulty is not None:
+        label = f"🎯 {topic or 'tüm topic'} / zorluk {difficulty or 'tümü'}"
+        return [(label, language, QUERY_TASK, count)]
+    return [
+        (LANGUAGE_LABELS.get(lang, lang), lang, name, count * TOPICS_PER_GENERATOR.get(name, 1))
+        for lang, name in generator_names(language)
     ]
-    
-    all_questions = []
-    for gen in generators:
-        questions = gen.generate(count=count_per_topic)
-        for q in questions:
-            q_dict = q.to_dict()
-            q_dict['language'] = 'python'
-            all_questions.append(q_dict)
-    
-    return all_questions
 
 
-def generate_java_questions(count: int = 30, include_hard: bool = False) -> list:
-    """Java soruları üretir."""
-    gen = JavaGenerator()
-    questions = gen.generate(count=count, include_hard=include_hard)
-    return [q.to_dict() for q in questions]
+def build_generator(generator: str, language: str, rng: Optional[random.Random] = None,
+                    ids: Optional[QuestionIdFactory] = None, topic: Optional[str] = None,
+                    difficulty: Optional[int] = None):
+    """Görevin generator'ı; sorgu görevi veya zorluk kotası için filtreli TemplateQuery."""
+    if generator == QUERY_TASK:
+        return TemplateQuery(rng=rng, ids=ids, language=language, topic=topic, difficulty=difficulty)
+    if difficulty is not None:
+        return TemplateQuery(rng=rng, ids=ids, language=language, difficulty=difficulty, generator=generator)
+    return load_generator(generator)(rng=rng, ids=ids)
+
+
+def task_space(language: str, generator: str, include_hard: bool, topic: Optional[str] = None,
+               difficulty: Optional[int] = None) -> TemplateSpace:
+    """Görevin birleşik parametre uzayı (yalnızca boyut/indeks için, soru üretmez)."""
+    gen = build_generator(generator, language, topic=topic, difficulty=difficulty)
+    return TemplateSpace(gen.templates(include_hard))
+
+
+def task_levels(language: str, generator: str, total: int, include_hard: bool,
+                topic: Optional[str], difficulty: Optional[int],
+                mix: Optional[Tuple[float, ...]]) -> List[Tuple[Optional[int], int]]:
+    """
+    Görevin (zorluk, soru sayısı) alt görevleri. mix yoksa tek alt görev;
+    varsa görevin üretebildiği seviyelere göre tam kotalar.
+    """
+    if mix is None:
+        return [(difficulty, total)]
+    gen = build_generator(generator, language, topic=topic)
+    available = {t.meta.difficulty for t in gen.templates(include_hard)}
+    return sorted(level_quotas(total, mix, available).items())
+
+
+def iter_chunk_jobs(language: str, generator: str, total: int, include_hard: bool,
+                    chunk_size: int, base_seed: int, id_namespace: str,
+                    endless: bool = False, mode: str = 'random',
+                    indices: Optional[List[int]] = None, topic: Optional[str] = None,
+                    difficulty: Optional[int] = None) -> Iterator[ChunkJob]:
+    """
+    Bir görevi chunk_size'lık parçalara böler. Her parçanın seed'i
+    (base_seed, generator, parça no) üçlüsünden türetilir; böylece çıktı
+    worker sayısından bağımsız olarak aynı kalır. endless=True ise
+    (tekrar eleme modu) tüketici durana kadar yeni parça üretir.
+    """
+    # Zorluk kotası alt görevleri aynı generator'ın farklı RNG akışlarını kullanır
+    task = generator if difficulty is None else f"{generator}@{difficulty}"
+    for index in itertools.count():
+        start = index * chunk_size
+        if not endless and start >= total:
+            return
+        count = chunk_size if endless else min(chunk_size, total - start)
+        yield ChunkJob(
+            language=language,
+            generator=generator,
+            start=start,
+            count=count,
+            include_hard=include_hard,
+            seed=f"{base_seed}:{task}:{index}",
+            id_namespace=id_namespace,
+            mode=mode,
+            indices=tuple(indices[start:start + count]) if indices is not None else (),
+            topic=topic,
+            difficulty=difficulty,
+        )
+
 
+def run_chunk(job: ChunkJob) -> List[dict]:
+    """Tek bir parçayı üretir. Worker süreçlerinde çalışır, bu yüzden top-level."""
+    profiler = profiling.active() if profiling is not None else None
+    # ID sayacı parçanın başlangıcından devam eder; farklı süreçlerde de çakışmaz
+    with stage('construct'):
+        gen = build_generator(
+            job.generator, job.language,
+            rng=random.Random(job.seed),
+            ids=QuestionIdFactory(job.id_namespace, start=job.start),
+            topic=job.topic,
+            difficulty=job.difficulty,
+        )
+    if profiler is not None:
+        profiler.instrument(gen)
 
-def generate_javascript_questions(count: int = 30, include_hard: bool = False) -> list:
-    """JavaScript soruları üretir."""
-    gen = JavaScriptGenerator()
-    questions = gen.generate(count=count, include_hard=include_hard)
+    if job.mode == 'random':
+        questions = gen.iter_generate(count=job.count, include_hard=job.include_hard)
+    else:
+        space = TemplateSpace(gen.templates(job.include_hard))
+        positions = job.indices if job.mode == 'stratified' else range(job.start, job.start + job.count)
+        questions = (space.render(i) for i in positions)
+
+    if profiler is not None:
+        return [profiler.call('to_dict', q.to_dict) for q in questions]
     return [q.to_dict() for q in questions]
 
 
-def generate_questions(language: str = 'all', count: int = 10, include_hard: bool = False) -> list:
+def _ordered_map(executor: 'Executor', jobs: Iterable[ChunkJob], window: int) -> Iterator[List[dict]]:
+    """executor.map gibi sırayı korur ama en fazla `window` parça bekletir (sabit bellek)."""
+    pending = deque()
+    try:
+        for job in jobs:
+            pending.append(executor.submit(run_chunk, job))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Tüketici erken durduysa (ör. yeterli tekil soru bulundu) kalan işleri iptal et
+        for future in pending:
+            future.cancel()
+
+
+def iter_questions(language: str = 'all', count: int = 10, include_hard: bool = False,
+                   workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                   base_seed: Optional[int] = None, index: Optional[FingerprintIndex] = None,
+                   max_misses: int = DEFAULT_MAX_MISSES, mode: str = 'random',
+                   topic: Optional[str] = None, difficulty: Optional[int] = None,
+                   mix: Optional[Tuple[float, ...]] = None) -> Iterator[dict]:
+    """
+    Belirtilen dil için soruları üretildikleri anda verir (karıştırma yok).
+    Bellek kullanımı --count'tan bağımsızdır; NDJSON akışı bunu kullanır.
+    workers > 1 ise parçalar ProcessPoolExecutor'a dağıtılır, sonuçlar
+    görev ve parça sırasıyla birleştirilir.
+    index verilirse içerik tekrarları elenir ve her görev istenen sayıda
+    tekil soruya ulaşana kadar yeni parçalar üretilir.
+
+    mode='exhaustive' her generator'ın tüm parametre uzayını tarar (count
+    yok sayılır); mode='stratified' count kadar soruyu template'ler arasında
+    eşit paylaştırıp tekrarsız örnekler.
+
+    topic / difficulty verilirse tüm dillerin uyan template'lerinden count
+    soru, @template ağırlıklarıyla seçilerek üretilir.
+
+    mix (seviye 1-3 payları) verilirse her görev, sayısını seviyelere tam
+    kotalarla böler ve her seviyeyi yalnızca o zorluktaki template'lerden
+    doldurur; üretip elemeye gerek kalmaz.
+    """
+    if base_seed is None:
+        base_seed = random.getrandbits(64)
+
+    # Aynı seed + içeriği değiştiren seçenekler aynı ID'leri verir; farklı çalıştırmalar
+    # farklı namespace alır
+    # Template kodu değişirse aynı seed farklı içerik üretir: ID'ler de değişmeli
+    key = f"{base_seed}:{language}:{count}:{include_hard}:{chunk_size}:{mode}:{generator_version()}"
+    if topic is not None or difficulty is not None:
+        key += f":{topic}:{difficulty}"
+    if mix is not None:
+        key += f":{','.join(f'{share:.6f}' for share in mix)}"
+    if index is not None:
+        # --unique / --dedupe-index: elenen sorular, dolayısıyla çıktı, indeksteki bilinenlere bağlı
+        key += f":unique:{len(index)}"
+    plugins = plugin_names(language)
+    if plugins:
+        # --plugins ile plana giren eklenti görevleri
+        key += f":plugins:{','.join(plugins)}"
+    id_namespace = make_namespace(key)
+
+    executor = None
+    if workers > 1:
+        # Tek süreçli çalıştırmalarda multiprocessing'i hiç yükleme
+        from concurrent.futures import ProcessPoolExecutor
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    # Dil bazında sayım: aynı etiketli görevler art arda gelir
+    produced = {}
+    try:
+        for label, lang, name, task_total in plan_tasks(language, count, topic, difficulty):
+            for level, total in task_levels(lang, name, task_total, include_hard, topic, difficulty, mix):
+                task = name if level is None else f"{name}@{level}"
+                indices = None
+                if mode == 'exhaustive':
+                    total = len(task_space(lang, name, include_hard, topic, level))
+                elif mode == 'stratified':
+                    indices = task_space(lang, name, include_hard, topic, level).stratified_indices(
+                        total, random.Random(f"{base_seed}:{task}:stratified")
+                    )
+                    total = len(indices)
+
+                jobs = iter_chunk_jobs(
+                    lang, name, total, include_hard, chunk_size, base_seed, id_namespace,
+                    endless=index is not None and mode == 'random', mode=mode, indices=indices,
+                    topic=topic, difficulty=level
+                )
+                if executor is not None:
+                    chunks = _ordered_map(executor, jobs, window=workers * 2)
+                else:
+                    chunks = map(run_chunk, jobs)
+
+                questions = itertools.chain.from_iterable(chunks)
+                if index is not None and mode == 'random':
+                    questions = take_unique(questions, total, index, max_misses, label=task)
+                elif index is not None:
+                    # Uzay taraması zaten sonlu; yalnızca tekrarları at
+                    questions = filter_unique(questions, index)
+
+                for q in questions:
+                    produced[label] = produced.get(label, 0) + 1
+                    yield q
+
+                if executor is not None:
+                    chunks.close()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    for label, total in produced.items():
+        log(f"{label}: {total} soru")
+
+
+def generate_questions(language: str = 'all', count: int = 10, include_hard: bool = False,
+                       workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       base_seed: Optional[int] = None, index: Optional[FingerprintIndex] = None,
+                       max_misses: int = DEFAULT_MAX_MISSES, mode: str = 'random',
+                       topic: Optional[str] = None, difficulty: Optional[int] = None,
+                       mix: Optional[Tuple[float, ...]] = None) -> list:
     """Belirtilen dil için soru üretir."""
-    all_questions = []
-    
-    if language in ('python', 'all'):
-        questions = generate_python_questions(count_per_topic=count, include_hard=include_hard)
-        all_questions.extend(questions)
-        print(f"🐍 Python: {len(questions)} soru")
-    
-    if language in ('java', 'all'):
-        questions = generate_java_questions(count=count * 3, include_hard=include_hard)
-        all_questions.extend(questions)
-        print(f"☕ Java: {len(questions)} soru")
-    
-    if language in ('javascript', 'all'):
-        questions = generate_javascript_questions(count=count * 3, include_hard=include_hard)
-        all_questions.extend(questions)
-        print(f"🟨 JavaScript: {len(questions)} soru")
-    
-    random.shuffle(all_questions)
+    if base_seed is None:
+        base_seed = random.getrandbits(64)
+
+    all_questions = list(iter_questions(
+        language, count, include_hard, workers, chunk_size, base_seed, index, max_misses, mode,
+        topic, difficulty, mix
+    ))
+    with stage('shuffle'):
+        random.Random(f"{base_seed}:shuffle").shuffle(all_questions)
     return all_questions
 
 
+def generator_version() -> str:
+    """generator/ paketinin kaynak hash'i; kod değişirse eski çıktı geçersiz sayılır."""
+    import hashlib
+    digest = hashlib.sha256()
+    for path in sorted((Path(__file__).parent / 'generator').glob('*.py')):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build_meta_path(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + '.meta')
+
+
+def is_up_to_date(output_path: Path, build_key: dict) -> bool:
+    """Çıktı aynı seed + parametrelerle üretilmişse True döner."""
+    meta_path = build_meta_path(output_path)
+    if not output_path.exists() or not meta_path.exists():
+        return False
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        return json.load(f) == build_key
+
+
+def clear_build_meta(output_path: Path) -> None:
+    """
+    Çıktıya yazmadan önce çağrılır: seed'siz veya yarıda kalan bir çalıştırma
+    dosyanın içeriğini değiştirir, eski .meta ise onu hâlâ güncel gösterirdi.
+    """
+    build_meta_path(output_path).unlink(missing_ok=True)
+
+
+def write_build_meta(output_path: Path, build_key: dict) -> None:
+    with open(build_meta_path(output_path), 'w', encoding='utf-8') as f:
+        json.dump(build_key, f, indent=2)
+
+
 def save_to_json(questions: list, output_path: Path) -> None:
     """Soruları JSON dosyasına kaydeder."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
     with open(output_path, 'w', encoding='utf-8') as f:
         json.dump(questions, f, ensure_ascii=False, indent=2)
-    
-    print(f"\n✅ Toplam {len(questions)} soru üretildi: {output_path}")
+
+
+def write_ndjson(questions: Iterable[dict], stream: IO[str]) -> int:
+    """Her soruyu üretildiği anda tek satırlık JSON olarak yazar. Yazılan soru sayısını döner."""
+    written = 0
+    for q in questions:
+        stream.write(json.dumps(q, ensure_ascii=False))
+        stream.write('\n')
+        written += 1
+    return written
+
+
+def tally(questions: Iterable[dict], langs: Dict[str, int], topics: Dict[str, int],
+          levels: Dict[int, int]) -> Iterator[dict]:
+    """Akıştaki soruları geçirirken dil/topic/zorluk sayımlarını günceller."""
+    for q in questions:
+        lang = q.get('language', 'unknown')
+        topic = q['topic']
+        langs[lang] = langs.get(lang, 0) + 1
+        topics[topic] = topics.get(topic, 0) + 1
+        levels[q['difficulty']] = levels.get(q['difficulty'], 0) + 1
+        yield q
+
+
+def load_questions(input_path: Path) -> Iterator[dict]:
+    """Mevcut bir bankayı okur: .ndjson satır satır (akış), diğerleri JSON dizisi."""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        if input_path.suffix == '.ndjson':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            yield from json.load(f)
+
+
+def report_invalid(question: dict, verdict) -> None:
+    """Doğrulamadan geçemeyen soruyu stderr'e yazar."""
+    log(f"⚠️  {question.get('id')}: {verdict.status} - {verdict.detail}")
+
+
+def write_output(args: argparse.Namespace, output_path: Path, index: Optional[FingerprintIndex],
+                 langs: Dict[str, int], topics: Dict[str, int], levels: Dict[int, int],
+                 validator=None) -> None:
+    """Soruları seçilen formatta dosyaya veya stdout'a yazar."""
+    if args.input is not None:
+        # Dönüştürme modu: üretim yok, mevcut banka okunur
+        questions = load_questions(args.input)
+        if index is not None:
+            questions = filter_unique(questions, index)
+    elif args.format == 'ndjson':
+        # Akış modu: sorular üretildikçe yazılır, liste tutulmaz
+        questions = iter_questions(
+            language=args.language, count=args.count, include_hard=args.hard,
+            workers=args.workers, chunk_size=args.chunk_size, base_seed=args.seed,
+            index=index, max_misses=args.max_misses, mode=args.mode,
+            topic=args.topic, difficulty=args.difficulty, mix=args.mix
+        )
+    else:
+        # Generate and save
+        questions = generate_questions(
+            language=args.language, count=args.count, include_hard=args.hard,
+            workers=args.workers, chunk_size=args.chunk_size, base_seed=args.seed,
+            index=index, max_misses=args.max_misses, mode=args.mode,
+            topic=args.topic, difficulty=args.difficulty, mix=args.mix
+        )
+    if validator is not None:
+        from validator import validate_stream
+        questions = validate_stream(questions, validator, args.validate, report_invalid)
+    questions = tally(questions, langs, topics, levels)
+    destination = '<stdout>' if args.stdout else output_path
+
+    if not args.stdout:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with stage('write'):
+        if args.sharded:
+            from shards import write_shards
+            # output_path manifest dosyasıdır; parçalar onun dizinine yazılır. Eski parçalar
+            # yalnızca bu çalıştırmanın kapsamında (dil/topic/zorluk) budanır.
+            # --input'ta kapsam bankada görülen dillerdir.
+            languages = None if args.input is not None else {lang for lang, _ in generator_names(args.language)}
+            stats = write_shards(questions, output_path.parent, args.format, languages=languages,
+                                 topic=args.topic, difficulty=args.difficulty)
+            total = stats['count']
+            log(f"\n🧩 Parçalar: {stats['written']} yazıldı, {stats['unchanged']} değişmedi, "
+                f"{stats['removed']} silindi, {stats['kept']} kapsam dışı korundu")
+        elif args.format == 'ndjson':
+            if args.stdout:
+                total = write_ndjson(questions, sys.stdout)
+                sys.stdout.flush()
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    total = write_ndjson(questions, f)
+        elif args.format == 'columnar':
+            from columnar import write_columnar
+            # Dilimlere ayırmak için tüm banka gerekir
+            if args.stdout:
+                total = write_columnar(questions, sys.stdout.buffer)
+                sys.stdout.buffer.flush()
+            else:
+                with open(output_path, 'wb') as f:
+                    total = write_columnar(questions, f)
+        else:
+            questions = list(questions)
+            total = len(questions)
+            if args.stdout:
+                json.dump(questions, sys.stdout, ensure_ascii=False, indent=2)
+                sys.stdout.write('\n')
+            else:
+                save_to_json(questions, output_path)
+
+    log(f"\n✅ Toplam {total} soru yazıldı: {destination}")
+
+
+def print_plan(args: argparse.Namespace, output_path: Path) -> None:
+    """
+    --dry-run: görev listesini ve çıktı yolunu yazdırır. Generator'lar
+    yalnızca zorluk karışımının seviye kotalarını hesaplamak için yüklenir.
+    """
+    destination = '<stdout>' if args.stdout else output_path
+    if args.input is not None:
+        log(f"📋 {args.input} -> {args.format}: {destination}")
+        return
+    log(f"📋 Plan ({args.mode}, workers={args.workers}, chunk={args.chunk_size}):")
+    if args.mix is not None:
+        log("   Zorluk karışımı: " + ', '.join(
+            f"{level}: %{share * 100:.0f}" for level, share in zip(DIFFICULTY_LEVELS, args.mix)
+        ))
+    for label, lang, name, total in plan_tasks(args.language, args.count, args.topic, args.difficulty):
+        amount = 'tüm uzay' if args.mode == 'exhaustive' else f"{total} soru"
+        if args.mix is not None:
+            quotas = task_levels(lang, name, total, args.hard, args.topic, None, args.mix)
+            amount += ' (' + ', '.join(f"zorluk {level}: {n}" for level, n in quotas) + ')'
+        log(f"   {label} / {name}: {amount}")
+    log(f"   -> {args.format}: {destination}")
+
+
+def print_templates(language: str) -> None:
+    """--list-templates: kayıtlı template'leri metadata'larıyla stdout'a yazar."""
+    rows = catalog(language)
+    print(f"{'dil':<11} {'generator':<11} {'template':<27} {'topic':<16} zorluk ağırlık maliyet")
+    for row in rows:
+        name = row['template'] + (' *' if row['advanced'] else '')
+        print(f"{row['language']:<11} {row['generator']:<11} {name:<27} {row['topic']:<16} "
+              f"{row['difficulty']:>6} {row['weight']:>7g} {row['cost']:>7g}")
+    print(f"\n{len(rows)} template (* yalnızca --hard ile)")
+
+
+def print_stats(langs: Dict[str, int], topics: Dict[str, int], levels: Dict[int, int]) -> None:
+    """Dil, topic ve zorluk dağılımını yazdırır."""
+    log("\n📊 Dil Dağılımı:")
+    for lang, count in sorted(langs.items()):
+        log(f"   {lang}: {count} soru")
+
+    log("\n📊 Topic Dağılımı:")
+    for topic, count in sorted(topics.items()):
+        log(f"   {topic}: {count} soru")
+
+    log("\n📊 Zorluk Dağılımı:")
+    for level, count in sorted(levels.items()):
+        log(f"   {level}: {count} soru")
 
 
 def main():
+    global profiling  # --profile ile yüklenir
     parser = argparse.ArgumentParser(description='Rheo Multi-Language Soru Üretici')
     parser.add_argument(
-        '--count', 
-        type=int, 
+        '--count',
+        type=int,
         default=10,
-        help='Her topic için üretilecek soru sayısı (default: 10)'
+        help='Her topic için üretilecek soru sayısı; --topic/--difficulty ile toplam sayı (default: 10)'
     )
     parser.add_argument(
         '--language',
@@ -110,38 +629,339 @@ def main():
     parser.add_argument(
         '--hard',
         action='store_true',
-        help='İleri seviye soruları dahil et (ELO >= 1200 için)'
+        help='İleri seviye soruları dahil et (ELO >= 1200 için; --elo bunu kendisi belirler)'
+    )
+    level_mix = parser.add_mutually_exclusive_group()
+    level_mix.add_argument(
+        '--difficulty-mix',
+        dest='mix',
+        type=parse_difficulty_mix,
+        default=None,
+        metavar='P1,P2,P3',
+        help='Zorluk 1/2/3 payları (ör. 50,30,20); her generator sayısını bu oranda tam kotalara böler'
+    )
+    level_mix.add_argument(
+        '--elo',
+        type=float,
+        default=None,
+        help=f'Hedef ELO; zorluk karışımı bundan hesaplanır, >= {HARD_ELO} ise ileri seviye dahil edilir'
+    )
+    parser.add_argument(
+        '--format',
+        type=str,
+        default='json',
+        choices=['json', 'ndjson', 'columnar'],
+        help='Çıktı formatı: json (karıştırılmış dizi), ndjson (sabit bellekle akış) '
+             'veya columnar (dilim okunabilir ikili RQB1) (default: json)'
+    )
+    parser.add_argument(
+        '--stdout',
+        action='store_true',
+        help='Dosya yerine stdout\'a yaz (importer\'a pipe etmek için)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Paralel üretim için süreç sayısı (default: 1)'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help=f'Worker başına gönderilen parça boyutu (default: {DEFAULT_CHUNK_SIZE})'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Tekrarlanabilir üretim için seed (aynı seed + parametreler = aynı soru bankası)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Aynı seed ve parametrelerle üretilmiş çıktı olsa bile yeniden üret'
+    )
+    parser.add_argument(
+        '--unique',
+        action='store_true',
+        help='İçerik tekrarlarını ele; her topic için istenen sayıda farklı soru üret'
+    )
+    parser.add_argument(
+        '--dedupe-index',
+        type=Path,
+        default=None,
+        help='Kalıcı parmak izi indeks dosyası (önceki çalıştırmalardaki soruları da eler, --unique içerir)'
+    )
+    parser.add_argument(
+        '--max-misses',
+        type=int,
+        default=DEFAULT_MAX_MISSES,
+        help=f'Template uzayı tükendi sayılmadan önce art arda kabul edilen tekrar sayısı (default: {DEFAULT_MAX_MISSES})'
+    )
+    space_mode = parser.add_mutually_exclusive_group()
+    space_mode.add_argument(
+        '--exhaustive',
+        dest='mode',
+        action='store_const',
+        const='exhaustive',
+        help='Her template\'in tüm parametre uzayını tara (--count yok sayılır)'
+    )
+    space_mode.add_argument(
+        '--stratified',
+        dest='mode',
+        action='store_const',
+        const='stratified',
+        help='--count kadar soruyu template\'ler arasında eşit paylaştırıp tekrarsız örnekle'
+    )
+    parser.set_defaults(mode='random')
+    parser.add_argument(
+        '--input',
+        type=Path,
+        default=None,
+        help='Üretmek yerine mevcut bankayı (.json / .ndjson) oku ve --format ile yaz '
+             '(ör. rheo_app/assets/questions.json -> columnar)'
+    )
+    parser.add_argument(
+        '--sharded',
+        action='store_true',
+        help='Tek dosya yerine output/shards/ altına (dil, topic, zorluk) başına '
+             'bir dosya ve manifest.json yaz; içeriği değişmeyen parçalar yeniden yazılmaz'
+    )
+    parser.add_argument(
+        '--plugins',
+        action='store_true',
+        help='"rheo.generators" entry point\'leriyle kurulu ek generator\'ları da çalıştır'
+    )
+    parser.add_argument(
+        '--topic',
+        type=str,
+        default=None,
+        help='Yalnızca bu topic\'in template\'lerinden üret (ör. loops); --language ile daraltılmadıkça tüm diller'
+    )
+    parser.add_argument(
+        '--difficulty',
+        type=int,
+        default=None,
+        choices=[1, 2, 3],
+        help='Yalnızca bu zorluktaki template\'lerden üret'
+    )
+    parser.add_argument(
+        '--list-templates',
+        action='store_true',
+        help='Kayıtlı template\'leri (topic, zorluk, ağırlık, maliyet) listele ve çık'
+    )
+    parser.add_argument(
+        '--validate',
+        nargs='?',
+        const='report',
+        default=None,
+        choices=['report', 'drop', 'fail'],
+        help='Snippet\'leri çalıştırıp cevapları doğrula (Python sandbox\'ta; Java/JavaScript '
+             'javac/java, node kuruluysa): report (bildir), drop (hatalıları çıkar) veya '
+             'fail (ilk hatada dur) (default: report)'
+    )
+    parser.add_argument(
+        '--trust-input',
+        action='store_true',
+        help='--input ile --validate: dosyadaki (dış/LLM kaynaklı) snippet\'leri çalıştırmayı onayla'
+    )
+    parser.add_argument(
+        '--validate-workers',
+        type=int,
+        default=None,
+        help='Doğrulama sandbox süreç sayısı (default: CPU sayısı)'
+    )
+    parser.add_argument(
+        '--validate-timeout',
+        type=float,
+        default=2.0,
+        help='Snippet başına zaman aşımı, saniye (default: 2)'
+    )
+    parser.add_argument(
+        '--validate-cache',
+        type=Path,
+        default=None,
+        help='Çalıştırma sonuçları önbelleği (default: output/.validate_cache.ndjson)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Üretmeden planı (görevler, soru sayıları, çıktı yolu) yazdır ve çık'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='full',
+        default=None,
+        choices=['full', 'time'],
+        help='Aşama bazında (construct, template, to_dict, shuffle, write) ölç: full süre + bellek '
+             '(tracemalloc, ~10 kat yavaş), time yalnızca süre; üretim tek süreçte yapılır, '
+             '--workers yok sayılır (default: full)'
+    )
+    parser.add_argument(
+        '--profile-out',
+        type=Path,
+        default=None,
+        help='Profil dosyası (--profile verilmediyse full açar): .pstats/.prof cProfile, .collapsed/.folded '
+             'flamegraph için collapsed stack, .json aşama tablosu'
     )
     args = parser.parse_args()
-    
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error('--workers ve --chunk-size en az 1 olmalı')
+    if args.sharded and (args.stdout or args.format == 'columnar'):
+        parser.error('--sharded, --stdout ve --format columnar ile birlikte kullanılamaz')
+    if args.input is not None and args.validate is not None and not args.trust_input:
+        # Generator'larımız dışından gelen kod izole de olsa yalnızca açık onayla çalıştırılır
+        parser.error('--input dosyasındaki snippet\'ler dış kaynaklı koddur; --validate için --trust-input verin')
+    if args.elo is not None:
+        args.mix = elo_mix(args.elo)
+        args.hard = args.hard or args.elo >= HARD_ELO
+    elif args.mix is not None:
+        # Seviye 3 yalnızca ileri seviye template'lerde var
+        args.hard = args.hard or args.mix[2] > 0
+    if args.mix is not None and (args.difficulty is not None or args.mode == 'exhaustive'):
+        parser.error('--difficulty-mix/--elo, --difficulty ve --exhaustive ile birlikte kullanılamaz')
+    if args.profile_out is not None:
+        args.profile = args.profile or 'full'
+    if args.profile is not None:
+        import profiling
+    if args.profile_out is not None:
+        suffix = args.profile_out.suffix.lower()
+        if suffix not in profiling.OUTPUT_SUFFIXES:
+            parser.error(f"--profile-out uzantısı şunlardan biri olmalı: {', '.join(profiling.OUTPUT_SUFFIXES)}")
+        if suffix in profiling.COLLAPSED_SUFFIXES and not profiling.StackSampler.supported():
+            parser.error('Collapsed stack örneklemesi bu platformda desteklenmiyor (SIGPROF yok)')
+    if args.profile is not None and args.workers > 1:
+        # Worker süreçlerindeki aşamalar ölçülemez
+        log('⏱️  --profile: üretim tek süreçte yapılıyor (--workers yok sayıldı)')
+        args.workers = 1
+
+    if args.plugins:
+        found = discover_plugins()
+        if found:
+            log(f"🔌 Eklenti generator'lar: {', '.join(found)}")
+
+    if args.list_templates:
+        print_templates(args.language)
+        return
+
+    if args.topic is not None or args.difficulty is not None:
+        query = TemplateQuery(language=args.language, topic=args.topic, difficulty=args.difficulty)
+        if not query.templates(args.hard):
+            topics = sorted({row['topic'] for row in catalog(args.language)})
+            hint = ' (ileri seviye template\'ler için --hard)' if query.templates(True) else ''
+            parser.error(f"--topic/--difficulty ile eşleşen template yok{hint}; topic'ler: {', '.join(topics)}")
+
+    if args.mix is not None and args.input is None:
+        # Payı olan hiçbir seviyede template'i bulunmayan görev sessizce boş kalmasın
+        tasks = plan_tasks(args.language, args.count, args.topic, args.difficulty)
+        empty = [(label, name) for label, lang, name, total in tasks
+                 if total > 0 and not task_levels(lang, name, total, args.hard, args.topic, None, args.mix)]
+        if empty and len(empty) == len(tasks):
+            parser.error('--difficulty-mix/--elo payı olan seviyelerde hiçbir görevin template\'i yok; '
+                         'hiç soru üretilmezdi')
+        for label, name in empty:
+            log(f"⚠️  {label} / {name}: --difficulty-mix payı olan seviyelerde template yok, soru üretilmeyecek")
+
     # Output path
     script_dir = Path(__file__).parent
-    output_path = script_dir / 'output' / 'questions.json'
-    
-    # Generate and save
-    questions = generate_questions(
-        language=args.language, 
-        count=args.count,
-        include_hard=args.hard
-    )
-    save_to_json(questions, output_path)
-    
-    # İstatistikler
+    suffix = {'json': 'json', 'ndjson': 'ndjson', 'columnar': 'rqb'}[args.format]
+    if args.sharded:
+        output_path = script_dir / 'output' / 'shards' / 'manifest.json'
+    else:
+        output_path = script_dir / 'output' / f'questions.{suffix}'
+
+    # Seed verildiyse aynı parametrelerle üretilmiş çıktıyı tekrar üretme
+    build_key = None
+    if args.seed is not None and not args.stdout and args.input is None:
+        build_key = {
+            'seed': args.seed,
+            'language': args.language,
+            'count': args.count,
+            'hard': args.hard,
+            'format': args.format,
+            'sharded': args.sharded,
+            'chunk_size': args.chunk_size,
+            'unique': args.unique,
+            'mode': args.mode,
+            'topic': args.topic,
+            'difficulty': args.difficulty,
+            'difficulty_mix': list(args.mix) if args.mix is not None else None,
+            'validate': args.validate,
+            'plugins': args.plugins,
+            'dedupe_index': str(args.dedupe_index) if args.dedupe_index else None,
+            'generator_version': generator_version(),
+        }
+        if not args.force and args.profile is None and is_up_to_date(output_path, build_key):
+            log(f"⏭️  {output_path} aynı seed ve parametrelerle güncel, atlanıyor (--force ile yeniden üret)")
+            return
+
+    if args.dry_run:
+        print_plan(args, output_path)
+        return
+
+    index = None
+    if args.unique or args.dedupe_index is not None:
+        index = FingerprintIndex(args.dedupe_index)
+        if len(index):
+            log(f"🔎 Tekrar indeksi: {len(index)} bilinen soru ({args.dedupe_index})")
+
+    validator = None
+    validation_failed = ()  # boş demet: --validate yoksa except hiçbir şeyi yakalamaz
+    if args.validate is not None:
+        from validator import ValidationFailed, Validator, VerdictCache
+        validation_failed = ValidationFailed
+        cache_path = args.validate_cache or script_dir / 'output' / '.validate_cache.ndjson'
+        validator = Validator(args.validate_workers, args.validate_timeout, VerdictCache(cache_path))
+
     langs = {}
     topics = {}
-    for q in questions:
-        lang = q.get('language', 'unknown')
-        topic = q['topic']
-        langs[lang] = langs.get(lang, 0) + 1
-        topics[topic] = topics.get(topic, 0) + 1
-    
-    print("\n📊 Dil Dağılımı:")
-    for lang, count in sorted(langs.items()):
-        print(f"   {lang}: {count} soru")
-    
-    print("\n📊 Topic Dağılımı:")
-    for topic, count in sorted(topics.items()):
-        print(f"   {topic}: {count} soru")
+    levels = {}
+
+    if args.profile is not None:
+        session = profiling.profiled(args.profile_out, log, track_memory=args.profile == 'full')
+    else:
+        session = nullcontext()
+    if not args.stdout:
+        # .meta yalnızca başarılı bir yazımdan sonra (ve seed varsa) yeniden oluşturulur
+        clear_build_meta(output_path)
+    try:
+        with session:
+            write_output(args, output_path, index, langs, topics, levels, validator)
+    except TemplateSpaceExhausted as e:
+        log(f"\n❌ {e}")
+        sys.exit(1)
+    except validation_failed as e:
+        log(f"\n❌ Doğrulama başarısız: {e}")
+        sys.exit(1)
+    except BrokenPipeError:
+        if not args.stdout:
+            raise
+        # Okuyan süreç erken kapandı (ör. `| head`): çıkışta tampon boşaltılırken
+        # tekrar hata alınmasın diye stdout devnull'a çevrilir; indeks kaydedilmez
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        if validator is not None:
+            validator.close()
+            validator.cache.save()
+
+    if validator is not None:
+        summary = ', '.join(f"{status}: {n}" for status, n in sorted(validator.stats.items()))
+        log(f"\n🧪 Doğrulama: {summary} ({validator.executed} snippet çalıştırıldı, "
+            f"önbellekte {len(validator.cache)})")
+        for language in sorted(validator.unavailable):
+            log(f"   {language}: araç zinciri bulunamadı, doğrulanmadı")
+
+    # Yalnızca çıktı başarıyla yazıldıktan sonra indeksi güncelle
+    if index is not None:
+        index.save()
+
+    if build_key is not None:
+        write_build_meta(output_path, build_key)
+
+    print_stats(langs, topics, levels)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,315 @@
+"""
+Stage Profiling
+main.py --profile için aşama bazında süre ve bellek ölçümü.
+
+Aşamalar iç içe açılabilir (ör. NDJSON akışında template çağrıları yazma
+aşamasının içinde gerçekleşir). Her aşama için:
+- calls / total: çağrı sayısı ve kapsayıcı (inclusive) süre
+- self: alt aşamalar çıkarılmış süre; tabloda bu sütun toplanabilir
+- net: aşama boyunca tracemalloc'un izlediği bellekteki net değişim
+- peak: aşama sırasında, aşama başındaki seviyenin üstüne çıkılan en yüksek bellek
+
+Bellek tracemalloc ile izlenir ve Python kodunu ~10 kat yavaşlatır; bu
+modda süreler mutlak değil, aşamalar arası oran olarak okunmalıdır.
+track_memory=False (main.py --profile time) yalnızca süre ölçer, ek yük ~%5.
+
+Ek çıktılar (--profile-out dosya uzantısına göre):
+    .pstats / .prof         cProfile istatistikleri (python -m pstats, snakeviz)
+    .collapsed / .folded    örneklemeli collapsed stack (flamegraph.pl, speedscope)
+    .json                   aşama tablosu
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+PSTATS_SUFFIXES = ('.pstats', '.prof')
+COLLAPSED_SUFFIXES = ('.collapsed', '.folded')
+JSON_SUFFIXES = ('.json',)
+OUTPUT_SUFFIXES = PSTATS_SUFFIXES + COLLAPSED_SUFFIXES + JSON_SUFFIXES
+
+SAMPLE_INTERVAL = 0.001  # collapsed stack örnekleme aralığı, saniye
+
+_active: Optional['StageProfiler'] = None
+
+
+def active() -> Optional['StageProfiler']:
+    """Çalışan profiler (yoksa None)."""
+    return _active
+
+
+def stage(name: str):
+    """Profiler açıksa aşamayı ölçen, değilse boş bağlam yöneticisi."""
+    return _active.stage(name) if _active is not None else nullcontext()
+
+
+def current_rss_mb() -> Optional[float]:
+    """Sürecin şu anki RSS'i (yalnızca /proc olan sistemlerde)."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Sürecin tepe RSS'i (ru_maxrss)."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KiB, macOS byte döner
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+class _Frame:
+    __slots__ = ('name', 'started', 'child_time', 'start_bytes', 'peak_bytes')
+
+    def __init__(self, name: str, started: float, start_bytes: int):
+        self.name = name
+        self.started = started
+        self.child_time = 0.0
+        self.start_bytes = start_bytes
+        self.peak_bytes = start_bytes
+
+
+class StageProfiler:
+    """
+    Aşama süre/bellek ölçer. Tek süreçte ve tek thread'de kullanılır;
+    start() ile etkinleşir, stop() ile tabloyu kapatır.
+    """
+
+    def __init__(self, track_memory: bool = True):
+        self.track_memory = track_memory
+        self.stats: Dict[str, List[float]] = {}   # ad -> [calls, total, self, net, peak]
+        self._stack: List[_Frame] = []
+        self.wall = 0.0
+        self.traced_peak = 0
+
+    # -- yaşam döngüsü --------------------------------------------------
+
+    def start(self) -> 'StageProfiler':
+        global _active
+        if self.track_memory:
+            import tracemalloc
+            tracemalloc.start()
+        _active = self
+        self._enter('total')
+        return self
+
+    def stop(self) -> None:
+        global _active
+        while self._stack:
+            self._exit()
+        if self.track_memory:
+            import tracemalloc
+            tracemalloc.stop()
+        _active = None
+
+    # -- ölçüm ----------------------------------------------------------
+
+    def _memory(self):
+        if not self.track_memory:
+            return 0, 0
+        import tracemalloc
+        return tracemalloc.get_traced_memory()
+
+    def _enter(self, name: str) -> None:
+        current, peak = self._memory()
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak_bytes = max(parent.peak_bytes, peak)
+        if self.track_memory:
+            import tracemalloc
+            tracemalloc.reset_peak()
+        self._stack.append(_Frame(name, time.perf_counter(), current))
+
+    def _exit(self) -> None:
+        ended = time.perf_counter()
+        current, peak = self._memory()
+        frame = self._stack.pop()
+        frame.peak_bytes = max(frame.peak_bytes, peak)
+        elapsed = ended - frame.started
+
+        row = self.stats.setdefault(frame.name, [0, 0.0, 0.0, 0, 0])
+        row[0] += 1
+        row[1] += elapsed
+        row[2] += elapsed - frame.child_time
+        row[3] += current - frame.start_bytes
+        row[4] = max(row[4], frame.peak_bytes - frame.start_bytes)
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent.child_time += elapsed
+            parent.peak_bytes = max(parent.peak_bytes, frame.peak_bytes)
+            if self.track_memory:
+                import tracemalloc
+                tracemalloc.reset_peak()
+        else:
+            self.wall = elapsed
+            self.traced_peak = frame.peak_bytes
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def call(self, name: str, func: Callable, *args, **kwargs):
+        """func'ı `name` aşaması olarak çalıştırır (sıcak döngüler için with'ten ucuz)."""
+        self._enter(name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._exit()
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """func'ın her çağrısını `name` aşaması olarak ölçen sarmalayıcı (metadata korunur)."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(name, func, *args, **kwargs)
+        return wrapper
+
+    def instrument(self, gen) -> None:
+        """
+        Generator örneğinin templates() sonucunu sarar; iter_generate ve
+        TemplateSpace her template çağrısını ayrı aşama olarak kaydeder.
+        Sınıf ve diğer örnekler etkilenmez.
+        """
+        templates = gen.templates
+
+        def instrumented(include_hard: bool = False):
+            return [self.wrap(f"template:{t.__qualname__}", t) for t in templates(include_hard)]
+
+        gen.templates = instrumented
+
+    # -- rapor ----------------------------------------------------------
+
+    def rows(self) -> List[dict]:
+        """Aşamalar, öz süreye göre azalan sırada."""
+        return [
+            {'stage': name, 'calls': int(calls), 'total': total, 'self': own,
+             'net_bytes': int(net), 'peak_bytes': int(peak)}
+            for name, (calls, total, own, net, peak)
+            in sorted(self.stats.items(), key=lambda item: -item[1][2])
+        ]
+
+    def report(self, log: Callable[..., None], limit: int = 25) -> None:
+        rss = peak_rss_mb()
+        header = f"\n⏱️  Profil: {self.wall:.2f} sn"
+        if rss is not None:
+            header += f", tepe RSS {rss:.0f} MB"
+        if self.track_memory:
+            header += f", tracemalloc tepe {self.traced_peak / 2 ** 20:.1f} MB"
+        log(header)
+        memory = f" {'net MB':>8} {'tepe MB':>8}" if self.track_memory else ''
+        log(f"   {'aşama':<52} {'çağrı':>9} {'toplam sn':>10} {'öz sn':>9} {'öz %':>6}{memory}")
+        rows = self.rows()
+        for row in rows[:limit]:
+            share = row['self'] / self.wall * 100 if self.wall else 0.0
+            if self.track_memory:
+                memory = f" {row['net_bytes'] / 2 ** 20:>8.1f} {row['peak_bytes'] / 2 ** 20:>8.1f}"
+            log(f"   {row['stage']:<52} {row['calls']:>9} {row['total']:>10.3f} {row['self']:>9.3f} "
+                f"{share:>5.1f}%{memory}")
+        if len(rows) > limit:
+            rest = sum(row['self'] for row in rows[limit:])
+            log(f"   ... {len(rows) - limit} aşama daha ({rest:.3f} sn öz süre)")
+
+    def save_json(self, path: Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'wall': self.wall, 'peak_rss_mb': peak_rss_mb(), 'traced_peak_bytes': self.traced_peak,
+                       'stages': self.rows()}, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+
+
+class StackSampler:
+    """
+    SIGPROF ile ana thread'in Python yığınını örnekler ve flamegraph'ın
+    beklediği "a;b;c <sayı>" satırlarını üretir. Yalnızca Unix.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._previous = None
+
+    @staticmethod
+    def supported() -> bool:
+        import signal
+        return hasattr(signal, 'setitimer') and hasattr(signal, 'SIGPROF')
+
+    def _sample(self, signum, frame) -> None:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        self.samples[';'.join(reversed(stack))] += 1
+
+    def start(self) -> 'StackSampler':
+        import signal
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def stop(self) -> None:
+        import signal
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous or signal.SIG_DFL)
+
+    def save(self, path: Path) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+@contextmanager
+def profiled(output: Optional[Path] = None, log: Callable[..., None] = print,
+             track_memory: bool = True) -> Iterator[StageProfiler]:
+    """
+    Bloğu aşama profiler'ı ile çalıştırır; output uzantısına göre cProfile,
+    örneklemeli collapsed stack veya JSON aşama tablosu da yazar.
+    """
+    suffix = output.suffix.lower() if output is not None else None
+    profiler = StageProfiler(track_memory)
+    extra = None
+    if suffix in PSTATS_SUFFIXES:
+        import cProfile
+        extra = cProfile.Profile()
+    elif suffix in COLLAPSED_SUFFIXES:
+        extra = StackSampler()
+
+    profiler.start()
+    if isinstance(extra, StackSampler):
+        extra.start()
+    elif extra is not None:
+        extra.enable()
+    try:
+        yield profiler
+    finally:
+        if isinstance(extra, StackSampler):
+            extra.stop()
+        elif extra is not None:
+            extra.disable()
+        profiler.stop()
+
+        profiler.report(log)
+        if output is not None:
+            output.parent.mkdir(parents=True, exist_ok=True)
+            if suffix in PSTATS_SUFFIXES:
+                extra.dump_stats(str(output))
+            elif suffix in COLLAPSED_SUFFIXES:
+                extra.save(output)
+            else:
+                profiler.save_json(output)
+            log(f"   Profil çıktısı: {output}")
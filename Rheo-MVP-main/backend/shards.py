@@ -0,0 +1,148 @@
+"""
+Sharded Output
+Soru bankasını (language, topic, difficulty) başına ayrı dosyalara böler ve
+her parçanın sayısını, boyutunu ve içerik hash'ini manifest'e yazar.
+
+Dizin düzeni:
+    <out_dir>/manifest.json
+    <out_dir>/<language>/<topic>_<difficulty>.<json|ndjson>
+
+manifest.json:
+    {
+      "version": 1,
+      "count": <toplam soru>,
+      "shards": [
+        {"language": "python", "topic": "loops", "difficulty": 1,
+         "path": "python/loops_1.json", "count": 120,
+         "bytes": 48211, "sha256": "..."}
+      ]
+    }
+
+İstemciler manifest'teki sha256'yı ellerindekiyle karşılaştırıp yalnızca
+değişen parçaları indirebilir. Yazarken de içeriği değişmeyen parçalar
+diske tekrar yazılmaz (mtime korunur).
+
+Bir çalıştırma yalnızca kendi kapsamındaki (dil / topic / zorluk) parçaları
+yeniler: `--language java` çalıştırması python ve javascript parçalarına
+dokunmaz, manifest'te onların kayıtları korunur.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+
+def shard_key(q: dict) -> Tuple[str, str, int]:
+    return (q.get('language', 'python'), q.get('topic', 'unknown'), q.get('difficulty', 0))
+
+
+def shard_path(key: Tuple[str, str, int], fmt: str) -> str:
+    """Manifest'e yazılan, out_dir'e göre göreli yol (her zaman '/' ayraçlı)."""
+    language, topic, difficulty = key
+    return f"{language}/{topic}_{difficulty}.{fmt}"
+
+
+def encode_shard(questions: List[dict], fmt: str) -> bytes:
+    """Parçayı ana çıktıyla aynı biçimde (json: indent=2 dizi, ndjson: satır başına soru) kodlar."""
+    if fmt == 'ndjson':
+        text = ''.join(json.dumps(q, ensure_ascii=False) + '\n' for q in questions)
+    else:
+        text = json.dumps(questions, ensure_ascii=False, indent=2) + '\n'
+    return text.encode('utf-8')
+
+
+def load_manifest(out_dir: Path) -> dict:
+    """Mevcut manifest'i okur; yoksa boş manifest döner."""
+    path = out_dir / MANIFEST_NAME
+    if not path.exists():
+        return {'version': MANIFEST_VERSION, 'count': 0, 'shards': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def in_scope(entry: dict, languages: Optional[Iterable[str]], topic: Optional[str] = None,
+             difficulty: Optional[int] = None) -> bool:
+    """Manifest kaydı bu çalıştırmanın kapsamında mı (None: o boyutta filtre yok)."""
+    return ((languages is None or entry['language'] in languages)
+            and (topic is None or entry['topic'] == topic)
+            and (difficulty is None or entry['difficulty'] == difficulty))
+
+
+def write_shards(questions: Iterable[dict], out_dir: Path, fmt: str = 'json',
+                 languages: Optional[Iterable[str]] = None, topic: Optional[str] = None,
+                 difficulty: Optional[int] = None) -> Dict[str, int]:
+    """
+    Soruları parçalara ayırıp yazar ve manifest'i günceller.
+
+    Önceki manifest'te aynı sha256 ile kayıtlı ve diskteki boyutu tutan
+    parçalar yeniden yazılmaz. Kapsamdaki (languages/topic/difficulty;
+    languages None ise bu çalıştırmada görülen diller) eski parçalar artık
+    üretilmiyorsa silinir; kapsam dışındakiler manifest'te aynen kalır.
+    {'written', 'unchanged', 'removed', 'kept', 'count'} sayımlarını döner;
+    count bu çalıştırmada yazılan soru sayısıdır.
+    """
+    groups: Dict[Tuple[str, str, int], List[dict]] = {}
+    total = 0
+    for q in questions:
+        groups.setdefault(shard_key(q), []).append(q)
+        total += 1
+
+    previous = {entry['path']: entry for entry in load_manifest(out_dir)['shards']}
+    stats = {'written': 0, 'unchanged': 0, 'removed': 0, 'kept': 0, 'count': total}
+    shards = []
+    for key in sorted(groups):
+        rows = groups[key]
+        rel = shard_path(key, fmt)
+        data = encode_shard(rows, fmt)
+        digest = hashlib.sha256(data).hexdigest()
+        target = out_dir / rel
+        old = previous.pop(rel, None)
+        if (old is not None and old['sha256'] == digest and target.exists()
+                and target.stat().st_size == len(data)):
+            stats['unchanged'] += 1
+        else:
+            _atomic_write(target, data)
+            stats['written'] += 1
+        shards.append({
+            **dict(zip(('language', 'topic', 'difficulty'), key)),
+            'path': rel,
+            'count': len(rows),
+            'bytes': len(data),
+            'sha256': digest,
+        })
+
+    # Bu çalıştırmada üretilmeyen eski parçalar: kapsam dışındakiler korunur
+    if languages is None:
+        languages = {key[0] for key in groups}
+    languages = set(languages)
+    for rel, entry in previous.items():
+        stale = out_dir / rel
+        if not in_scope(entry, languages, topic, difficulty):
+            if stale.exists():
+                shards.append(entry)
+                stats['kept'] += 1
+            continue
+        if stale.exists():
+            stale.unlink()
+            stats['removed'] += 1
+            if stale.parent != out_dir and not any(stale.parent.iterdir()):
+                stale.parent.rmdir()
+
+    shards.sort(key=shard_key)
+    manifest = {'version': MANIFEST_VERSION, 'count': sum(entry['count'] for entry in shards), 'shards': shards}
+    _atomic_write(out_dir / MANIFEST_NAME,
+                  (json.dumps(manifest, ensure_ascii=False, indent=2) + '\n').encode('utf-8'))
+    return stats
@@ -0,0 +1,18 @@
+"""
+Backend testleri: backend/ dizininden `python -m pytest tests` ile çalışır.
+Modüller (main, columnar, shards, generator ...) paket değil, betik olarak
+import edildiği için backend/ import yoluna eklenir. rheo_app/scripts
+(generate_questions, ratelimit, journal ...) da aynı şekilde, sona eklenir.
+"""
+
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+ASSETS = BACKEND.parent / 'rheo_app' / 'assets'
+SCRIPTS = BACKEND.parent / 'rheo_app' / 'scripts'
+
+if str(BACKEND) not in sys.path:
+    sys.path.insert(0, str(BACKEND))
+if str(SCRIPTS) not in sys.path:
+    sys.path.append(str(SCRIPTS))
@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+
+from columnar import read_columnar, write_columnar
+from conftest import ASSETS
+
+BANKS = sorted((ASSETS / 'questions').glob('*.json')) + [ASSETS / 'questions.json']
+
+
+def _round_trip(questions, tmp_path):
+    buffer = io.BytesIO()
+    assert write_columnar(questions, buffer) == len(questions)
+    path = tmp_path / 'bank.rqb'
+    path.write_bytes(buffer.getvalue())
+    return read_columnar(path)
+
+
+def _key(q):
+    return q['id']
+
+
+@pytest.mark.parametrize('bank', BANKS, ids=lambda p: p.name)
+def test_asset_bank_round_trip(bank, tmp_path):
+    with open(bank, 'r', encoding='utf-8') as f:
+        questions = json.load(f)
+    # null alanlar yazılmaz; dilimler (dil, topic, zorluk) sırasıyla gelir
+    expected = [{k: v for k, v in q.items() if v is not None} for q in questions]
+    assert sorted(_round_trip(questions, tmp_path), key=_key) == sorted(expected, key=_key)
+
+
+def test_scalar_and_mixed_types(tmp_path):
+    questions = [
+        {'id': 'a', 'flag': True, 'score': 1.5, 'answer': {'x': 1}, 'options': ['1', '2'], 'n': 3},
+        {'id': 'b', 'flag': False, 'score': -0.25, 'answer': 'metin', 'options': [1, 'iki'], 'n': -1},
+        {'id': 'c', 'flag': None, 'score': None, 'answer': None, 'options': None, 'n': None},
+    ]
+    decoded = {q['id']: q for q in _round_trip(questions, tmp_path)}
+    assert decoded['a'] == questions[0]
+    assert decoded['b'] == questions[1]
+    assert decoded['c'] == {'id': 'c'}
+
+
+def test_null_int_is_not_read_as_zero(tmp_path):
+    questions = [{'id': 'a', 'n': 2}, {'id': 'b', 'n': None}, {'id': 'c', 'n': 0}, {'id': 'd'}]
+    decoded = {q['id']: q for q in _round_trip(questions, tmp_path)}
+    assert decoded == {'a': {'id': 'a', 'n': 2}, 'b': {'id': 'b'}, 'c': {'id': 'c', 'n': 0}, 'd': {'id': 'd'}}
+
+
+def test_slice_filter(tmp_path):
+    questions = [
+        {'id': 'p', 'language': 'python', 'topic': 'loops', 'difficulty': 1},
+        {'id': 'j', 'language': 'java', 'topic': 'loops', 'difficulty': 1},
+    ]
+    buffer = io.BytesIO()
+    write_columnar(questions, buffer)
+    path = tmp_path / 'bank.rqb'
+    path.write_bytes(buffer.getvalue())
+    assert [q['id'] for q in read_columnar(path, language='java')] == ['j']
@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from generator import TemplateSpace, generator_names, load_generator
+from generator.distractors import FALLBACKS, WRONG_COUNT, distractors
+
+SAMPLE = 2000  # template başına en fazla bu kadar parametre kombinasyonu
+
+
+def _templates():
+    for language, name in generator_names('all'):
+        generator = load_generator(name)(rng=random.Random(0))
+        for template in generator.templates(include_hard=True):
+            yield pytest.param(template, id=f"{name}.{template.__name__}")
+
+
+@pytest.mark.parametrize('template', list(_templates()))
+def test_templates_give_three_distinct_wrong_options(template):
+    space = TemplateSpace([template])
+    indices = range(len(space)) if len(space) <= SAMPLE else random.Random(0).sample(range(len(space)), SAMPLE)
+    for index in indices:
+        q = space.render(index)
+        assert len(q.wrong_options) == WRONG_COUNT, q.id
+        assert len(set(q.wrong_options)) == WRONG_COUNT, q.wrong_options
+        assert str(q.correct_answer) not in q.wrong_options, (q.correct_answer, q.wrong_options)
+
+
+def test_duplicates_and_answer_are_dropped():
+    assert distractors(5, [5, 6, 6, '6', 4, 7]) == ['6', '4', '7']
+
+
+@pytest.mark.parametrize('language', sorted(FALLBACKS))
+def test_backfill_completes_short_lists(language):
+    # Tam sayı cevapta önce komşu değerler
+    assert distractors(10, [11], language) == ['11', '9', '12']
+    # Metin cevapta dilin genel şıkları; cevapla çakışan atlanır
+    for correct in FALLBACKS[language]:
+        wrong = distractors(correct, [], language)
+        assert len(set(wrong)) == WRONG_COUNT and correct not in wrong
+
+
+@pytest.mark.parametrize('correct', ['--5', '-', '5-', '1.5'])
+def test_non_integer_answers_skip_the_neighbour_backfill(correct):
+    assert distractors(correct, []) == list(FALLBACKS['python'][:WRONG_COUNT])
+
+
+def test_negative_answers_get_neighbours():
+    assert distractors(-3, []) == ['-2', '-4', '-1']
+
+
+def test_rng_picks_among_candidates():
+    mistakes = list(range(1, 10))
+    picks = {tuple(distractors(0, mistakes, rng=random.Random(seed))) for seed in range(20)}
+    assert len(picks) > 1
+    assert all(len(set(p)) == WRONG_COUNT and '0' not in p for p in picks)
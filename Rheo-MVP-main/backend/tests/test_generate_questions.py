@@ -0,0 +1,102 @@
+import asyncio
+import json
+import random
+from collections import Counter
+
+import pytest
+
+import generate_questions as gq
+from backends import LocalBackend
+from journal import JobState
+from ratelimit import RateController, TokenBucket
+
+TOPICS = ['loop', 'variable']
+DIFFICULTIES = ['easy', 'hard']
+
+
+class RecordingBackend(LocalBackend):
+    """LocalBackend with no latency that records every call and every answer."""
+
+    def __init__(self, **rates):
+        super().__init__(latency=0.0, jitter=0.0, retry_after=0.0, **rates)
+        self.attempts = []         # prompts in call order, seed line removed
+        self.answered = Counter()  # prompt -> successful answers
+
+    async def generate(self, prompt):
+        stable = prompt.split("\nRandom seed for uniqueness:")[0]
+        self.attempts.append(stable)
+        text = await super().generate(prompt)
+        self.answered[stable] += 1
+        return text
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(gq, 'OUTPUT_DIR', tmp_path)
+    return tmp_path
+
+
+def _controller(concurrency):
+    return RateController(TokenBucket(rate=1e6, capacity=1000), max_concurrency=concurrency,
+                          max_attempts=20, base_delay=0.001, rng=random.Random(0))
+
+
+def _run(units, backend, concurrency, state=None):
+    state = state or JobState(gq.job_state_path(), [])
+    controller = _controller(concurrency)
+    added = asyncio.run(gq.run_units(units, state, backend, controller))
+    return state, controller, added
+
+
+def _planned(shuffle_seed=1):
+    units = gq.plan_units(TOPICS, DIFFICULTIES)
+    random.Random(shuffle_seed).shuffle(units)
+    return units
+
+
+def test_batches_start_in_priority_order(output_dir):
+    units = _planned()
+    backend = RecordingBackend()
+    _run(units, backend, concurrency=1)
+
+    by_prompt = {gq.build_prompt(u): u for u in units}
+    started = [by_prompt[p] for p in dict.fromkeys(backend.attempts)]
+    assert started == sorted(units, key=lambda u: u.priority)
+
+
+def test_throttled_batches_are_retried_and_complete_once(output_dir):
+    units = _planned()
+    backend = RecordingBackend(throttle_rate=0.3, seed=3)
+    state, controller, added = _run(units, backend, concurrency=4)
+
+    assert controller.retries > 0 and controller.rate_limited > 0
+    assert len(backend.attempts) > len(units)
+    assert state.completed == {u.key for u in units}
+    assert set(backend.answered.values()) == {1}
+    assert len(backend.answered) == len(units)
+    assert added == len(units) * gq.QUESTIONS_PER_BATCH
+
+    # Every file is compacted once its batches are done: no journals left
+    assert not list(output_dir.glob('*.journal.ndjson'))
+    for topic in TOPICS:
+        for difficulty in DIFFICULTIES:
+            with open(gq.bank_path(topic, difficulty), encoding='utf-8') as f:
+                bank = json.load(f)
+            assert len(bank) == gq.TOTAL_PER_FILE
+            assert len({q['id'] for q in bank}) == len(bank)
+
+
+def test_failed_batches_finish_on_the_next_run(output_dir):
+    units = _planned()
+    backend = RecordingBackend(error_rate=0.25, malformed_rate=0.1, seed=5)
+    state, _, first = _run(units, backend, concurrency=4)
+    failed = {u.key for u in units} - state.completed
+    assert failed, "the failure rates should leave some batches unfinished"
+
+    # Same job state: only the unfinished batches are requested again
+    retry = RecordingBackend(seed=6)
+    state, _, second = _run(units, retry, concurrency=4, state=state)
+    assert state.completed == {u.key for u in units}
+    assert {(u.topic_id, u.difficulty, u.batch_num) for u in units
+            if gq.build_prompt(u) in retry.answered} == failed
+    assert first + second == len(units) * gq.QUESTIONS_PER_BATCH
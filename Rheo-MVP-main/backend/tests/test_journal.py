@@ -0,0 +1,100 @@
+import json
+from dataclasses import asdict
+
+import pytest
+
+import generate_questions as gq
+from journal import JobState, Journal, atomic_write_json
+
+
+def _record(n):
+    return {'unit': {'batch_num': n}, 'questions': [{'id': f'q{n}', 'text': 'Çıktı nedir?'}]}
+
+
+def test_torn_last_line_is_dropped_and_truncated(tmp_path):
+    journal = Journal(tmp_path / 'j.ndjson')
+    for n in range(3):
+        journal.append(_record(n))
+    whole = journal.path.read_bytes()
+
+    # Crash in the middle of the fourth write
+    line = (json.dumps(_record(3), ensure_ascii=False) + '\n').encode('utf-8')
+    with open(journal.path, 'ab') as f:
+        f.write(line[:len(line) // 2])
+
+    assert journal.records() == [_record(n) for n in range(3)]
+    assert journal.path.read_bytes() == whole
+    # The next append starts on a fresh line
+    journal.append(_record(4))
+    assert journal.records() == [_record(n) for n in (0, 1, 2, 4)]
+
+
+@pytest.mark.parametrize('cut', [1, 7, -2])
+def test_any_cut_keeps_only_whole_records(tmp_path, cut):
+    journal = Journal(tmp_path / 'j.ndjson')
+    journal.append(_record(0))
+    journal.append(_record(1))
+    data = journal.path.read_bytes()
+    second = data.index(b'\n') + 1
+    journal.path.write_bytes(data[:second + cut] if cut > 0 else data[:cut])
+    assert journal.records() == [_record(0)]
+
+
+def test_missing_journal_has_no_records(tmp_path):
+    journal = Journal(tmp_path / 'absent.ndjson')
+    assert journal.records() == []
+    journal.remove()
+
+
+def test_atomic_write_leaves_no_temp_file(tmp_path):
+    path = tmp_path / 'bank.json'
+    atomic_write_json(path, [{'a': 'ş'}], ensure_ascii=False)
+    assert json.loads(path.read_text(encoding='utf-8')) == [{'a': 'ş'}]
+    assert [p.name for p in tmp_path.iterdir()] == ['bank.json']
+
+
+def test_job_state_round_trip_and_version(tmp_path):
+    state = JobState(tmp_path / 'state.json', [{'topic_id': 'loop'}], [('loop', 'easy', 0)])
+    state.mark_done(('loop', 'easy', 1))
+    loaded = JobState.load(state.path)
+    assert loaded.units == state.units
+    assert loaded.completed == {('loop', 'easy', 0), ('loop', 'easy', 1)}
+
+    state.path.write_text(json.dumps({'version': 0, 'units': [], 'completed': []}), encoding='utf-8')
+    assert JobState.load(state.path) is None
+    state.path.write_text('{"version": 1, "units": [', encoding='utf-8')
+    assert JobState.load(state.path) is None
+
+
+def test_resume_counts_journaled_batches_despite_torn_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(gq, 'OUTPUT_DIR', tmp_path)
+    units = gq.plan_units(['loop'], ['easy', 'hard'])
+    state = JobState(gq.job_state_path(), [asdict(u) for u in units])
+    state.save()
+
+    # Batches 0-2 of loop_easy reached the journal; only batch 0 was marked done
+    # before the crash, and the write of batch 3 was torn
+    easy = [u for u in units if u.difficulty == 'easy']
+    journal = gq.journal_for('loop', 'easy')
+    for unit in easy[:3]:
+        journal.append({'unit': asdict(unit), 'questions': [{'id': f'loop_e_{unit.batch_num}'}]})
+    state.mark_done(easy[0].key)
+    line = json.dumps({'unit': asdict(easy[3]), 'questions': []})
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write(line[:20])
+
+    resumed = gq.resume_state(gq.job_state_path())
+    assert resumed.completed == {u.key for u in easy[:3]}
+    assert [gq.BatchUnit(**u).key for u in resumed.units] == [u.key for u in units]
+    assert journal.path.read_bytes().endswith(b'\n')
+
+    # Compacting folds the journaled batches into the bank exactly once
+    assert gq.compact('loop', 'easy') == 3
+    assert not journal.path.exists()
+    assert gq.compact('loop', 'easy') is None
+    assert [q['id'] for q in gq.load_bank('loop', 'easy')] == ['loop_e_0', 'loop_e_1', 'loop_e_2']
+
+
+def test_no_job_state_means_nothing_to_resume(tmp_path, monkeypatch):
+    monkeypatch.setattr(gq, 'OUTPUT_DIR', tmp_path)
+    assert gq.resume_state(gq.job_state_path()) is None
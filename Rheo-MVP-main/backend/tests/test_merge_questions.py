@@ -0,0 +1,58 @@
+import json
+import shutil
+import subprocess
+import sys
+
+from conftest import ASSETS, BACKEND
+
+MERGE = BACKEND.parent / 'rheo_app' / 'scripts' / 'merge_questions.py'
+SOURCES = sorted((ASSETS / 'questions').glob('*.json'))
+
+
+def _merge(app, *flags):
+    proc = subprocess.run([sys.executable, str(MERGE), *flags], cwd=app, capture_output=True,
+                          text=True, env={'PYTHONUTF8': '1', 'PATH': ''})
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout
+
+
+def _app(root, sources, bank):
+    """rheo_app/ düzeninde bir kopya: assets/questions/*.json ve assets/questions.json."""
+    (root / 'assets' / 'questions').mkdir(parents=True)
+    for source in sources:
+        shutil.copy(source, root / 'assets' / 'questions' / source.name)
+    with open(root / 'assets' / 'questions.json', 'w', encoding='utf-8') as f:
+        json.dump(bank, f, ensure_ascii=False, indent=2)
+    return root
+
+
+def _new_source(app):
+    # Alfabetik olarak en sona gelir: tam birleştirme de onu en son ekler
+    questions = [
+        {'id': f'zz_extra_{i}', 'topic': 'değişkenler', 'difficulty': 1, 'type': 'prediction',
+         'code_snippet': f"ad = 'Çağrı'\nprint(ad * {i})", 'correct_answer': 'Çağrı' * i,
+         'wrong_options': ['Hata', '0', 'None'], 'explanation': 'Metin tekrarı ✓'}
+        for i in range(1, 4)
+    ]
+    with open(app / 'assets' / 'questions' / 'zz_extra.json', 'w', encoding='utf-8') as f:
+        json.dump(questions, f, ensure_ascii=False, indent=2)
+
+
+def test_incremental_merge_matches_full_merge(tmp_path):
+    with open(SOURCES[0], 'r', encoding='utf-8') as f:
+        bank = json.load(f)
+
+    incremental = _app(tmp_path / 'incremental', SOURCES, bank)
+    _merge(incremental)                 # durum yok: banka okunur, yeniler sona eklenir
+    _new_source(incremental)
+    assert 'Added 3,' in _merge(incremental)    # durumdan: yalnızca yeni kaynak okunur
+    assert 'Nothing to merge' in _merge(incremental)
+
+    full = _app(tmp_path / 'full', SOURCES, bank)
+    _new_source(full)
+    _merge(full, '--full')
+
+    expected = (full / 'assets' / 'questions.json').read_bytes()
+    assert (incremental / 'assets' / 'questions.json').read_bytes() == expected
+    # Tam birleştirme de json.dump(indent=2) düzenini korur
+    assert expected == json.dumps(json.loads(expected), ensure_ascii=False, indent=2).encode('utf-8')
@@ -0,0 +1,211 @@
+import asyncio
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from ratelimit import RateController, RateLimitExhausted, TokenBucket, is_throttled, retry_hint
+
+
+class FakeClock:
+    """Monotonic clock that only moves when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+class ApiError(Exception):
+    def __init__(self, message, code=None, **attrs):
+        super().__init__(message)
+        self.code = code
+        self.__dict__.update(attrs)
+
+
+def _controller(clock, **kwargs):
+    bucket = TokenBucket(rate=1000.0, capacity=1000, clock=clock, sleep=clock.sleep)
+    kwargs.setdefault('rng', random.Random(0))
+    return RateController(bucket, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+# ===== retry_hint / is_throttled =====
+
+@pytest.mark.parametrize('exc, expected', [
+    (ApiError("429 Resource has been exhausted. Please retry in 17.3s."), 17.3),
+    (ApiError("quota exceeded\nretry_delay {\n  seconds: 42\n}"), 42.0),
+    (ApiError("Too many requests, Retry-After: 5"), 5.0),
+    (ApiError("slow down", retry_after=3), 3.0),
+    (ApiError("slow down", response=SimpleNamespace(headers={'Retry-After': '7'})), 7.0),
+    (ApiError("retry in 2s", retry_after='soon'), 2.0),  # unusable header: fall back to the text
+    (ApiError("slow down", retry_after=-4), 0.0),
+    (ApiError("500 Internal error"), None),
+])
+def test_retry_hint(exc, expected):
+    assert retry_hint(exc) == expected
+
+
+@pytest.mark.parametrize('exc, expected', [
+    (ApiError("x", code=429), True),
+    (ApiError("x", code=503), True),
+    (ApiError("429 in the message but a 500 status", code=500), False),
+    (ApiError("x", status_code=429), True),
+    (ApiError("Quota exceeded for requests per minute"), True),
+    (ApiError("connection reset"), False),
+])
+def test_is_throttled(exc, expected):
+    assert is_throttled(exc) is expected
+
+
+# ===== TokenBucket =====
+
+def test_bucket_spaces_requests_after_the_burst():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock, sleep=clock.sleep)
+    taken = []
+
+    async def take():
+        await bucket.acquire()
+        taken.append(clock())
+
+    async def main():
+        await asyncio.gather(*(take() for _ in range(5)))
+
+    asyncio.run(main())
+    # Two back to back (burst), then one every 1/rate seconds
+    assert taken == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+
+
+def test_bucket_refills_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=3, clock=clock, sleep=clock.sleep)
+
+    async def main():
+        for _ in range(3):
+            await bucket.acquire()
+        clock.now += 100  # idle: refill stops at capacity
+        waits = [await bucket.acquire() for _ in range(4)]
+        return waits
+
+    assert asyncio.run(main()) == pytest.approx([0.0, 0.0, 0.0, 1.0])
+
+
+def test_bucket_rejects_bad_parameters():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=0.5)
+
+
+# ===== RateController =====
+
+def test_additive_increase_and_cap():
+    clock = FakeClock()
+    controller = _controller(clock, max_concurrency=3, initial=2.0)
+
+    async def ok():
+        return 'ok'
+
+    async def main():
+        for _ in range(50):
+            assert await controller.call(ok) == 'ok'
+
+    controller._on_success()
+    assert controller.limit == pytest.approx(2.5)
+    asyncio.run(main())
+    assert controller.limit == 3
+
+
+def test_multiplicative_decrease_once_per_congestion_event():
+    clock = FakeClock()
+    controller = _controller(clock, max_concurrency=16, initial=8.0)
+
+    clock.now = 1.0
+    controller._on_throttle(started=0.5, hint=None)
+    assert controller.limit == 4.0
+    # Sent before the cut: saw the old limit, no second cut
+    controller._on_throttle(started=0.9, hint=None)
+    assert controller.limit == 4.0
+    # Sent after the cut: a new congestion event
+    clock.now = 2.0
+    controller._on_throttle(started=1.5, hint=None)
+    assert controller.limit == 2.0
+    for _ in range(5):
+        clock.now += 1
+        controller._on_throttle(started=clock.now - 0.5, hint=None)
+    assert controller.limit == controller.min_concurrency
+    assert controller.rate_limited == 8
+
+
+def test_retry_hint_pauses_every_worker():
+    clock = FakeClock()
+    controller = _controller(clock, max_concurrency=4, initial=4.0, base_delay=0.5)
+    calls = []
+
+    async def throttled_once():
+        calls.append(('a', clock()))
+        if len(calls) == 1:
+            raise ApiError("429 Please retry in 10s", code=429)
+        return 'a'
+
+    async def other():
+        calls.append(('b', clock()))
+        return 'b'
+
+    async def main():
+        first = asyncio.create_task(controller.call(throttled_once))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        # Another worker arriving after the 429 waits out the hint too
+        assert controller.paused_until == pytest.approx(10.0)
+        return await asyncio.gather(first, controller.call(other))
+
+    assert asyncio.run(main()) == ['a', 'b']
+    assert calls[0] == ('a', 0.0)
+    assert all(at >= 10.0 for _, at in calls[1:])
+    assert controller.retries == 1
+    # The retry waits the hint plus at most base_delay of jitter
+    assert any(10.0 <= s <= 10.5 for s in clock.sleeps)
+
+
+def test_backoff_without_hint_is_full_jitter_and_capped():
+    clock = FakeClock()
+    controller = _controller(clock, base_delay=1.0, max_delay=8.0)
+    for attempt in range(10):
+        for _ in range(20):
+            assert 0.0 <= controller.backoff(attempt, None) <= min(8.0, 2 ** attempt)
+
+
+def test_gives_up_after_max_attempts():
+    clock = FakeClock()
+    controller = _controller(clock, max_attempts=3)
+    attempts = []
+
+    async def always_throttled():
+        attempts.append(clock())
+        raise ApiError("rate limit", code=429)
+
+    with pytest.raises(RateLimitExhausted):
+        asyncio.run(controller.call(always_throttled))
+    assert len(attempts) == 3 and controller.retries == 2
+
+
+def test_other_errors_are_not_retried():
+    clock = FakeClock()
+    controller = _controller(clock)
+    attempts = []
+
+    async def broken():
+        attempts.append(clock())
+        raise ApiError("500 Internal error", code=500)
+
+    with pytest.raises(ApiError):
+        asyncio.run(controller.call(broken))
+    assert len(attempts) == 1 and controller.retries == 0 and controller.in_flight == 0
@@ -0,0 +1,58 @@
+import shutil
+import subprocess
+import sys
+
+from conftest import BACKEND
+from shards import load_manifest, write_shards
+
+
+def _question(language, topic, difficulty, n=0):
+    return {'id': f'{language}_{topic}_{difficulty}_{n}', 'language': language,
+            'topic': topic, 'difficulty': difficulty}
+
+
+FULL = [_question(lang, topic, level) for lang in ('python', 'java', 'javascript')
+        for topic in ('loops', 'variables') for level in (1, 2)]
+
+
+def test_single_language_run_keeps_other_languages(tmp_path):
+    write_shards(FULL, tmp_path)
+    before = {entry['path']: entry for entry in load_manifest(tmp_path)['shards']}
+
+    # java yeniden üretiliyor; java/loops_2 artık yok
+    java = [q for q in FULL if q['language'] == 'java' and q['id'] != 'java_loops_2_0']
+    stats = write_shards(java, tmp_path, languages={'java'})
+
+    manifest = load_manifest(tmp_path)
+    paths = {entry['path'] for entry in manifest['shards']}
+    assert stats['removed'] == 1 and stats['kept'] == 8
+    assert paths == set(before) - {'java/loops_2.json'}
+    assert not (tmp_path / 'java' / 'loops_2.json').exists()
+    for rel in paths:
+        assert (tmp_path / rel).exists()
+    assert manifest['count'] == len(FULL) - 1
+
+
+def test_topic_scope(tmp_path):
+    write_shards(FULL, tmp_path)
+    loops = [q for q in FULL if q['language'] == 'python' and q['topic'] == 'loops' and q['difficulty'] == 1]
+    stats = write_shards(loops, tmp_path, languages={'python'}, topic='loops')
+    assert stats['removed'] == 1  # python/loops_2
+    assert (tmp_path / 'python' / 'variables_2.json').exists()
+
+
+def test_cli_language_run_after_full_run(tmp_path):
+    # main.py çıktıyı kendi dizinindeki output/ altına yazar; kopyada çalıştırılır
+    backend = tmp_path / 'backend'
+    shutil.copytree(BACKEND, backend, ignore=shutil.ignore_patterns('output', 'tests', '__pycache__'))
+    out = backend / 'output' / 'shards'
+    run = [sys.executable, str(backend / 'main.py'), '--sharded', '--count', '3']
+
+    subprocess.run(run + ['--language', 'all', '--seed', '7'], check=True, capture_output=True)
+    full = {entry['path'] for entry in load_manifest(out)['shards']}
+    subprocess.run(run + ['--language', 'java', '--seed', '8'], check=True, capture_output=True)
+    after = load_manifest(out)['shards']
+
+    others = {path for path in full if not path.startswith('java/')}
+    assert others and others <= {entry['path'] for entry in after}
+    assert all((out / entry['path']).exists() for entry in after)
@@ -0,0 +1,53 @@
+import pytest
+
+from generator import Snippet, SnippetShape
+from generator.snippets import CACHE_LIMIT, SUM_LOOP
+
+
+def test_equal_values_of_different_types_render_separately():
+    snippet = Snippet("{v}|{v!r}")
+    assert [snippet.render(v=v) for v in (1, True, 1.0, 1)] == ['1|1', 'True|True', '1.0|1.0', '1|1']
+    assert len(snippet._cache) == 3
+
+
+def test_cached_render_returns_same_object():
+    snippet = Snippet("{var} = {value}\nprint({var})")
+    first = snippet.render(var='x', value=12345)
+    assert first == "x = 12345\nprint(x)"
+    assert snippet.render(var='x', value=12345) is first
+    assert snippet.render(var='y', value=12345) == "y = 12345\nprint(y)"
+
+
+def test_render_matches_str_format():
+    text = "{a:>4}|{b!r}|{{literal}}|{a}"
+    snippet = Snippet(text)
+    for a, b in [(7, 'x'), (7.5, None), ('s', (1, 2)), (True, 0)]:
+        assert snippet.render(a=a, b=b) == text.format(a=a, b=b)
+
+
+def test_unhashable_values_raise():
+    with pytest.raises(TypeError):
+        Snippet("{items}").render(items=[1, 2])
+
+
+def test_cache_is_bounded():
+    snippet = Snippet("{n}")
+    for n in range(CACHE_LIMIT + 10):
+        assert snippet.render(n=n) == str(n)
+    assert len(snippet._cache) == CACHE_LIMIT
+
+
+def test_slots_are_keyword_only_and_required():
+    snippet = Snippet("{a}{b}")
+    with pytest.raises(TypeError):
+        snippet.render(a=1)
+    with pytest.raises(TypeError):
+        snippet.render(1, 2)
+
+
+def test_shape_variants_share_slots():
+    assert SUM_LOOP['java'].render(n=4).startswith("int sum = 0;\nfor (int i = 0; i < 4; i++) {")
+    with pytest.raises(ValueError):
+        SnippetShape(python="{a}", java="{b}")
+    with pytest.raises(KeyError):
+        SUM_LOOP['ruby']
@@ -0,0 +1,88 @@
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from generator import AliasTable
+from generator.templates import bound_templates, sample_templates, template
+
+DRAWS = 200_000
+
+
+def _assert_matches(counts, weights, draws=DRAWS):
+    total = sum(weights)
+    for i, weight in enumerate(weights):
+        p = weight / total
+        # 5 standart sapma: seed sabit, test kararlı
+        assert abs(counts[i] - draws * p) <= 5 * math.sqrt(draws * p * (1 - p)) + 1, (i, counts[i], draws * p)
+
+
+@pytest.mark.parametrize('weights', [
+    [1, 2, 3, 4],
+    [0.5, 10, 0.25],
+    [7, 1],
+    [1, 1, 1, 5, 1, 1],
+    [0, 3, 0, 1],
+])
+def test_alias_table_frequencies_follow_weights(weights):
+    table = AliasTable(weights)
+    rng = random.Random(42)
+    counts = Counter(table.sample(rng) for _ in range(DRAWS))
+    _assert_matches(counts, weights)
+    assert all(counts[i] == 0 for i, w in enumerate(weights) if w == 0)
+
+
+def test_uniform_weights_use_the_choice_stream():
+    table = AliasTable([2.0] * 5)
+    assert table.uniform
+    a, b = random.Random(7), random.Random(7)
+    assert [table.sample(a) for _ in range(100)] == [b.randrange(5) for _ in range(100)]
+
+
+def test_alias_table_rejects_empty_or_zero_weights():
+    with pytest.raises(ValueError):
+        AliasTable([])
+    with pytest.raises(ValueError):
+        AliasTable([0, 0])
+    with pytest.raises(ValueError):
+        template(topic='t', difficulty=1, weight=0)
+
+
+class _Weighted:
+    """Ağırlıkları farklı üç template'li en küçük generator."""
+
+    def __init__(self, rng):
+        self.rng = rng
+
+    @template(topic='t', difficulty=1, weight=1.0)
+    def rare(self):
+        return 'rare'
+
+    @template(topic='t', difficulty=1, weight=3.0)
+    def common(self):
+        return 'common'
+
+    @template(topic='t', difficulty=2, weight=6.0)
+    def frequent(self):
+        return 'frequent'
+
+    @template(topic='t', difficulty=3, weight=100.0, advanced=True)
+    def hard(self):
+        return 'hard'
+
+
+def test_sample_templates_uses_template_weights():
+    gen = _Weighted(random.Random(3))
+    templates = bound_templates(gen, include_hard=False)
+    counts = Counter(sample_templates(templates, DRAWS, gen.rng))
+    assert set(counts) == {'rare', 'common', 'frequent'}
+    _assert_matches(Counter({i: counts[t.__name__] for i, t in enumerate(templates)}),
+                    [t.meta.weight for t in templates])
+
+
+def test_sample_templates_is_reproducible():
+    templates = bound_templates(_Weighted(None))
+    first = list(sample_templates(templates, 500, random.Random(11)))
+    assert first == list(sample_templates(templates, 500, random.Random(11)))
+    assert 'hard' in first
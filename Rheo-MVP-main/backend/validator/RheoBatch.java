@@ -0,0 +1,62 @@
+// Java Batch Harness
+// JavaRunner bu sınıfı grubun snippet'leriyle aynı javac çağrısında derler ve
+// tek bir JVM'de çalıştırır:
+//     java -cp classes RheoBatch <timeout_ms> <mains.txt>
+// mains.txt: satır başına çalıştırılacak sınıf (s0.Main, s1.Main, ...).
+// stdout: snippet başına "durum<TAB>base64(çıktı)"; durum ok, timeout veya
+// fırlatılan istisnanın adı. Zaman aşımında takılı thread System.out'a yazmaya
+// devam edebileceği için JVM kapanır; kalanları JavaRunner yeni bir JVM'de çalıştırır.
+
+import java.io.ByteArrayOutputStream;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
+import java.util.Base64;
+import java.util.List;
+
+public class RheoBatch {
+    public static void main(String[] args) throws Exception {
+        long timeoutMs = Long.parseLong(args[0]);
+        List<String> mains = Files.readAllLines(Paths.get(args[1]), StandardCharsets.UTF_8);
+        PrintStream channel = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+        PrintStream discard = new PrintStream(OutputStream.nullOutputStream());
+        Base64.Encoder base64 = Base64.getEncoder();
+
+        for (String mainClass : mains) {
+            ByteArrayOutputStream buffer = new ByteArrayOutputStream();
+            PrintStream capture = new PrintStream(buffer, true, "UTF-8");
+            System.setOut(capture);
+            System.setErr(discard);
+            String[] error = {null};
+            Thread runner = new Thread(() -> {
+                try {
+                    Method entry = Class.forName(mainClass).getMethod("main", String[].class);
+                    entry.setAccessible(true);  // main'i içeren sınıf public olmayabilir
+                    entry.invoke(null, (Object) new String[0]);
+                } catch (InvocationTargetException e) {
+                    error[0] = e.getCause().getClass().getSimpleName();
+                } catch (Throwable e) {
+                    error[0] = e.getClass().getSimpleName();
+                }
+            });
+            runner.setDaemon(true);
+            runner.start();
+            runner.join(timeoutMs);
+            capture.flush();
+
+            boolean timedOut = runner.isAlive();
+            String status = timedOut ? "timeout" : (error[0] == null ? "ok" : error[0]);
+            channel.println(status + "\t" + base64.encodeToString(buffer.toByteArray()));
+            if (timedOut) {
+                System.exit(3);
+            }
+        }
+        System.exit(0);
+    }
+}
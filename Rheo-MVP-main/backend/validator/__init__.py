@@ -0,0 +1,37 @@
+# Rheo Answer Validators
+# Üretilen snippet'leri sandbox süreçlerinde çalıştırıp cevapları doğrular.
+from .cache import VerdictCache, snippet_key
+from .core import (
+    FAILING,
+    RUNNERS,
+    VALIDATED_TYPES,
+    ValidationFailed,
+    Validator,
+    Verdict,
+    judge,
+    compact_js,
+    observed_output,
+    validate_stream,
+)
+from .java_runner import JavaRunner
+from .node_runner import NodeRunner
+from .python_runner import ExecResult, PythonRunner
+
+__all__ = [
+    'VerdictCache',
+    'snippet_key',
+    'FAILING',
+    'RUNNERS',
+    'VALIDATED_TYPES',
+    'ValidationFailed',
+    'Validator',
+    'Verdict',
+    'judge',
+    'compact_js',
+    'observed_output',
+    'validate_stream',
+    'ExecResult',
+    'JavaRunner',
+    'NodeRunner',
+    'PythonRunner',
+]
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Soru bankalarını doğrular: her sorunun kodunu çalıştırıp cevabı kontrol eder.
+
+Kullanım (backend/ dizininden):
+    python -m validator --trust-input ../rheo_app/assets/questions ../rheo_app/assets/questions.json
+    python -m validator --trust-input output/questions.ndjson --languages java,javascript --all
+    python -m validator --trust-input ../rheo_app/assets/questions --report output/validation.ndjson
+
+Dizinler için *.json ve *.ndjson dosyaları okunur. Çıkış kodu: hatalı soru
+varsa 1. Araç zinciri (javac/java, node) kurulu olmayan diller atlanır.
+
+Bankalardaki snippet'ler güvenilmeyen koddur (LLM çıktısı, dış kaynak);
+izole süreçlerde çalıştırılsalar da --trust-input verilmeden çalıştırılmaz.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List
+
+from . import FAILING, RUNNERS, Validator, VerdictCache
+
+
+def log(*args) -> None:
+    print(*args, file=sys.stderr)
+
+
+def bank_files(paths: List[Path]) -> List[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix in ('.json', '.ndjson')))
+        else:
+            files.append(path)
+    return files
+
+
+def read_bank(path: Path) -> Iterator[dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix == '.ndjson':
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            data = json.load(f)
+            if isinstance(data, list):
+                yield from data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Rheo soru bankası doğrulayıcı')
+    parser.add_argument('paths', nargs='+', type=Path, help='Banka dosyaları veya dizinleri')
+    parser.add_argument('--types', default='prediction,output',
+                        help='Çalıştırılarak doğrulanacak soru tipleri (default: prediction,output)')
+    parser.add_argument('--languages', default=','.join(RUNNERS),
+                        help=f"Doğrulanacak diller (default: {','.join(RUNNERS)})")
+    parser.add_argument('--workers', type=int, default=None, help='Paralel süreç sayısı (default: CPU sayısı)')
+    parser.add_argument('--timeout', type=float, default=2.0, help='Snippet başına zaman aşımı, saniye')
+    parser.add_argument('--cache', type=Path, default=None, help='Çalıştırma sonuçları önbelleği (NDJSON)')
+    parser.add_argument('--report', type=Path, default=None, help='Soru başına hükümleri NDJSON olarak yaz')
+    parser.add_argument('--all', action='store_true', help='Geçen soruları da listele')
+    parser.add_argument('--trust-input', action='store_true',
+                        help='Banka dosyalarındaki snippet\'leri çalıştırmayı onayla (dış/LLM kaynaklı kod)')
+    args = parser.parse_args()
+    if not args.trust_input:
+        parser.error('bankalardaki snippet\'ler dış kaynaklı koddur; çalıştırmak için --trust-input verin')
+
+    languages = [lang for lang in args.languages.split(',') if lang]
+    cache = VerdictCache(args.cache)
+    report = open(args.report, 'w', encoding='utf-8') if args.report else None
+    started = time.perf_counter()
+    failures = 0
+
+    with Validator(args.workers, args.timeout, cache, types=args.types.split(','), languages=languages) as validator:
+        for path in bank_files(args.paths):
+            for q, verdict in validator.iter_validate(read_bank(path)):
+                failed = verdict.status in FAILING
+                failures += failed
+                if failed or (args.all and verdict.status != 'skipped'):
+                    mark = 'FAIL' if failed else 'PASS'
+                    log(f"{mark} {path.name} {q.get('id')} [{q.get('language', 'python')}] "
+                        f"{verdict.status}{': ' + verdict.detail if verdict.detail else ''}")
+                if report is not None:
+                    report.write(json.dumps({
+                        'file': str(path), 'id': q.get('id'), 'language': q.get('language', 'python'),
+                        'status': verdict.status, 'actual': verdict.actual, 'detail': verdict.detail,
+                    }, ensure_ascii=False) + '\n')
+    cache.save()
+    if report is not None:
+        report.close()
+
+    elapsed = time.perf_counter() - started
+    log("\n🧪 " + ', '.join(f"{status}: {n}" for status, n in sorted(validator.stats.items())))
+    for language, (count, seconds) in sorted(validator.timing.items()):
+        rate = count / seconds if seconds else 0.0
+        log(f"   {language}: {count} snippet, {seconds:.2f} sn ({rate:.0f} snippet/sn)")
+    for language in sorted(validator.unavailable):
+        tools = '/'.join(RUNNERS[language].tools) if hasattr(RUNNERS[language], 'tools') else language
+        log(f"   {language}: araç zinciri ({tools}) bulunamadı, atlandı")
+    log(f"   Toplam {elapsed:.2f} sn, önbellekte {len(cache)} sonuç")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+'use strict';
+// Node Batch Harness
+// NodeRunner bu dosyayı grup başına bir kez çalıştırır:
+//     node _node_harness.js <timeout_ms>  < snippets.json
+// stdin: snippet kodlarının JSON dizisi. stdout: snippet başına bir satır
+// {"stdout", "error", "timeout"}. Her snippet kendi vm bağlamında çalışır;
+// console çıktısı yakalanır, setTimeout/setImmediate sanal bir saatle
+// sırayla çalıştırılır (gerçek bekleme yok).
+
+const util = require('util');
+const vm = require('vm');
+
+const TIMER_LIMIT = 10000;
+
+let reportAsyncError = null;
+process.on('unhandledRejection', (reason) => {
+  if (reportAsyncError) reportAsyncError(reason);
+});
+
+function errorName(e) {
+  return e && typeof e.name === 'string' ? e.name : 'Error';
+}
+
+function flushMicrotasks() {
+  return new Promise((resolve) => setImmediate(resolve));
+}
+
+function makeSandbox(lines) {
+  const timers = [];
+  const state = { clock: 0, seq: 0 };
+  const log = (...args) => { lines.push(util.format(...args)); };
+  const schedule = (fn, ms, args) => {
+    const id = ++state.seq;
+    timers.push({ at: state.clock + (Number(ms) || 0), id, fn, args });
+    return id;
+  };
+  const cancel = (id) => {
+    const index = timers.findIndex((t) => t.id === id);
+    if (index >= 0) timers.splice(index, 1);
+  };
+  const context = vm.createContext({
+    console: { log, info: log, warn: log, error: log, debug: log },
+    setTimeout: (fn, ms, ...args) => schedule(fn, ms, args),
+    setImmediate: (fn, ...args) => schedule(fn, 0, args),
+    clearTimeout: cancel,
+    clearImmediate: cancel,
+    queueMicrotask: (fn) => { Promise.resolve().then(fn); },
+  });
+  return { context, timers, state };
+}
+
+async function runSnippet(code, timeoutMs) {
+  const lines = [];
+  const { context, timers, state } = makeSandbox(lines);
+  let error = null;
+  reportAsyncError = (e) => { if (error === null) error = errorName(e); };
+  const result = (timeout) => ({
+    stdout: lines.length ? lines.join('\n') + '\n' : '',
+    error,
+    timeout,
+  });
+
+  try {
+    vm.runInContext(code, context, { timeout: timeoutMs });
+  } catch (e) {
+    if (e && e.code === 'ERR_SCRIPT_EXECUTION_TIMEOUT') return result(true);
+    error = errorName(e);
+  }
+  await flushMicrotasks();
+
+  const started = Date.now();
+  let fired = 0;
+  while (error === null && timers.length) {
+    timers.sort((a, b) => a.at - b.at || a.id - b.id);
+    const timer = timers.shift();
+    state.clock = Math.max(state.clock, timer.at);
+    try {
+      if (typeof timer.fn === 'function') timer.fn(...timer.args);
+    } catch (e) {
+      error = errorName(e);
+    }
+    await flushMicrotasks();
+    if (++fired > TIMER_LIMIT || Date.now() - started > timeoutMs) return result(true);
+  }
+  return result(false);
+}
+
+async function main() {
+  const timeoutMs = Number(process.argv[2]) || 2000;
+  const chunks = [];
+  for await (const chunk of process.stdin) chunks.push(chunk);
+  const snippets = JSON.parse(Buffer.concat(chunks).toString('utf8'));
+  for (const code of snippets) {
+    const reply = await runSnippet(code, timeoutMs);
+    process.stdout.write(JSON.stringify(reply) + '\n');
+  }
+  reportAsyncError = null;
+}
+
+main();
@@ -0,0 +1,100 @@
+"""
+Python Sandbox Worker
+PythonRunner bu dosyayı `python -I -S`, temizlenmiş bir ortam ve (Linux'ta)
+ağsız bir isim alanıyla ayrı süreç olarak başlatır; modül olarak import edilmez.
+
+Protokol: stdin'den satır başına {"code": ..., "timeout": ...} okur, her
+snippet için stdout'a tek satır {"stdout": ..., "error": ..., "timeout": ...}
+yazar. Snippet'in print'leri StringIO'ya gider; fd 1 /dev/null'a çevrildiği
+için snippet protokol akışını bozamaz.
+
+Kısıtlar: dosya yazma yok (RLIMIT_FSIZE=0), bellek sınırı, open/input/
+exit yok, import yalnızca saf hesap modülleriyle (socket, os, subprocess yok).
+
+Snippet'ler yalnızca bizim template'lerimizden gelmez: main.py --input ve
+python -m validator LLM ile üretilmiş veya dışarıdan gelen bankaları
+çalıştırır, yani kod güvenilmezdir. Builtins/import kısıtları tek başına
+kaçışı engellemez (ör. nesne iç yapısı üzerinden); asıl sınır süreç
+izolasyonudur (bkz. isolation.py). Bu yüzden iki CLI de dış bankaları
+yalnızca --trust-input ile açıkça onaylandığında çalıştırır.
+"""
+
+import builtins
+import io
+import json
+import os
+import signal
+import sys
+
+ALLOWED_MODULES = {
+    'bisect', 'collections', 'copy', 'dataclasses', 'decimal', 'enum', 'fractions', 'functools',
+    'heapq', 'itertools', 'math', 'operator', 'random', 're', 'statistics', 'string', 'typing',
+}
+BLOCKED_BUILTINS = {'open', 'input', 'exit', 'quit', 'help', 'breakpoint', 'compile', 'eval', 'exec'}
+MEMORY_LIMIT = 512 * 1024 * 1024
+
+
+class SnippetTimeout(BaseException):
+    """Snippet'in kendi except Exception bloğu yakalayamasın diye BaseException."""
+
+
+def _on_alarm(signum, frame):
+    raise SnippetTimeout()
+
+
+def _safe_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if name.partition('.')[0] not in ALLOWED_MODULES:
+        raise ImportError(f"import engellendi: {name}")
+    return builtins.__import__(name, globals, locals, fromlist, level)
+
+
+def _limit_resources() -> None:
+    try:
+        import resource
+    except ImportError:  # Windows: yalnızca zaman aşımı uygulanır
+        return
+    resource.setrlimit(resource.RLIMIT_FSIZE, (0, 0))
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (MEMORY_LIMIT, MEMORY_LIMIT))
+    except (ValueError, OSError):
+        pass
+
+
+def main() -> None:
+    # Protokol kanalını ayır, fd 1'i kapat
+    channel = os.fdopen(os.dup(1), 'w', encoding='utf-8')
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    _limit_resources()
+    safe_builtins = {k: v for k, v in vars(builtins).items() if k not in BLOCKED_BUILTINS}
+    safe_builtins['__import__'] = _safe_import
+    has_alarm = hasattr(signal, 'setitimer')
+    if has_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        captured = io.StringIO()
+        reply = {'stdout': '', 'error': None, 'timeout': False}
+        sys.stdout = captured
+        try:
+            if has_alarm:
+                signal.setitimer(signal.ITIMER_REAL, request['timeout'])
+            exec(request['code'], {'__builtins__': dict(safe_builtins), '__name__': '__snippet__'})
+        except SnippetTimeout:
+            reply['timeout'] = True
+        except BaseException as e:  # SystemExit dahil: snippet'in sonucu sayılır
+            reply['error'] = type(e).__name__
+        finally:
+            if has_alarm:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+            sys.stdout = sys.__stdout__
+        reply['stdout'] = captured.getvalue()
+        channel.write(json.dumps(reply, ensure_ascii=False) + '\n')
+        channel.flush()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Batch Runner
+Başlatması pahalı araç zincirleri (JVM, Node) için ortak havuz: snippet'ler
+batch_size'lık gruplara bölünür, her grup tek bir süreçte çalışır ve gruplar
+`workers` kadar paralel yürür. Böylece süreç başlatma maliyeti snippet başına
+değil grup başına ödenir.
+
+Alt sınıf _run_batch'i yazar: grubun baştan itibaren tamamlanan sonuçlarını
+ve süreç erken bittiyse nedenini ('timeout' / 'crash') döner. Süreç bir
+snippet'te ölürse o snippet işaretlenir, kalanlar yeni bir süreçte
+çalıştırılır.
+"""
+
+import abc
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .python_runner import DEFAULT_TIMEOUT, ExecResult
+
+STARTUP_GRACE = 10.0
+
+
+class BatchRunner(abc.ABC):
+    language = ''
+    tools: Tuple[str, ...] = ()
+    batch_size = 200
+
+    def __init__(self, workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+                 batch_size: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.batch_size = batch_size or self.batch_size
+        self.paths = {tool: shutil.which(tool) for tool in self.tools}
+        self._tmp = tempfile.TemporaryDirectory(prefix=f'rheo-{self.language}-')
+        self.processes = 0
+
+    @classmethod
+    def available(cls) -> bool:
+        return all(shutil.which(tool) for tool in cls.tools)
+
+    def __enter__(self) -> 'BatchRunner':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def deadline(self, size: int) -> float:
+        """Bir grubun süreç düzeyindeki üst süresi (snippet zaman aşımları ayrıca uygulanır)."""
+        return STARTUP_GRACE + self.timeout * size
+
+    @abc.abstractmethod
+    def _run_batch(self, batch: List[str]) -> Tuple[List[ExecResult], Optional[str]]:
+        """Grubu tek süreçte çalıştırır; tamamlanan sonuçlar ve erken bitişin nedeni."""
+
+    def _run_resilient(self, batch: List[str]) -> List[ExecResult]:
+        results: List[ExecResult] = []
+        pending = batch
+        while pending:
+            self.processes += 1
+            got, failure = self._run_batch(pending)
+            results.extend(got)
+            pending = pending[len(got):]
+            if pending and not got:
+                # Süreç ilk snippet'te öldü: suçlu o
+                if failure == 'timeout':
+                    results.append(ExecResult('', timeout=True))
+                else:
+                    results.append(ExecResult('', error='SandboxCrash'))
+                pending = pending[1:]
+        return results
+
+    def run_many(self, snippets: Sequence[str]) -> Dict[str, ExecResult]:
+        """Her farklı snippet'i bir kez çalıştırır; snippet -> sonuç."""
+        unique = list(dict.fromkeys(snippets))
+        batches = [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+        if not batches:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(batches))) as pool:
+            outputs = list(pool.map(self._run_resilient, batches))
+        results = {}
+        for batch, output in zip(batches, outputs):
+            results.update(zip(batch, output))
+        return results
+
+    def workdir(self) -> str:
+        """Grup başına ayrı geçici dizin (paralel gruplar çakışmasın)."""
+        return tempfile.mkdtemp(dir=self._tmp.name, prefix=f'b{time.monotonic_ns()}-')
+
+    def close(self) -> None:
+        self._tmp.cleanup()
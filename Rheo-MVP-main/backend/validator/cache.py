@@ -0,0 +1,63 @@
+"""
+Verdict Cache
+Snippet çalıştırma sonuçlarının kalıcı önbelleği. Anahtar (dil, normalize
+edilmiş kod) üzerinden blake2b; doğru cevap anahtara girmez, böylece aynı
+kodlu sorular (farklı ID / şık) tek çalıştırmayı paylaşır.
+
+Dosya NDJSON'dır ve FingerprintIndex gibi save() yalnızca yeni kayıtları
+sonuna ekler. Zaman aşımları saklanmaz: makine yüküne bağlı olabilirler.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from generator.dedupe import normalize_code
+
+from .python_runner import ExecResult
+
+# Sandbox / karşılaştırma kuralları değişirse eski kayıtlar geçersiz olsun
+CACHE_VERSION = 1
+
+
+def snippet_key(language: str, code: str) -> str:
+    data = f"{CACHE_VERSION}\x1f{language}\x1f{normalize_code(code)}"
+    return hashlib.blake2b(data.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class VerdictCache:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._results: Dict[str, ExecResult] = {}
+        self._pending = []
+        if path is not None and path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        self._results[record['key']] = ExecResult(record['stdout'], record['error'])
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, key: str) -> Optional[ExecResult]:
+        return self._results.get(key)
+
+    def put(self, key: str, result: ExecResult) -> None:
+        if result.timeout or result.error == 'SandboxCrash' or key in self._results:
+            return
+        self._results[key] = result
+        self._pending.append(key)
+
+    def save(self) -> None:
+        """Yeni kayıtları dosyanın sonuna ekler."""
+        if self.path is None or not self._pending:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for key in self._pending:
+                result = self._results[key]
+                f.write(json.dumps({'key': key, 'stdout': result.stdout, 'error': result.error},
+                                   ensure_ascii=False) + '\n')
+        self._pending = []
@@ -0,0 +1,221 @@
+"""
+Answer Validation
+Sorunun code_snippet'ini gerçekten çalıştırıp çıktıyı correct_answer ile
+karşılaştırır; yanlış şıklardan biri gerçek çıktıya eşitse soruyu belirsiz
+sayar.
+
+Çıktı normalizasyonu generator'ların kurallarını izler:
+- boş stdout -> "(Çıktı yok)"
+- istisna    -> "Error" (elle yazılmış bankada "Hata oluşur" da kabul)
+- sondaki satır sonları atılır; çok satırlı çıktı "\\n" ile karşılaştırılır
+- JavaScript'te dizi/nesne çıktısı iki tarafta da sıkıştırılır: Node'un
+  `[ 'a', 2 ]` biçimi ile elle yazılmış `["a", 2]` / `[a,2]` aynı sayılır
+
+Java ve JavaScript runner'ları yalnızca araç zinciri (javac/java, node)
+kuruluysa kullanılır; değilse o dilin soruları 'skipped' olur.
+"""
+
+import re
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from generator.question import NO_OUTPUT
+
+from .cache import VerdictCache, snippet_key
+from .java_runner import JavaRunner
+from .node_runner import NodeRunner
+from .python_runner import DEFAULT_TIMEOUT, ExecResult, PythonRunner
+
+ERROR_ANSWERS = ("Error", "Hata", "Hata oluşur")
+
+# Yalnızca "bu kodun çıktısı nedir?" soruları çalıştırılarak doğrulanabilir
+VALIDATED_TYPES = ('prediction',)
+
+# Dil -> runner sınıfı; runner'lar ilk ihtiyaçta başlatılır
+RUNNERS = {
+    'python': PythonRunner,
+    'java': JavaRunner,
+    'javascript': NodeRunner,
+}
+
+FAILING = ('mismatch', 'ambiguous', 'timeout', 'error')
+DEFAULT_BATCH_SIZE = 2000
+
+
+class ValidationFailed(RuntimeError):
+    """--validate fail: doğrulanamayan ilk soru."""
+
+
+class Verdict(NamedTuple):
+    status: str                  # ok | mismatch | ambiguous | timeout | error | skipped
+    actual: Optional[str] = None
+    detail: str = ''
+
+
+_JS_PUNCT = re.compile(r"\s*([\[\]{}(),:])\s*")
+_JS_KEY = re.compile(r'"(\w+)":')
+
+
+def compact_js(text: str) -> str:
+    """Node inspect / JSON / elle yazılmış dizi-nesne biçimlerini tek biçime indirger."""
+    text = _JS_PUNCT.sub(r'\1', text.replace("'", '"'))
+    return _JS_KEY.sub(r'\1:', text)
+
+
+NORMALIZERS: Dict[str, Callable[[str], str]] = {
+    'javascript': compact_js,
+}
+
+
+def observed_output(result: ExecResult) -> Optional[str]:
+    """Çalıştırma sonucunu cevap şıklarıyla karşılaştırılabilir metne çevirir."""
+    if result.timeout:
+        return None
+    if result.error:
+        return ERROR_ANSWERS[0]
+    text = result.stdout.replace('\r\n', '\n').rstrip('\n')
+    return text if text else NO_OUTPUT
+
+
+def _matches(answer: str, actual: str, normalize: Optional[Callable[[str], str]] = None) -> bool:
+    if actual == ERROR_ANSWERS[0]:
+        return answer in ERROR_ANSWERS
+    if normalize is not None:
+        return normalize(answer) == normalize(actual)
+    return answer == actual
+
+
+def judge(question: dict, result: ExecResult) -> Verdict:
+    """Tek sorunun çalıştırma sonucuna göre hükmü."""
+    normalize = NORMALIZERS.get(question.get('language', 'python'))
+    actual = observed_output(result)
+    if actual is None:
+        return Verdict('timeout', None, 'snippet zaman aşımına uğradı')
+    if result.error == 'SandboxCrash':
+        return Verdict('error', None, 'sandbox süreci çöktü (bellek/CPU sınırı)')
+
+    # Yalnızca sondaki satır sonu atılır: strip() sorularında boşluk cevabın parçası
+    expected = str(question.get('correct_answer', '')).rstrip('\n')
+    if not _matches(expected, actual, normalize):
+        shown = f"{actual} ({result.error})" if result.error else actual
+        return Verdict('mismatch', actual, f"beklenen {expected!r}, çıktı {shown!r}")
+
+    for option in question.get('wrong_options', []):
+        if _matches(str(option).rstrip('\n'), actual, normalize):
+            return Verdict('ambiguous', actual, f"yanlış şık gerçek çıktıyla aynı: {option!r}")
+    return Verdict('ok', actual)
+
+
+class Validator:
+    """
+    Soruları dil bazında gruplayıp runner havuzlarında doğrular. Aynı kod
+    bir kez çalıştırılır; sonuçlar VerdictCache'te saklanır. timing dil
+    başına (çalıştırılan snippet, saniye) tutar.
+    """
+
+    def __init__(self, workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT,
+                 cache: Optional[VerdictCache] = None, types: Sequence[str] = VALIDATED_TYPES,
+                 languages: Optional[Sequence[str]] = None):
+        self.workers = workers
+        self.timeout = timeout
+        self.cache = cache if cache is not None else VerdictCache()
+        self.types = tuple(types)
+        self.languages = tuple(languages) if languages is not None else tuple(RUNNERS)
+        self.stats: Counter = Counter()
+        self.executed = 0
+        self.timing: Dict[str, List[float]] = {}
+        self.unavailable: Set[str] = set()
+        self._runners: Dict[str, object] = {}
+
+    def __enter__(self) -> 'Validator':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def supports(self, language: str) -> bool:
+        """Dilin runner'ı seçili ve araç zinciri kurulu mu (sonuç önbelleğe alınır)."""
+        if language not in self.languages or language not in RUNNERS or language in self.unavailable:
+            return False
+        if language not in self._runners and not RUNNERS[language].available():
+            self.unavailable.add(language)
+            return False
+        return True
+
+    def _runner(self, language: str):
+        runner = self._runners.get(language)
+        if runner is None:
+            runner = self._runners[language] = RUNNERS[language](workers=self.workers, timeout=self.timeout)
+        return runner
+
+    def validate_batch(self, questions: List[dict]) -> List[Verdict]:
+        """Bir grup sorunun hükümlerini aynı sırayla döner."""
+        keys: List[Optional[str]] = []
+        missing: Dict[str, Dict[str, str]] = {}
+        for q in questions:
+            language = q.get('language', 'python')
+            if q.get('type') not in self.types or not isinstance(q.get('correct_answer'), str) \
+                    or not self.supports(language):
+                keys.append(None)
+                continue
+            key = snippet_key(language, q['code_snippet'])
+            keys.append(key)
+            if self.cache.get(key) is None:
+                missing.setdefault(language, {})[key] = q['code_snippet']
+
+        fresh: Dict[str, ExecResult] = {}
+        for language, by_key in missing.items():
+            started = time.perf_counter()
+            results = self._runner(language).run_many(list(by_key.values()))
+            timing = self.timing.setdefault(language, [0, 0.0])
+            timing[0] += len(results)
+            timing[1] += time.perf_counter() - started
+            self.executed += len(results)
+            for key, code in by_key.items():
+                fresh[key] = results[code]
+                self.cache.put(key, results[code])
+
+        verdicts = []
+        for q, key in zip(questions, keys):
+            if key is None:
+                verdict = Verdict('skipped')
+            else:
+                verdict = judge(q, fresh.get(key) or self.cache.get(key))
+            self.stats[verdict.status] += 1
+            verdicts.append(verdict)
+        return verdicts
+
+    def iter_validate(self, questions: Iterable[dict],
+                      batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[Tuple[dict, Verdict]]:
+        """Akışı batch_size'lık gruplar halinde doğrular (sabit bellek)."""
+        batch: List[dict] = []
+        for q in questions:
+            batch.append(q)
+            if len(batch) >= batch_size:
+                yield from zip(batch, self.validate_batch(batch))
+                batch = []
+        if batch:
+            yield from zip(batch, self.validate_batch(batch))
+
+    def close(self) -> None:
+        for runner in self._runners.values():
+            runner.close()
+        self._runners = {}
+
+
+def validate_stream(questions: Iterable[dict], validator: Validator, policy: str = 'report',
+                    report: Optional[Callable[[dict, Verdict], None]] = None) -> Iterator[dict]:
+    """
+    policy: report -> hepsini geçir, hatalıları bildir; drop -> hatalıları at;
+    fail -> ilk hatalı soruda ValidationFailed.
+    """
+    for q, verdict in validator.iter_validate(questions):
+        if verdict.status in FAILING:
+            if policy == 'fail':
+                raise ValidationFailed(f"{q.get('id')}: {verdict.status} - {verdict.detail}")
+            if report is not None:
+                report(q, verdict)
+            if policy == 'drop':
+                continue
+        yield q
@@ -0,0 +1,47 @@
+"""
+Process Isolation
+Snippet çalıştıran alt süreçlerin ortak başlatma kuralları. Snippet'ler
+--input ile verilen veya LLM ile üretilmiş bankalardan gelebilir, yani
+güvenilmeyen koddur:
+- ortam temizlenir: üst sürecin değişkenleri (token'lar, proxy'ler,
+  PYTHONPATH, NODE_OPTIONS, JAVA_TOOL_OPTIONS ...) alt sürece geçmez
+- Linux'ta süreç `unshare -rn` ile ağ arayüzü olmayan yeni bir ağ
+  isim alanında başlatılır; unshare yoksa veya kullanıcı isim alanları
+  kapalıysa yalnızca dil sandbox'larının kendi kısıtları kalır
+"""
+
+import os
+import shutil
+import subprocess
+from functools import lru_cache
+from typing import Dict, List, Sequence
+
+
+def scrubbed_env(**extra: str) -> Dict[str, str]:
+    """Yalnızca araç zincirlerinin çalışması için gereken değişkenler + extra."""
+    env = {'PATH': os.defpath, 'LANG': 'C.UTF-8', 'LC_ALL': 'C.UTF-8'}
+    if os.name == 'nt':
+        # Windows'ta süreçler SYSTEMROOT olmadan başlayamaz
+        env['SYSTEMROOT'] = os.environ.get('SYSTEMROOT', r'C:\Windows')
+    env.update(extra)
+    return env
+
+
+@lru_cache(maxsize=None)
+def _unshare() -> List[str]:
+    """Ağsız isim alanı öneki; desteklenmiyorsa boş liste (sonuç süreç boyunca saklanır)."""
+    path = shutil.which('unshare')
+    if path is None:
+        return []
+    prefix = [path, '--map-root-user', '--net']
+    try:
+        probe = subprocess.run([*prefix, 'true'], env=scrubbed_env(),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        return []
+    return prefix if probe.returncode == 0 else []
+
+
+def offline(command: Sequence[str]) -> List[str]:
+    """command'ı mümkünse ağ erişimi olmadan çalışacak şekilde sarar."""
+    return [*_unshare(), *command]
@@ -0,0 +1,151 @@
+"""
+Java Runner
+Bir gruptaki tüm snippet'leri tek javac çağrısında derleyip tek JVM'de
+(RheoBatch harness'i) çalıştırır. JVM başlangıcı ve javac ısınması grup
+başına bir kez ödenir.
+
+Her snippet kendi paketine (s0, s1, ...) yazılır; böylece farklı
+snippet'lerdeki aynı adlı sınıflar (Main, Animal, ...) çakışmaz.
+- Tam program (static void main içeren) olduğu gibi kalır.
+- Deyim biçimindeki snippet (generator'ların ürettiği, yerel sınıflar dahil)
+  `public class Main { public static void main(...) { ... } }` içine sarılır.
+Derlenemeyen snippet'ler javac çıktısından bulunur, CompileError sayılır ve
+kalanlar yeniden derlenir.
+"""
+
+import base64
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from .batch_runner import BatchRunner
+from .isolation import offline, scrubbed_env
+from .python_runner import ExecResult
+
+HARNESS = Path(__file__).with_name('RheoBatch.java')
+COMPILE_ATTEMPTS = 3
+
+_IMPORT = re.compile(r'^\s*import\s+[\w.*]+\s*;\s*$', re.M)
+_PUBLIC_CLASS = re.compile(r'\bpublic\s+(?:final\s+)?class\s+(\w+)')
+_CLASS = re.compile(r'\bclass\s+(\w+)')
+_MAIN = re.compile(r'\bstatic\s+void\s+main\s*\(')
+_ERROR_FILE = re.compile(r'[/\\]s(\d+)[/\\]\w+\.java')
+
+
+def java_source(package: str, code: str) -> Tuple[str, str]:
+    """Snippet'i derlenebilir kaynağa çevirir; (ana sınıf adı, kaynak) döner."""
+    imports = dict.fromkeys(['import java.util.*;'] + [m.group(0).strip() for m in _IMPORT.finditer(code)])
+    body = _IMPORT.sub('', code)
+    header = f"package {package};\n" + '\n'.join(imports) + '\n'
+
+    main = _MAIN.search(body)
+    if main is None:
+        indented = '\n'.join('        ' + line for line in body.strip('\n').split('\n'))
+        return 'Main', (
+            f"{header}public class Main {{\n"
+            f"    public static void main(String[] args) throws Exception {{\n{indented}\n    }}\n}}\n"
+        )
+
+    public = _PUBLIC_CLASS.search(body)
+    if public is not None:
+        return public.group(1), header + body
+    # main'i içeren sınıf: main'den önceki son sınıf bildirimi
+    owners = [m.group(1) for m in _CLASS.finditer(body, 0, main.start())]
+    return (owners[-1] if owners else 'Main'), header + body
+
+
+class JavaRunner(BatchRunner):
+    language = 'java'
+    tools = ('javac', 'java')
+    batch_size = 200
+
+    def _compile(self, work: Path, files: Dict[int, Path]) -> Set[int]:
+        """Derlenebilenleri derler; derlenemeyen snippet indekslerini döner."""
+        failed: Set[int] = set()
+        remaining = dict(files)
+        for _ in range(COMPILE_ATTEMPTS):
+            if not remaining:
+                break
+            proc = subprocess.run(
+                [self.paths['javac'], '-d', str(work / 'classes'), '-encoding', 'UTF-8', '-nowarn',
+                 '-proc:none', str(work / HARNESS.name), *map(str, remaining.values())],
+                capture_output=True, text=True, env=scrubbed_env(), timeout=self.deadline(len(remaining)),
+            )
+            if proc.returncode == 0:
+                return failed
+            bad = {int(i) for i in _ERROR_FILE.findall(proc.stderr)} & set(remaining)
+            if not bad:
+                break
+            failed |= bad
+            for i in bad:
+                del remaining[i]
+        if remaining:
+            # Hatalı dosya tespit edilemedi veya deneme hakkı bitti
+            failed |= set(remaining)
+        return failed
+
+    def _run_batch(self, batch: List[str]) -> Tuple[List[ExecResult], Optional[str]]:
+        work = Path(self.workdir())
+        shutil.copy(HARNESS, work / HARNESS.name)
+        files: Dict[int, Path] = {}
+        mains: Dict[int, str] = {}
+        for i, code in enumerate(batch):
+            name, source = java_source(f"s{i}", code)
+            path = work / 'src' / f"s{i}" / f"{name}.java"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(source, encoding='utf-8')
+            files[i] = path
+            mains[i] = f"s{i}.{name}"
+
+        try:
+            failed = self._compile(work, files)
+        except subprocess.TimeoutExpired:
+            return [], 'timeout'
+        runnable = [i for i in range(len(batch)) if i not in failed]
+
+        replies: List[ExecResult] = []
+        failure = None
+        if runnable:
+            (work / 'mains.txt').write_text('\n'.join(mains[i] for i in runnable) + '\n', encoding='utf-8')
+            try:
+                proc = subprocess.run(
+                    offline([self.paths['java'], '-Xss8m', '-cp', str(work / 'classes'), 'RheoBatch',
+                             str(int(self.timeout * 1000)), str(work / 'mains.txt')]),
+                    capture_output=True, env=scrubbed_env(), timeout=self.deadline(len(runnable)),
+                )
+                output = proc.stdout
+            except subprocess.TimeoutExpired as e:
+                output, failure = e.stdout or b'', 'timeout'
+            replies = parse_replies(output.decode('utf-8', 'replace'))
+            if failure is None and len(replies) < len(runnable):
+                failure = 'crash'
+
+        # Derleme hatalarını çalıştırma sonuçlarıyla grup sırasında birleştir;
+        # JVM erken kapandıysa yalnızca tamamlanan önek döner
+        results: List[ExecResult] = []
+        answers = iter(replies)
+        for i in range(len(batch)):
+            if i in failed:
+                results.append(ExecResult('', error='CompileError'))
+                continue
+            reply = next(answers, None)
+            if reply is None:
+                break
+            results.append(reply)
+        return results, (failure if len(results) < len(batch) else None)
+
+
+def parse_replies(output: str) -> List[ExecResult]:
+    results = []
+    for line in output.splitlines():
+        status, sep, payload = line.partition('\t')
+        if not sep:
+            break
+        stdout = base64.b64decode(payload).decode('utf-8', 'replace')
+        if status == 'timeout':
+            results.append(ExecResult(stdout, timeout=True))
+        else:
+            results.append(ExecResult(stdout, None if status == 'ok' else status))
+    return results
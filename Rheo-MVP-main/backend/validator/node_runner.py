@@ -0,0 +1,46 @@
+"""
+Node Runner
+JavaScript snippet'lerini grup başına tek bir `node` sürecinde çalıştırır
+(_node_harness.js). Node başlangıcı (~40 ms) grup başına bir kez ödenir.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .batch_runner import BatchRunner
+from .isolation import offline, scrubbed_env
+from .python_runner import ExecResult
+
+HARNESS = Path(__file__).with_name('_node_harness.js')
+
+
+def parse_replies(output: str) -> List[ExecResult]:
+    results = []
+    for line in output.splitlines():
+        try:
+            reply = json.loads(line)
+        except ValueError:
+            break  # Öldürülen sürecin yarım kalan son satırı
+        results.append(ExecResult(reply['stdout'], reply['error'], reply['timeout']))
+    return results
+
+
+class NodeRunner(BatchRunner):
+    language = 'javascript'
+    tools = ('node',)
+    batch_size = 500
+
+    def _run_batch(self, batch: List[str]) -> Tuple[List[ExecResult], Optional[str]]:
+        try:
+            proc = subprocess.run(
+                offline([self.paths['node'], str(HARNESS), str(int(self.timeout * 1000))]),
+                input=json.dumps(batch), capture_output=True, text=True, encoding='utf-8',
+                cwd=self.workdir(), env=scrubbed_env(), timeout=self.deadline(len(batch)),
+            )
+        except subprocess.TimeoutExpired as e:
+            output = e.stdout.decode('utf-8', 'replace') if isinstance(e.stdout, bytes) else (e.stdout or '')
+            return parse_replies(output), 'timeout'
+        results = parse_replies(proc.stdout)
+        return results, None if len(results) == len(batch) else 'crash'
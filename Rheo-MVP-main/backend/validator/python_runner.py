@@ -0,0 +1,155 @@
+"""
+Python Runner
+Snippet'leri kalıcı sandbox süreçlerinde (_sandbox.py) çalıştırır.
+
+Her süreç binlerce snippet'i sırayla çalıştırır; snippet başına süreç
+başlatılmadığı için 100k soru dakikalar içinde doğrulanır. Zaman aşımı iki
+katmanlı: süreç içi SIGALRM bytecode döngülerini keser; C seviyesinde
+takılan bir snippet (ör. sum(range(10**12))) için üst süreç yanıtı
+timeout + GRACE saniye bekler, sonra süreci öldürüp yenisini başlatır.
+Süreçler izole başlatılır (python -I, temiz ortam, ağsız; bkz. isolation.py).
+"""
+
+import json
+import os
+import queue
+import selectors
+import subprocess
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from .isolation import offline, scrubbed_env
+
+SANDBOX = Path(__file__).with_name('_sandbox.py')
+DEFAULT_TIMEOUT = 2.0
+GRACE = 1.0
+
+
+class ExecResult(NamedTuple):
+    stdout: str
+    error: Optional[str] = None    # snippet'in fırlattığı istisnanın adı
+    timeout: bool = False
+
+
+class _Worker:
+    """Tek bir sandbox süreci ve ona bağlı istek/yanıt kanalı."""
+
+    def __init__(self, workdir: str):
+        self.workdir = workdir
+        self.proc = None
+        self.selector = None
+        self._start()
+
+    def _start(self) -> None:
+        self.proc = subprocess.Popen(
+            # -I: PYTHON* değişkenleri, kullanıcı site-packages'ı ve betik dizini yok sayılır.
+            # Hash tohumu da rastgele olur; çıktısı str hash sırasına bağlı bir snippet'in
+            # tek doğru cevabı zaten yoktur
+            offline([sys.executable, '-I', '-S', str(SANDBOX)]),
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            cwd=self.workdir, env=scrubbed_env(),
+            text=True, encoding='utf-8', bufsize=1,
+        )
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.proc.stdout, selectors.EVENT_READ)
+
+    def run(self, code: str, timeout: float) -> ExecResult:
+        try:
+            self.proc.stdin.write(json.dumps({'code': code, 'timeout': timeout}) + '\n')
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError):
+            self.restart()
+            return ExecResult('', error='SandboxCrash')
+        if not self.selector.select(timeout + GRACE):
+            self.restart()
+            return ExecResult('', timeout=True)
+        line = self.proc.stdout.readline()
+        if not line:
+            # Bellek/CPU sınırı süreci öldürdü
+            self.restart()
+            return ExecResult('', error='SandboxCrash')
+        reply = json.loads(line)
+        return ExecResult(reply['stdout'], reply['error'], reply['timeout'])
+
+    def restart(self) -> None:
+        self.close()
+        self._start()
+
+    def close(self) -> None:
+        if self.proc is None:
+            return
+        self.selector.close()
+        self.proc.kill()
+        self.proc.wait()
+        for stream in (self.proc.stdin, self.proc.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self.proc = None
+
+
+class PythonRunner:
+    """
+    Sabit boyutlu sandbox havuzu. run_many aynı snippet'i bir kez çalıştırır;
+    her worker süreci bir iş parçacığıyla beslenir (süreçler gerçekten paralel).
+    """
+
+    language = 'python'
+
+    def __init__(self, workers: Optional[int] = None, timeout: float = DEFAULT_TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self._tmp = tempfile.TemporaryDirectory(prefix='rheo-sandbox-')
+        self._pool: List[_Worker] = []
+
+    @classmethod
+    def available(cls) -> bool:
+        return True  # sys.executable her zaman var
+
+    def __enter__(self) -> 'PythonRunner':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _ensure_pool(self, size: int) -> None:
+        # Küçük işler için gereğinden fazla süreç başlatma
+        while len(self._pool) < min(size, self.workers):
+            self._pool.append(_Worker(self._tmp.name))
+
+    def run_many(self, snippets: Sequence[str]) -> Dict[str, ExecResult]:
+        """Her farklı snippet'i bir kez çalıştırır; snippet -> sonuç."""
+        unique = list(dict.fromkeys(snippets))
+        if not unique:
+            return {}
+        self._ensure_pool(len(unique))
+
+        todo: 'queue.SimpleQueue[str]' = queue.SimpleQueue()
+        for code in unique:
+            todo.put(code)
+        results: Dict[str, ExecResult] = {}
+
+        def feed(worker: _Worker) -> None:
+            while True:
+                try:
+                    code = todo.get_nowait()
+                except queue.Empty:
+                    return
+                results[code] = worker.run(code, self.timeout)
+
+        threads = [threading.Thread(target=feed, args=(w,), daemon=True) for w in self._pool]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def close(self) -> None:
+        for worker in self._pool:
+            worker.close()
+        self._pool = []
+        self._tmp.cleanup()
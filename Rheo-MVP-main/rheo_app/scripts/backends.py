@@ -0,0 +1,157 @@
+"""
+Model backends for generate_questions.py.
+
+A backend turns a prompt into the raw response text. `model` and `config`
+identify it in the response cache, so answers from different backends
+never mix.
+
+    gemini  Google Gemini (google-generativeai, imported on first use)
+    local   offline stand-in: template-generated or canned JSON with
+            configurable latency and failure rates, for exercising the
+            concurrency / retry / parsing paths without network
+"""
+
+import abc
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+from pathlib import Path
+from typing import List, Optional
+
+
+class ModelBackend(abc.ABC):
+    name = "base"
+    model = ""
+    config: dict = {}
+
+    @abc.abstractmethod
+    async def generate(self, prompt: str) -> str:
+        """Return the raw response text for `prompt`."""
+
+
+class GeminiBackend(ModelBackend):
+    name = "gemini"
+
+    def __init__(self, model: str, config: dict, api_key: Optional[str] = None):
+        api_key = api_key or os.environ.get("GEMINI_API_KEY", "")
+        if not api_key:
+            raise RuntimeError("GEMINI_API_KEY environment variable not set!")
+        # Deferred so --help, --replay and the local backend work without the SDK
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.model = model
+        self.config = dict(config)
+        self._model = genai.GenerativeModel(model)
+        self._generation_config = genai.types.GenerationConfig(**config)
+
+    async def generate(self, prompt: str) -> str:
+        response = await self._model.generate_content_async(prompt, generation_config=self._generation_config)
+        return response.text
+
+
+class LocalBackendError(Exception):
+    """Simulated API error; `code` mirrors the HTTP status like google.api_core errors."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class LocalBackend(ModelBackend):
+    """
+    Offline stand-in. Answers are a function of the prompt (minus its
+    random-seed line) and `seed`, so runs are reproducible regardless of
+    completion order. Failures are drawn per call:
+
+        throttle_rate   429 with a "retry in Ns" hint
+        error_rate      500 (not retried)
+        malformed_rate  truncated JSON (parse failure)
+    """
+
+    name = "local"
+    model = "local-standin"
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.1, error_rate: float = 0.0,
+                 throttle_rate: float = 0.0, malformed_rate: float = 0.0, retry_after: float = 1.0,
+                 seed: int = 0, canned_dir: Optional[Path] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.malformed_rate = malformed_rate
+        self.retry_after = retry_after
+        self.seed = seed
+        self.canned = self._load_canned(canned_dir) if canned_dir else []
+        self.config = {"seed": seed, "canned": len(self.canned)}
+        self._failures = random.Random(seed)
+        self.calls = 0
+
+    @staticmethod
+    def _load_canned(directory: Path) -> List[str]:
+        """Response texts from *.json files: response cache entries or bare model answers."""
+        texts = []
+        for path in sorted(directory.glob("*.json")):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            texts.append(data["response"] if isinstance(data, dict) and "response" in data else json.dumps(data))
+        return texts
+
+    async def generate(self, prompt: str) -> str:
+        self.calls += 1
+        await asyncio.sleep(max(0.0, self.latency + self._failures.uniform(-self.jitter, self.jitter)))
+
+        roll = self._failures.random()
+        if roll < self.throttle_rate:
+            raise LocalBackendError(429, f"429 Resource has been exhausted. Please retry in {self.retry_after}s.")
+        roll -= self.throttle_rate
+        if roll < self.error_rate:
+            raise LocalBackendError(500, "500 Internal error encountered.")
+
+        stable = prompt.split("\nRandom seed for uniqueness:")[0]
+        rng = random.Random(f"{self.seed}:{hashlib.sha256(stable.encode('utf-8')).hexdigest()}")
+        text = rng.choice(self.canned) if self.canned else self._template_response(stable, rng)
+
+        roll -= self.error_rate
+        if roll < self.malformed_rate:
+            return "```json\n" + text[:len(text) // 2]
+        return text
+
+    def _template_response(self, prompt: str, rng: random.Random) -> str:
+        count = int(_search(r"Generate EXACTLY (\d+)", prompt, "10"))
+        language = _search(r"Language: (\w+)", prompt, "Python").lower()
+        questions = []
+        for _ in range(count):
+            a, b = rng.randint(1, 20), rng.randint(1, 20)
+            name = rng.choice(["total", "score", "price", "count", "stock"])
+            if language == "java":
+                code = f"int {name} = {a};\n{name} += {b};\nSystem.out.println({name});"
+            elif language == "javascript":
+                code = f"let {name} = {a};\n{name} += {b};\nconsole.log({name});"
+            else:
+                code = f"{name} = {a}\n{name} += {b}\nprint({name})"
+            answer = a + b
+            wrong = []
+            for candidate in (a * b, answer + 1, answer - 1, answer + 2):
+                if candidate != answer and candidate not in wrong and len(wrong) < 3:
+                    wrong.append(candidate)
+            options = [str(answer)] + [str(w) for w in wrong]
+            correct = rng.randrange(4)
+            options[0], options[correct] = options[correct], options[0]
+            questions.append({
+                "type": "output",
+                "question_text": "Bu kodun çıktısı nedir?",
+                "code_snippet": code,
+                "options": options,
+                "correct_index": correct,
+                "explanation": f"{name} önce {a}, sonra {b} eklenince {answer} olur.",
+            })
+        return json.dumps(questions, ensure_ascii=False)
+
+
+def _search(pattern: str, text: str, default: str) -> str:
+    match = re.search(pattern, text)
+    return match.group(1) if match else default
@@ -3,26 +3,62 @@
 Rheo Question Bank Generator
 Generates coding quiz questions using Gemini API in batch.
 Saves to JSON files per topic/difficulty.
+
+Batches run concurrently in (topic, difficulty, language) priority order.
+Request rate is capped by a token bucket (--rpm, --burst); in-flight
+requests adapt (AIMD, up to --concurrency) to rate-limit responses, which
+are retried with jittered backoff or the server's retry hint.
+
+Raw responses are cached in scripts/.cache/responses (keyed by model,
+config and the prompt minus its random-seed line); --replay adds the cached
+questions missing from the JSON files without calling the API
+(--replay --overwrite rebuilds the files from the cache alone).
+
+Finished batches are appended to <topic>_<difficulty>.journal.ndjson and
+recorded in assets/questions/.job_state.json; each JSON file is written
+once (atomic rename) when its batches are done. An interrupted run resumes
+from the job state on the next start.
+
+Usage:
+    python scripts/generate_questions.py                    # all topics
+    python scripts/generate_questions.py loop if_else --concurrency 8 --rpm 30
+    python scripts/generate_questions.py --replay            # offline, from cache
+    python scripts/generate_questions.py --backend local --local-throttle-rate 0.1 --rpm 600
 """
 
+from __future__ import annotations
+
+import argparse
 import json
 import time
-import os
-import sys
-import google.generativeai as genai
+import hashlib
+from collections import Counter
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from journal import JobState, Journal, atomic_write_json
+from response_cache import DEFAULT_MAX_BYTES, ResponseCache
+
+# asyncio (~70 ms) and the model SDKs are imported only once a run actually
+# starts, so --help, --replay and resuming a finished job stay fast
+if TYPE_CHECKING:
+    from backends import ModelBackend
+    from ratelimit import RateController
 
-API_KEY = os.environ.get("GEMINI_API_KEY", "")
-if not API_KEY:
-    print("ERROR: GEMINI_API_KEY environment variable not set!")
-    sys.exit(1)
 MODEL = "gemini-2.5-flash"
+GENERATION_CONFIG = {"temperature": 1.0, "response_mime_type": "application/json"}
+CACHE_DIR = Path(__file__).parent / ".cache" / "responses"
 OUTPUT_DIR = Path(__file__).parent.parent / "assets" / "questions"
 QUESTIONS_PER_BATCH = 10  # Questions per API call
 TOTAL_PER_FILE = 100  # Total questions per topic/difficulty file
+LANGUAGES = ["python", "java", "javascript"]
 
-genai.configure(api_key=API_KEY)
-model = genai.GenerativeModel(MODEL)
+# Concurrency / rate defaults (Gemini free tier allows ~10 requests per minute)
+DEFAULT_CONCURRENCY = 8
+DEFAULT_MAX_ATTEMPTS = 6
+DEFAULT_RPM = 10
+DEFAULT_BURST = 2
 
 # Topics with descriptions for each language
 TOPICS = {
@@ -124,157 +160,416 @@ SCENARIOS = [
 ]
 
 
-def generate_batch(topic_id: str, difficulty: str, language: str, batch_num: int, existing_count: int) -> list:
-    """Generate a batch of questions using Gemini API"""
-    topic_desc = TOPICS[topic_id][language]
-    diff_info = DIFFICULTIES[difficulty]
-    count = QUESTIONS_PER_BATCH
-    
+@dataclass(frozen=True)
+class BatchUnit:
+    """One API call: QUESTIONS_PER_BATCH questions for a topic/difficulty/language."""
+    topic_id: str
+    difficulty: str
+    language: str
+    batch_num: int
+    existing_count: int  # fixed at planning time, so prompts don't depend on completion order
+
+    @property
+    def priority(self) -> Tuple[int, int, int, int]:
+        return (
+            list(TOPICS).index(self.topic_id),
+            DIFFICULTIES[self.difficulty]["level"],
+            LANGUAGES.index(self.language),
+            self.batch_num,
+        )
+
+    @property
+    def key(self) -> Tuple[str, str, int]:
+        return (self.topic_id, self.difficulty, self.batch_num)
+
+    @property
+    def file_key(self) -> Tuple[str, str]:
+        return (self.topic_id, self.difficulty)
+
+
+def build_prompt(unit: BatchUnit) -> str:
+    """Deterministic prompt for a unit (also the cache key); see seed_line()."""
+    topic_desc = TOPICS[unit.topic_id][unit.language]
+    diff_info = DIFFICULTIES[unit.difficulty]
+
     # Select some scenarios to suggest variety
-    scenario_start = (batch_num * 3) % len(SCENARIOS)
+    scenario_start = (unit.batch_num * 3) % len(SCENARIOS)
     suggested_scenarios = SCENARIOS[scenario_start:scenario_start+3]
-    
+
     prompt = SYSTEM_PROMPT.format(
-        count=count,
-        language=language.capitalize(),
+        count=QUESTIONS_PER_BATCH,
+        language=unit.language.capitalize(),
         topic_desc=topic_desc,
         difficulty_instruction=diff_info["instruction"]
     )
-    
+
     prompt += f"\n\nSuggested scenarios for variety: {', '.join(suggested_scenarios)}"
-    prompt += f"\nThis is batch #{batch_num+1}. You have already generated {existing_count} questions. Make these COMPLETELY DIFFERENT from previous ones."
-    prompt += f"\nRandom seed for uniqueness: {int(time.time() * 1000) % 99999}"
-    
-    for attempt in range(3):
-        try:
-            response = model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=1.0,
-                    response_mime_type="application/json",
-                )
-            )
-            
-            text = response.text.strip()
-            # Clean markdown if present
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-            
-            questions = json.loads(text)
-            if not isinstance(questions, list):
-                questions = [questions]
-                
-            # Process questions
-            processed = []
-            for i, q in enumerate(questions):
-                options = q.get("options", [])
-                correct_idx = q.get("correct_index", 0)
-                if correct_idx >= len(options):
-                    correct_idx = 0
-                    
-                processed.append({
-                    "id": f"{topic_id}_{difficulty[0]}_{language[:2]}_{int(time.time()*1000)%99999}_{i}",
-                    "type": q.get("type", "output"),
-                    "difficulty": diff_info["level"],
-                    "topic": topic_id,
-                    "code_snippet": q.get("code_snippet", ""),
-                    "question_text": q.get("question_text", ""),
-                    "correct_answer": options[correct_idx] if options else "",
-                    "wrong_options": [options[j] for j in range(len(options)) if j != correct_idx],
-                    "explanation": q.get("explanation", ""),
-                    "language": language
-                })
-            
-            return processed
-            
-        except Exception as e:
-            err_str = str(e)
-            if "429" in err_str or "quota" in err_str.lower():
-                wait_time = (attempt + 1) * 15
-                print(f"  ⏳ Rate limited, waiting {wait_time}s (attempt {attempt+1}/3)")
-                time.sleep(wait_time)
+    prompt += f"\nThis is batch #{unit.batch_num+1}. You have already generated {unit.existing_count} questions. Make these COMPLETELY DIFFERENT from previous ones."
+    return prompt
+
+
+def seed_line() -> str:
+    """Per-request noise for variety; appended after the cache key is taken."""
+    return f"\nRandom seed for uniqueness: {int(time.time() * 1000) % 99999}"
+
+
+def parse_response(text: str, unit: BatchUnit) -> list:
+    """Turn the model's JSON answer into bank entries.
+
+    IDs come from a hash of the response, so replaying a cached response
+    gives the same IDs as the run that fetched it."""
+    response_id = hashlib.sha256(text.encode("utf-8")).hexdigest()[:8]
+    text = text.strip()
+    # Clean markdown if present
+    if text.startswith("```json"):
+        text = text[7:]
+    if text.startswith("```"):
+        text = text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    text = text.strip()
+
+    questions = json.loads(text)
+    if not isinstance(questions, list):
+        questions = [questions]
+
+    level = DIFFICULTIES[unit.difficulty]["level"]
+    processed = []
+    for n, q in enumerate(questions, 1):
+        options = q.get("options", [])
+        correct_idx = q.get("correct_index", 0)
+        if correct_idx >= len(options):
+            correct_idx = 0
+
+        processed.append({
+            "id": f"{unit.topic_id}_{unit.difficulty[0]}_{unit.language[:2]}_{response_id}_{n}",
+            "type": q.get("type", "output"),
+            "difficulty": level,
+            "topic": unit.topic_id,
+            "code_snippet": q.get("code_snippet", ""),
+            "question_text": q.get("question_text", ""),
+            "correct_answer": options[correct_idx] if options else "",
+            "wrong_options": [options[j] for j in range(len(options)) if j != correct_idx],
+            "explanation": q.get("explanation", ""),
+            "language": unit.language
+        })
+    return processed
+
+
+async def generate_batch(unit: BatchUnit, backend: ModelBackend, controller: RateController,
+                         cache: Optional[ResponseCache] = None) -> list:
+    """Generate a batch of questions; rate-limit retries are handled by the controller"""
+    from ratelimit import RateLimitExhausted
+
+    prompt = build_prompt(unit)
+    key = ResponseCache.make_key(backend.model, backend.config, prompt)
+    if cache is not None:
+        text = cache.get(key)
+        if text is not None:
+            try:
+                return parse_response(text, unit)
+            except Exception as e:
+                print(f"  ♻️ Cached response no longer parses ({e}), fetching again")
+
+    try:
+        text = await controller.call(backend.generate, prompt + seed_line())
+    except RateLimitExhausted as e:
+        print(f"  ❌ {e}")
+        return []
+    except Exception as e:
+        print(f"  ❌ Error: {e}")
+        return []
+
+    if cache is not None:
+        # Stored before parsing so a bad response can be replayed after fixing parse_response
+        cache.put(key, text, model=backend.model, unit=asdict(unit))
+    try:
+        return parse_response(text, unit)
+    except Exception as e:
+        print(f"  ❌ Unparseable response: {e}")
+        return []
+
+
+def bank_path(topic_id: str, difficulty: str) -> Path:
+    return OUTPUT_DIR / f"{topic_id}_{difficulty}.json"
+
+
+def journal_for(topic_id: str, difficulty: str) -> Journal:
+    # Not *.json, so merge_questions.py never picks up a half-finished file
+    return Journal(OUTPUT_DIR / f"{topic_id}_{difficulty}.journal.ndjson")
+
+
+def job_state_path() -> Path:
+    return OUTPUT_DIR / ".job_state.json"
+
+
+def load_bank(topic_id: str, difficulty: str) -> list:
+    filepath = bank_path(topic_id, difficulty)
+    if not filepath.exists():
+        return []
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compact(topic_id: str, difficulty: str) -> Optional[int]:
+    """Fold the journal into the JSON file (one atomic rewrite). Returns the new total.
+
+    Skips questions whose ID is already in the file, so compacting again after a
+    crash between the rename and removing the journal is harmless."""
+    journal = journal_for(topic_id, difficulty)
+    records = journal.records()
+    if not records:
+        journal.remove()
+        return None
+    bank = load_bank(topic_id, difficulty)
+    seen = {q["id"] for q in bank}
+    for record in records:
+        for q in record["questions"]:
+            if q["id"] not in seen:
+                seen.add(q["id"])
+                bank.append(q)
+    atomic_write_json(bank_path(topic_id, difficulty), bank, ensure_ascii=False, indent=2)
+    journal.remove()
+    return len(bank)
+
+
+def plan_units(topics: List[str], difficulties: List[str]) -> List[BatchUnit]:
+    """List the batches still needed to fill each topic/difficulty file."""
+    units = []
+    for topic_id in topics:
+        for difficulty in difficulties:
+            existing = len(load_bank(topic_id, difficulty))
+
+            if existing >= TOTAL_PER_FILE:
+                print(f"  ✅ {bank_path(topic_id, difficulty).name}: already have {existing} questions, skipping")
                 continue
-            print(f"  ❌ Error: {e}")
-            return []
-    
-    print(f"  ❌ Failed after 3 retries")
-    return []
-
-
-def generate_topic_difficulty(topic_id: str, difficulty: str):
-    """Generate all questions for a topic/difficulty combination"""
-    filename = f"{topic_id}_{difficulty}.json"
-    filepath = OUTPUT_DIR / filename
-    
-    # Load existing if any
-    existing = []
-    if filepath.exists():
-        with open(filepath, "r", encoding="utf-8") as f:
-            existing = json.load(f)
-        print(f"  📂 Found {len(existing)} existing questions")
-    
-    if len(existing) >= TOTAL_PER_FILE:
-        print(f"  ✅ Already have {len(existing)} questions, skipping")
-        return
-    
-    remaining = TOTAL_PER_FILE - len(existing)
-    batches_needed = (remaining + QUESTIONS_PER_BATCH - 1) // QUESTIONS_PER_BATCH
-    
-    languages = ["python", "java", "javascript"]
-    
-    for batch_num in range(batches_needed):
-        # Rotate languages across batches
-        lang = languages[batch_num % 3]
-        
-        print(f"  🔄 Batch {batch_num+1}/{batches_needed} ({lang}) [{len(existing)}/{TOTAL_PER_FILE}]")
-        
-        new_questions = generate_batch(topic_id, difficulty, lang, batch_num, len(existing))
-        
-        if new_questions:
-            existing.extend(new_questions)
-            # Save after each batch
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(existing, f, ensure_ascii=False, indent=2)
-            print(f"  ✅ +{len(new_questions)} questions (total: {len(existing)})")
-        else:
-            print(f"  ⚠️ No questions generated in this batch")
-        
-        # Rate limiting — respectful delay
-        time.sleep(5)
-    
-    print(f"  🎉 {filename}: {len(existing)} questions total")
+
+            remaining = TOTAL_PER_FILE - existing
+            batches_needed = (remaining + QUESTIONS_PER_BATCH - 1) // QUESTIONS_PER_BATCH
+            for batch_num in range(batches_needed):
+                units.append(BatchUnit(
+                    topic_id=topic_id,
+                    difficulty=difficulty,
+                    # Rotate languages across batches
+                    language=LANGUAGES[batch_num % len(LANGUAGES)],
+                    batch_num=batch_num,
+                    existing_count=existing + batch_num * QUESTIONS_PER_BATCH,
+                ))
+    return units
+
+
+async def run_units(units: List[BatchUnit], state: JobState, backend: ModelBackend,
+                    controller: RateController, cache: Optional[ResponseCache] = None) -> int:
+    """Run the job's unfinished batches with up to controller.max_concurrency workers.
+
+    Each finished batch is appended to its file's journal, then marked done in
+    the job state; a file is compacted once all of its batches are done.
+    Returns questions added."""
+    import asyncio
+
+    pending = [u for u in units if u.key not in state.completed]
+    outstanding = Counter(u.file_key for u in pending)
+    queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+    for unit in pending:
+        queue.put_nowait((unit.priority, unit))
+    added = 0
+    done = 0
+
+    async def worker():
+        nonlocal added, done
+        while not queue.empty():
+            _, unit = queue.get_nowait()
+            label = f"{unit.topic_id}_{unit.difficulty} #{unit.batch_num+1} ({unit.language})"
+            new_questions = await generate_batch(unit, backend, controller, cache)
+            done += 1
+            if not new_questions:
+                # Left unfinished in the job state; the next run retries it
+                print(f"  ⚠️ [{done}/{len(pending)}] {label}: no questions generated")
+                continue
+            # Journal first: a crash before mark_done only means the batch is
+            # re-read from the journal on resume, never lost or fetched twice
+            journal_for(*unit.file_key).append({"unit": asdict(unit), "questions": new_questions})
+            state.mark_done(unit.key)
+            added += len(new_questions)
+            print(f"  ✅ [{done}/{len(pending)}] {label}: +{len(new_questions)}")
+            outstanding[unit.file_key] -= 1
+            if outstanding[unit.file_key] == 0:
+                total = compact(*unit.file_key)
+                print(f"  💾 {bank_path(*unit.file_key).name}: {total} questions")
+
+    await asyncio.gather(*(worker() for _ in range(min(controller.max_concurrency, len(pending)))))
+    return added
+
+
+def resume_state(path: Path) -> Optional[JobState]:
+    """Load an interrupted job, counting batches that reached a journal as done."""
+    state = JobState.load(path)
+    if state is None:
+        return None
+    for topic_id, difficulty in {(u["topic_id"], u["difficulty"]) for u in state.units}:
+        for record in journal_for(topic_id, difficulty).records():
+            unit = BatchUnit(**record["unit"])
+            state.completed.add(unit.key)
+    return state
+
+
+def replay(cache: ResponseCache, topics: List[str], difficulties: List[str], overwrite: bool = False) -> int:
+    """Add cached questions to the topic/difficulty files (no API calls). Returns questions added.
+
+    Questions already in a file (same ID) are kept as they are, so files holding
+    questions from before the cache existed lose nothing. With overwrite the
+    files are rebuilt from the cached responses alone."""
+    groups: Dict[Tuple[str, str], list] = {}
+    for entry in cache.entries():
+        unit = BatchUnit(**entry["unit"])
+        if unit.topic_id in topics and unit.difficulty in difficulties:
+            groups.setdefault(unit.file_key, []).append((entry["created"], unit, entry["response"]))
+
+    total = 0
+    failed = 0
+    for (topic_id, difficulty), items in sorted(groups.items()):
+        bank = [] if overwrite else load_bank(topic_id, difficulty)
+        seen = {q["id"] for q in bank}
+        existing = len(bank)
+        # Same order the batches were planned in, then fetch time
+        for _, unit, text in sorted(items, key=lambda item: (item[1].existing_count, item[1].batch_num, item[0])):
+            try:
+                questions = parse_response(text, unit)
+            except Exception as e:
+                failed += 1
+                print(f"  ❌ {topic_id}_{difficulty} #{unit.batch_num+1}: {e}")
+                continue
+            for q in questions:
+                if q["id"] not in seen:
+                    seen.add(q["id"])
+                    bank.append(q)
+        added = len(bank) - existing
+        if overwrite or added:
+            atomic_write_json(bank_path(topic_id, difficulty), bank, ensure_ascii=False, indent=2)
+        total += added
+        print(f"  ✅ {bank_path(topic_id, difficulty).name}: +{added} from {len(items)} responses, "
+              f"{len(bank)} questions")
+    if failed:
+        print(f"  ⚠️ {failed} cached responses still fail to parse")
+    return total
+
+
+def make_backend(args: argparse.Namespace) -> ModelBackend:
+    from backends import GeminiBackend, LocalBackend
+
+    if args.backend == "local":
+        return LocalBackend(
+            latency=args.local_latency,
+            jitter=args.local_latency / 2,
+            error_rate=args.local_error_rate,
+            throttle_rate=args.local_throttle_rate,
+            malformed_rate=args.local_malformed_rate,
+            seed=args.local_seed,
+            canned_dir=args.local_canned,
+        )
+    try:
+        return GeminiBackend(MODEL, GENERATION_CONFIG)
+    except RuntimeError as e:
+        print(f"ERROR: {e}")
+        raise SystemExit(1)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Generate quiz questions with Gemini")
+    parser.add_argument("topics", nargs="*", help=f"topics to generate (default: all of {', '.join(TOPICS)})")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"max requests in flight; the actual number adapts to rate limits (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--rpm", type=float, default=DEFAULT_RPM,
+                        help=f"max requests per minute (default: {DEFAULT_RPM})")
+    parser.add_argument("--burst", type=float, default=DEFAULT_BURST,
+                        help=f"requests allowed back to back before the rate applies (default: {DEFAULT_BURST})")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help=f"attempts per batch when rate limited (default: {DEFAULT_MAX_ATTEMPTS})")
+    parser.add_argument("--replay", action="store_true",
+                        help="add cached questions missing from assets/questions/*.json, without API calls")
+    parser.add_argument("--overwrite", action="store_true",
+                        help="with --replay: rebuild the files from cached responses only, "
+                             "dropping questions that are not in the cache")
+    parser.add_argument("--no-cache", action="store_true", help="don't read or write the response cache")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help="evict least recently used responses beyond this size (default: %(default)g)")
+    parser.add_argument("--fresh", action="store_true",
+                        help="abandon an interrupted job (its finished batches are kept) and plan a new one")
+    parser.add_argument("--backend", choices=["gemini", "local"], default="gemini",
+                        help="model backend; 'local' is an offline stand-in for load tests (default: gemini)")
+    local = parser.add_argument_group("local backend")
+    local.add_argument("--local-latency", type=float, default=0.5, help="mean seconds per call (default: %(default)g)")
+    local.add_argument("--local-error-rate", type=float, default=0.0, help="share of calls failing with 500")
+    local.add_argument("--local-throttle-rate", type=float, default=0.0, help="share of calls failing with 429")
+    local.add_argument("--local-malformed-rate", type=float, default=0.0, help="share of responses cut in half")
+    local.add_argument("--local-seed", type=int, default=0, help="seed for answers and failures")
+    local.add_argument("--local-canned", type=Path, default=None,
+                       help="serve responses from this directory (e.g. scripts/.cache/responses) instead of templates")
+    args = parser.parse_args()
+    if args.replay and args.no_cache:
+        parser.error("--replay needs the cache")
+    if args.overwrite and not args.replay:
+        parser.error("--overwrite only applies to --replay")
+    if args.concurrency < 1 or args.rpm <= 0 or args.burst < 1 or args.max_attempts < 1:
+        parser.error("--concurrency, --burst and --max-attempts must be >= 1, --rpm > 0")
+
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    
+
     # Allow filtering by topic from command line
-    topics_to_generate = list(TOPICS.keys())
-    if len(sys.argv) > 1:
-        topics_to_generate = [t for t in sys.argv[1:] if t in TOPICS]
-    
-    difficulties = ["easy", "medium", "hard"]
-    
-    total = len(topics_to_generate) * len(difficulties)
-    current = 0
-    
-    for topic_id in topics_to_generate:
-        print(f"\n{'='*50}")
-        print(f"📚 Topic: {topic_id}")
-        print(f"{'='*50}")
-        
-        for difficulty in difficulties:
-            current += 1
-            print(f"\n[{current}/{total}] {topic_id} — {difficulty.upper()}")
-            generate_topic_difficulty(topic_id, difficulty)
-    
+    topics_to_generate = [t for t in args.topics if t in TOPICS] if args.topics else list(TOPICS)
+    difficulties = list(DIFFICULTIES)
+    cache = None if args.no_cache else ResponseCache(CACHE_DIR, int(args.cache_max_mb * 1024 * 1024))
+
+    if args.replay:
+        total = replay(cache, topics_to_generate, difficulties, overwrite=args.overwrite)
+        print(f"\n🎉 Replayed {total} questions from {cache.directory}")
+        return
+
+    state = resume_state(job_state_path())
+    if state is not None and args.fresh:
+        state.remove()
+        state = None
+    if state is None:
+        # Fold in journals left by an abandoned job before counting what exists
+        for journal in sorted(OUTPUT_DIR.glob("*.journal.ndjson")):
+            topic_id, difficulty = journal.name[:-len(".journal.ndjson")].rsplit("_", 1)
+            compact(topic_id, difficulty)
+        units = plan_units(topics_to_generate, difficulties)
+        state = JobState(job_state_path(), [asdict(u) for u in units])
+        state.save()
+        print(f"📋 {len(units)} batches planned, up to {args.concurrency} in flight, {args.rpm:g} requests/min")
+    else:
+        units = [BatchUnit(**u) for u in state.units]
+        print(f"↩️ Resuming job: {len(state.completed)}/{len(units)} batches already done "
+              f"(--fresh to start over)")
+
+    started = time.monotonic()
+    added = 0
+    if len(state.completed) < len(units):
+        import asyncio
+        from ratelimit import RateController, TokenBucket
+
+        controller = RateController(
+            TokenBucket.per_minute(args.rpm, args.burst),
+            max_concurrency=args.concurrency,
+            max_attempts=args.max_attempts,
+        )
+        added = asyncio.run(run_units(units, state, make_backend(args), controller, cache))
+        print(f"\n⏱️ Rate limits: {controller.summary()}")
+        if cache is not None:
+            print(f"💾 Response cache: {cache.summary()}")
+
+    # Files with failed batches still get what did finish
+    for file_key in sorted({u.file_key for u in units}):
+        compact(*file_key)
+    missing = len(units) - len(state.completed)
+    if missing:
+        print(f"\n⚠️ {missing} batches failed; rerun to resume them")
+    else:
+        state.remove()
+
     print(f"\n{'='*50}")
-    print(f"🎉 Question generation complete!")
+    print(f"🎉 Question generation complete! +{added} questions in {time.monotonic() - started:.0f}s")
     print(f"{'='*50}")
 
 
@@ -0,0 +1,93 @@
+"""
+Crash-safe storage for the question generation scripts.
+
+Journal: append-only NDJSON, one fsync'd line per finished batch. A line
+cut short by a crash is dropped (and truncated away) on the next read, so
+a journal never holds half a record.
+
+JobState: the planned units of a run and the ones already finished,
+rewritten atomically (temp file + rename) so a restart can resume it.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+UnitKey = Tuple[str, str, int]  # (topic, difficulty, batch_num)
+
+
+def atomic_write_json(path: Path, data, **dump_kwargs) -> None:
+    """Write JSON to a temp file, fsync it and rename it over `path`."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Journal:
+    def __init__(self, path: Path):
+        self.path = path
+
+    def append(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def records(self) -> List[dict]:
+        if not self.path.exists():
+            return []
+        data = self.path.read_bytes()
+        complete = data.rfind(b"\n") + 1
+        if complete < len(data):
+            # Torn last write: cut it off so the next append starts on a fresh line
+            with open(self.path, "r+b") as f:
+                f.truncate(complete)
+        return [json.loads(line) for line in data[:complete].decode("utf-8").splitlines() if line.strip()]
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class JobState:
+    VERSION = 1
+
+    def __init__(self, path: Path, units: List[dict], completed: Iterable[UnitKey] = ()):
+        self.path = path
+        self.units = units
+        self.completed: Set[UnitKey] = {tuple(key) for key in completed}
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["JobState"]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.VERSION:
+            return None
+        return cls(path, data["units"], data["completed"])
+
+    def save(self) -> None:
+        atomic_write_json(self.path, {
+            "version": self.VERSION,
+            "units": self.units,
+            "completed": sorted(self.completed),
+        }, ensure_ascii=False)
+
+    def mark_done(self, key: UnitKey) -> None:
+        self.completed.add(tuple(key))
+        self.save()
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -1,27 +1,183 @@
-import json, glob
+"""Merge generated question files (assets/questions/*.json) into assets/questions.json.
 
-with open('assets/questions.json') as f:
-    qs = json.load(f)
+Incremental: per-source size/mtime/sha256, the bank's size/mtime and an
+id -> fingerprint index are kept in assets/.merge_state.json. Unchanged
+sources are not parsed, and new questions are appended to the end of the
+bank in place (byte-identical to a full json.dump(indent=2)). When nothing
+changed the script only stats files.
 
-ids = set(q['id'] for q in qs)
-added = 0
+Usage (from rheo_app/):
+    python scripts/merge_questions.py          # incremental
+    python scripts/merge_questions.py --full   # ignore state, re-read everything
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
 
-for fp in sorted(glob.glob('assets/questions/*.json')):
-    with open(fp) as f:
-        new = json.load(f)
-    for q in new:
-        if q['id'] not in ids:
-            qs.append(q)
-            ids.add(q['id'])
-            added += 1
+BANK = 'assets/questions.json'
+SOURCES = 'assets/questions/*.json'
+STATE = 'assets/.merge_state.json'
+STATE_VERSION = 1
 
-with open('assets/questions.json', 'w') as f:
-    json.dump(qs, f, ensure_ascii=False, indent=2)
 
-topics = {}
-for q in qs:
-    topics[q.get('topic', '?')] = topics.get(q.get('topic', '?'), 0) + 1
+def fingerprint(q):
+    """Content hash over (language, code_snippet, correct_answer).
+    Keep in sync with backend/generator/dedupe.py."""
+    lines = q.get('code_snippet', '').replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    answer = q.get('correct_answer', '')
+    if not isinstance(answer, str):
+        # A few hand-written entries carry structured answers (buggy_line/corrected_line)
+        answer = json.dumps(answer, ensure_ascii=False, sort_keys=True)
+    parts = (
+        q.get('language', 'python').strip().lower(),
+        '\n'.join(line.rstrip() for line in lines).strip('\n'),
+        answer.strip(),
+    )
+    return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
 
-print(f'Added {added}, Total: {len(qs)}')
-for t, c in sorted(topics.items()):
-    print(f'  {t}: {c}')
+
+def file_stat(path):
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def same_stat(a, b):
+    return a is not None and a['size'] == b['size'] and a['mtime_ns'] == b['mtime_ns']
+
+
+def load_state():
+    try:
+        with open(STATE, encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if state.get('version') == STATE_VERSION else None
+
+
+def save_state(state):
+    tmp = STATE + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(state, f, separators=(',', ':'))
+    os.replace(tmp, STATE)
+
+
+def index_bank(qs):
+    ids = {q['id']: fingerprint(q) for q in qs}
+    topics = {}
+    for q in qs:
+        topics[q.get('topic', '?')] = topics.get(q.get('topic', '?'), 0) + 1
+    return ids, topics
+
+
+def append_to_bank(new):
+    """Append to a json.dump(indent=2) array without re-serializing it.
+
+    The bank ends with b'\\n]'; replacing that with b',\\n' plus the new items
+    gives the same bytes a full dump of the combined list would."""
+    tail = json.dumps(new, ensure_ascii=False, indent=2).encode('utf-8')
+    with open(BANK, 'r+b') as f:
+        f.seek(-2, os.SEEK_END)
+        if f.read(2) != b'\n]':
+            return False
+        f.seek(-2, os.SEEK_END)
+        # tail starts with b'[\n'
+        f.write(b',\n' + tail[2:])
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--full', action='store_true',
+                        help='ignore the merge state, re-read every source and rewrite the bank')
+    args = parser.parse_args()
+
+    state = None if args.full else load_state()
+    bank_stat = file_stat(BANK)
+    sources = sorted(glob.glob(SOURCES))
+    stats = {path: file_stat(path) for path in sources}
+
+    # Fast path: bank and every source untouched since the last merge
+    if (state is not None and same_stat(state['bank'], bank_stat)
+            and set(state['sources']) == set(sources)
+            and all(same_stat(state['sources'][p], stats[p]) for p in sources)):
+        print(f'Nothing to merge, Total: {len(state["ids"])}')
+        return
+
+    qs = None
+    if state is not None and same_stat(state['bank'], bank_stat):
+        ids, topics = state['ids'], state['topics']
+    else:
+        # Bank edited outside this script (or no state yet): rebuild the index
+        with open(BANK, encoding='utf-8') as f:
+            qs = json.load(f)
+        ids, topics = index_bank(qs)
+        # ...and re-read every source, in case merged questions were removed
+        state = None
+
+    known_sources = state['sources'] if state is not None else {}
+    fingerprints = set(ids.values())
+    new = []
+    collisions = 0
+    duplicates = 0
+    source_state = {}
+
+    for fp in sources:
+        prev = known_sources.get(fp)
+        if same_stat(prev, stats[fp]):
+            source_state[fp] = prev
+            continue
+        with open(fp, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        source_state[fp] = {**stats[fp], 'sha256': digest}
+        if prev is not None and prev['sha256'] == digest:
+            # Touched but not modified
+            continue
+        for q in json.loads(raw):
+            fp_hash = fingerprint(q)
+            if q['id'] not in ids:
+                if fp_hash in fingerprints:
+                    # Same question under a different ID
+                    duplicates += 1
+                    continue
+                new.append(q)
+                ids[q['id']] = fp_hash
+                fingerprints.add(fp_hash)
+                topics[q.get('topic', '?')] = topics.get(q.get('topic', '?'), 0) + 1
+            elif ids[q['id']] != fp_hash:
+                # Same ID, different question: a collision from the old timestamp-based IDs
+                collisions += 1
+                print(f'  ! ID collision, skipped: {q["id"]} ({fp})')
+
+    if args.full:
+        with open(BANK, 'w', encoding='utf-8') as f:
+            json.dump(qs + new, f, ensure_ascii=False, indent=2)
+    elif new and not append_to_bank(new):
+        # Not in json.dump(indent=2) layout (e.g. an empty "[]"): rewrite once
+        if qs is None:
+            with open(BANK, encoding='utf-8') as f:
+                qs = json.load(f)
+        with open(BANK, 'w', encoding='utf-8') as f:
+            json.dump(qs + new, f, ensure_ascii=False, indent=2)
+
+    save_state({
+        'version': STATE_VERSION,
+        'bank': file_stat(BANK),
+        'sources': source_state,
+        'ids': ids,
+        'topics': topics,
+    })
+
+    print(f'Added {len(new)}, Total: {len(ids)}')
+    if collisions:
+        print(f'Skipped {collisions} questions with colliding IDs')
+    if duplicates:
+        print(f'Skipped {duplicates} duplicate questions (same content, different ID)')
+    for t, c in sorted(topics.items()):
+        print(f'  {t}: {c}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,205 @@
+"""
+Rate limiting for the question generation scripts.
+
+TokenBucket refills `rate` tokens per second up to `capacity` (the burst
+size). Every API request takes one token, so concurrent requests are
+spaced by the bucket instead of fixed sleeps.
+
+RateController wraps calls with:
+  - AIMD concurrency: +1/limit in-flight slots per success, x0.5 on a
+    rate-limit response (at most once per congestion event)
+  - full-jitter exponential backoff, or the server's retry hint when given;
+    a hint pauses every worker, not just the one that got it
+  - accounting of time spent in retry hints, the bucket and backoff (`throttled`)
+
+Both take `clock` and `sleep` so tests can drive them with a fake clock.
+"""
+
+import asyncio
+import contextlib
+import random
+import re
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# 429: quota / rate limit, 503: model overloaded
+THROTTLE_STATUS = (429, 503)
+
+_RETRY_PATTERNS = (
+    re.compile(r"retry in ([\d.]+)\s*s", re.IGNORECASE),               # "Please retry in 17.3s"
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)", re.IGNORECASE),  # google.rpc.RetryInfo
+    re.compile(r"retry[- ]after:?\s*([\d.]+)", re.IGNORECASE),
+)
+
+
+class RateLimitExhausted(Exception):
+    """Still rate limited after the last attempt."""
+
+
+def status_code(exc: BaseException) -> Optional[int]:
+    """HTTP status of an API error (google.api_core, httpx/requests style), if any."""
+    for value in (getattr(exc, "code", None), getattr(exc, "status_code", None),
+                  getattr(getattr(exc, "response", None), "status_code", None)):
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_throttled(exc: BaseException) -> bool:
+    code = status_code(exc)
+    if code is not None:
+        return code in THROTTLE_STATUS
+    # SDK errors without a status: fall back to the message
+    text = str(exc).lower()
+    return "429" in text or "quota" in text or "rate limit" in text
+
+
+def retry_hint(exc: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After header or RetryInfo), if any."""
+    value = getattr(exc, "retry_after", None)
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if value is None and headers is not None:
+        value = headers.get("Retry-After")
+    if value is not None:
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+    text = str(exc)
+    for pattern in _RETRY_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class TokenBucket:
+    """Async token bucket. Waiters are served in FIFO order."""
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock=time.monotonic, sleep=asyncio.sleep):
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests: float, burst: float = 1.0) -> "TokenBucket":
+        return cls(requests / 60.0, burst)
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until `tokens` are available and take them. Returns seconds waited."""
+        started = self.clock()
+        # The lock keeps waiters in arrival order; only the head of the line sleeps
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return self.clock() - started
+                await self.sleep((tokens - self.tokens) / self.rate)
+
+
+class RateController:
+    """Adaptive concurrency + backoff around an async call."""
+
+    def __init__(self, bucket: TokenBucket, max_concurrency: int = 8, initial: float = 2.0,
+                 min_concurrency: float = 1.0, decrease: float = 0.5, max_attempts: int = 6,
+                 base_delay: float = 1.0, max_delay: float = 60.0,
+                 rng: Optional[random.Random] = None, clock=time.monotonic, sleep=asyncio.sleep):
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.limit = max(min_concurrency, min(initial, max_concurrency))
+        self.decrease = decrease
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rng = rng or random.Random()
+        self.clock = clock
+        self.sleep = sleep
+
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._cond = asyncio.Condition()
+
+        # Reporting
+        self.throttled = 0.0     # worker-seconds in pauses, bucket waits and backoff
+        self.rate_limited = 0    # throttle responses received
+        self.retries = 0
+
+    def backoff(self, attempt: int, hint: Optional[float]) -> float:
+        """Server hint (plus a little jitter so workers don't wake together) or full jitter."""
+        if hint is not None:
+            return hint + self.rng.uniform(0, self.base_delay)
+        return self.rng.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def _on_success(self) -> None:
+        # Additive increase: about +1 slot per window of `limit` successes
+        self.limit = min(self.max_concurrency, self.limit + 1.0 / self.limit)
+
+    def _on_throttle(self, started: float, hint: Optional[float]) -> None:
+        self.rate_limited += 1
+        # Requests sent before the last cut saw the old limit; don't cut again for them
+        if started > self._last_decrease:
+            self.limit = max(self.min_concurrency, self.limit * self.decrease)
+            self._last_decrease = self.clock()
+        if hint is not None:
+            self.paused_until = max(self.paused_until, self.clock() + hint)
+
+    @contextlib.asynccontextmanager
+    async def _slot(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        # Waiting for a slot is our own concurrency choice; only server-driven waits count
+        waited_from = self.clock()
+        try:
+            pause = self.paused_until - self.clock()
+            if pause > 0:
+                await self.sleep(pause)
+            await self.bucket.acquire()
+            self.throttled += self.clock() - waited_from
+            yield
+        finally:
+            async with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args) -> T:
+        """Run fn(*args), retrying throttle errors; other exceptions propagate."""
+        for attempt in range(self.max_attempts):
+            async with self._slot():
+                started = self.clock()
+                try:
+                    result = await fn(*args)
+                except Exception as e:
+                    if not is_throttled(e):
+                        raise
+                    hint = retry_hint(e)
+                    self._on_throttle(started, hint)
+                else:
+                    self._on_success()
+                    return result
+            if attempt + 1 < self.max_attempts:
+                delay = self.backoff(attempt, hint)
+                self.retries += 1
+                self.throttled += delay
+                await self.sleep(delay)
+        raise RateLimitExhausted(f"still rate limited after {self.max_attempts} attempts")
+
+    def summary(self) -> str:
+        return (f"throttled {self.throttled:.0f} worker-seconds, {self.rate_limited} rate-limit responses, "
+                f"{self.retries} retries, concurrency now {self.limit:.1f}")
@@ -0,0 +1,106 @@
+"""
+On-disk cache of raw model responses.
+
+Entries are keyed by sha256(model, generation config, prompt). The prompt
+passed in must not contain per-request noise (the "random seed" line), or
+nothing would ever hit. Each entry is one JSON file holding the raw
+response text plus whatever metadata the caller attaches, so a response
+that failed to parse is kept and can be replayed after the post-processing
+is fixed.
+
+Eviction is LRU by file mtime (a hit touches the file) once the directory
+grows past max_bytes.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterator, Optional
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+class ResponseCache:
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+        # key -> size in bytes, least recently used first
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        files = []
+        for path in self.directory.glob("*.json"):
+            st = path.stat()
+            files.append((st.st_mtime_ns, path.stem, st.st_size))
+        for _, key, size in sorted(files):
+            self._entries[key] = size
+        self.total_bytes = sum(self._entries.values())
+
+    @staticmethod
+    def make_key(model: str, config: dict, prompt: str) -> str:
+        payload = json.dumps({"model": model, "config": config, "prompt": prompt},
+                             ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response text, or None."""
+        if key not in self._entries:
+            self.misses += 1
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            # Removed or half-written by another process
+            self.total_bytes -= self._entries.pop(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        os.utime(path)
+        self.hits += 1
+        return entry["response"]
+
+    def put(self, key: str, response: str, **meta) -> None:
+        """Store a response (overwrites an existing entry), then evict down to max_bytes."""
+        data = json.dumps({"key": key, "created": time.time(), "response": response, **meta},
+                          ensure_ascii=False).encode("utf-8")
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        self.total_bytes += len(data) - self._entries.pop(key, 0)
+        self._entries[key] = len(data)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def entries(self) -> Iterator[dict]:
+        """All entries (response + metadata), oldest first. Does not count as use."""
+        for key in list(self._entries):
+            try:
+                with open(self._path(key), "r", encoding="utf-8") as f:
+                    yield json.load(f)
+            except (OSError, ValueError):
+                continue
+
+    def summary(self) -> str:
+        return (f"{self.hits} hits, {self.misses} misses, {len(self._entries)} entries "
+                f"({self.total_bytes / 1024 / 1024:.1f} MB)")